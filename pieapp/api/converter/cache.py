@@ -0,0 +1,247 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Union
+from collections import OrderedDict
+
+from pieapp.api.utils.logger import logger
+
+
+# Fields of the ffprobe output that we store in the cache
+PROBE_FORMAT_FIELDS = (
+    "filename", "format_name", "format_long_name",
+    "duration", "bit_rate", "size", "tags",
+)
+PROBE_STREAM_FIELDS = (
+    "index", "codec_name", "codec_long_name", "codec_type",
+    "sample_rate", "channels", "channel_layout", "bits_per_sample",
+    "bits_per_raw_sample", "bit_rate", "duration", "duration_ts",
+    "disposition", "tags",
+)
+
+# Size of the file head and tail that are used to build the content hash
+CONTENT_HASH_BLOCK_SIZE = 64 * 1024
+
+
+def compact_probe_result(probe_result: dict) -> dict:
+    """
+    Keep only the ffprobe output fields we use to build `MediaFile` models
+    """
+    return {
+        "format": {k: v for (k, v) in probe_result.get("format", {}).items() if k in PROBE_FORMAT_FIELDS},
+        "streams": [
+            {k: v for (k, v) in stream.items() if k in PROBE_STREAM_FIELDS}
+            for stream in probe_result.get("streams", [])
+        ]
+    }
+
+
+def get_content_hash(file_path: Path, file_size: int) -> str:
+    """
+    Hash the head and the tail of the file. It's enough to tell apart files
+    with the same name, size and modification time
+    """
+    content_hash = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        content_hash.update(file.read(CONTENT_HASH_BLOCK_SIZE))
+        if file_size > CONTENT_HASH_BLOCK_SIZE * 2:
+            file.seek(-CONTENT_HASH_BLOCK_SIZE, os.SEEK_END)
+            content_hash.update(file.read(CONTENT_HASH_BLOCK_SIZE))
+
+    return content_hash.hexdigest()
+
+
+class ProbeCache:
+    """
+    On-disk LRU cache of the ffprobe results.
+
+    Files are copied into a new temporary directory on every session, so the cache key
+    is a fingerprint of the file: its name, size, modification time and, optionally,
+    a hash of its content. A changed file gets a new fingerprint, so stale entries
+    are never hit and are evicted as the least recently used ones.
+
+    The cache is safe to use from the probe workers' threads
+    """
+
+    version: int = 1
+
+    def __init__(
+        self,
+        cache_file: Path,
+        max_size: int = 4096,
+        use_content_hash: bool = True
+    ) -> None:
+        self._cache_file = cache_file
+        self._max_size = max_size
+        self._use_content_hash = use_content_hash
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._is_loaded: bool = False
+        self._is_modified: bool = False
+
+    def get_key(self, file_path: Path) -> str:
+        file_stat = file_path.stat()
+        fingerprint = [file_path.name, file_stat.st_size, file_stat.st_mtime_ns]
+        if self._use_content_hash:
+            fingerprint.append(get_content_hash(file_path, file_stat.st_size))
+
+        return hashlib.blake2b(json.dumps(fingerprint).encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self) -> None:
+        with self._lock:
+            self._load()
+
+    def get(self, file_path: Path, default: Any = None) -> Union[dict, Any]:
+        """
+        Get ffprobe result of the file
+
+        Args:
+            file_path (pathlib.Path): media file path
+            default (Any): return default value if the file isn't cached or was changed
+        """
+        try:
+            key = self.get_key(file_path)
+        except OSError:
+            return default
+
+        with self._lock:
+            self._load()
+            if key not in self._entries:
+                return default
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, file_path: Path, probe_result: dict) -> None:
+        try:
+            key = self.get_key(file_path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._load()
+            self._entries[key] = probe_result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+            self._is_modified = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self._is_loaded = True
+            self._is_modified = True
+
+    def save(self) -> None:
+        """
+        Write the cache file if it was modified
+        """
+        with self._lock:
+            if not self._is_modified:
+                return
+
+            data = json.dumps({"version": self.version, "entries": self._entries}, ensure_ascii=False)
+            self._is_modified = False
+
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_cache_file = self._cache_file.with_suffix(".tmp")
+            with open(temp_cache_file, "w", encoding="utf-8") as output:
+                output.write(data)
+            os.replace(temp_cache_file, self._cache_file)
+        except OSError as e:
+            logger.debug(f"Can't save probe cache: {e!s}")
+
+    def _load(self) -> None:
+        if self._is_loaded:
+            return
+
+        self._is_loaded = True
+        try:
+            with open(self._cache_file, encoding="utf-8") as output:
+                data = json.load(output)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != self.version:
+            return
+
+        self._entries = OrderedDict(data.get("entries", {}))
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class AlbumCoverCache:
+    """
+    Size-bounded on-disk cache of the album cover thumbnails.
+
+    Thumbnails are named after the media file fingerprint and the attached picture
+    stream index. When the cache folder gets bigger than `max_size` bytes,
+    the least recently used thumbnails are removed
+    """
+
+    file_format: str = "jpg"
+
+    def __init__(self, cache_folder: Path, max_size: int = 64 * 1024 * 1024) -> None:
+        self._cache_folder = cache_folder
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def get_path(self, file_path: Path, stream_index: int) -> Path:
+        file_stat = file_path.stat()
+        fingerprint = [file_path.name, file_stat.st_size, file_stat.st_mtime_ns, stream_index]
+        key = hashlib.blake2b(json.dumps(fingerprint).encode("utf-8"), digest_size=16).hexdigest()
+        return self._cache_folder / f"{key}.{self.file_format}"
+
+    def get(self, file_path: Path, stream_index: int) -> Union[Path, None]:
+        """
+        Get cached thumbnail path
+
+        Args:
+            file_path (pathlib.Path): media file path
+            stream_index (int): attached picture stream index
+        """
+        try:
+            thumbnail_path = self.get_path(file_path, stream_index)
+            # Mark thumbnail as recently used
+            os.utime(thumbnail_path)
+        except OSError:
+            return None
+
+        return thumbnail_path
+
+    def put(self, thumbnail_path: Path) -> None:
+        """
+        Register a thumbnail written to the `get_path` path and evict old ones
+        """
+        with self._lock:
+            try:
+                thumbnails = [(i, i.stat()) for i in self._cache_folder.iterdir() if i.is_file()]
+            except OSError:
+                return
+
+            cache_size = sum(i[1].st_size for i in thumbnails)
+            for thumbnail, thumbnail_stat in sorted(thumbnails, key=lambda i: i[1].st_mtime_ns):
+                if cache_size <= self._max_size:
+                    break
+
+                if thumbnail == thumbnail_path:
+                    continue
+
+                try:
+                    thumbnail.unlink()
+                    cache_size -= thumbnail_stat.st_size
+                except OSError as e:
+                    logger.debug(f"Can't remove album cover thumbnail: {e!s}")
+
+    def clear(self) -> None:
+        with self._lock:
+            if not self._cache_folder.exists():
+                return
+
+            for thumbnail in self._cache_folder.iterdir():
+                thumbnail.unlink(missing_ok=True)
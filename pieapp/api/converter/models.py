@@ -1,4 +1,3 @@
-import uuid
 from typing import Optional, Any
 
 import datetime
@@ -6,15 +5,17 @@ import dataclasses as dt
 from pathlib import Path
 
 
-@dt.dataclass
+@dt.dataclass(frozen=True)
 class AlbumCover:
     image_path: Path = dt.field(default=None)
     image_file_format: str = dt.field(default=None)
     image_small_path: Path = dt.field(default=None)
     image_small_file_format: str = dt.field(default=None)
+    # Index of the attached picture stream in the media file
+    stream_index: Optional[int] = dt.field(default=None)
 
 
-@dt.dataclass
+@dt.dataclass(frozen=True)
 class Codec:
     name: str
     type: str
@@ -37,7 +38,7 @@ class ChannelsLayout:
     Stereo: str = "stereo"
 
 
-@dt.dataclass
+@dt.dataclass(frozen=True)
 class FileInfo:
     filename: str
     file_format: str
@@ -54,7 +55,7 @@ class FileInfo:
         return f"{self.bit_rate} kb/s"
 
 
-@dt.dataclass
+@dt.dataclass(frozen=True)
 class Metadata:
     title: str
     genre: Optional[str] = None
@@ -73,7 +74,7 @@ class Metadata:
     year_of_composition: datetime.date = dt.field(default=datetime.date(1970, 1, 1))
 
 
-@dt.dataclass(eq=True, slots=True)
+@dt.dataclass(eq=True, slots=True, frozen=True)
 class MediaFile:
     # UUID field stays the same for all snapshots
     uuid: str
@@ -89,14 +90,35 @@ class MediaFile:
     is_deleted: bool = dt.field(default=False)
 
 
+# Nested models that are created on update if they're missing: <field name>: <model>
+NESTED_MODELS: dict[str, type] = {
+    "album_cover": AlbumCover,
+}
+
+
+def replace_field(model: Any, field_path: str, value: Any) -> Any:
+    """
+    Get a copy of the model with a new field value.
+    Only the models on the `field_path` are copied, the rest are shared with the original model
+
+    Args:
+        model (Any): frozen dataclass instance
+        field_path (str): dotted field path, for example: `metadata.album_cover.image_path`
+        value (Any): new field value
+    """
+    attrname, _, nested_path = field_path.partition(".")
+    if nested_path:
+        nested_model = getattr(model, attrname)
+        if nested_model is None:
+            nested_model = NESTED_MODELS[attrname]()
+        value = replace_field(nested_model, nested_path, value)
+
+    return dt.replace(model, **{attrname: value})
+
+
 def update_media_file(media_file: MediaFile, field_path: str, value: Any) -> MediaFile:
-    path, _, target = field_path.rpartition(".")
-    prev_object = media_file
-    for attrname in path.split("."):
-        base = getattr(prev_object, attrname)
-        prev_object = base
-        setattr(base, target, value)
-
-    media_file.generation += 1
-    media_file.uuid = str(uuid.uuid4())
-    return media_file
+    """
+    Create a new version of the media file
+    """
+    media_file = replace_field(media_file, field_path, value)
+    return dt.replace(media_file, generation=media_file.generation + 1)
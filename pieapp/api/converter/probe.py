@@ -1,39 +1,746 @@
-from pieapp.api.converter.models import *
+"""
+Header-only probe engine.
+
+Probe builders read stream information and tags straight from the file headers
+and return them in the same (compact) shape as the ffprobe output,
+so `ProbeWorker` builds `MediaFile` models the same way for both of them
+"""
+import io
+import base64
+import binascii
+import struct
+from pathlib import Path
+from typing import BinaryIO, Union
+
+
+# Maximum size of the metadata we read: tags, comments, pictures
+MAX_METADATA_SIZE = 16 * 1024 * 1024
+
+# Number of bytes to scan for the first MPEG audio frame
+MAX_FRAME_SYNC_SCAN_SIZE = 64 * 1024
+
+# Number of bytes to scan for the last Ogg page
+MAX_LAST_PAGE_SCAN_SIZE = 64 * 1024
+
+CHANNEL_LAYOUTS: dict[int, str] = {
+    1: "mono",
+    2: "stereo",
+    3: "3.0",
+    4: "quad",
+    5: "5.0",
+    6: "5.1",
+    7: "6.1",
+    8: "7.1",
+}
+
+# Attached picture MIME type: <ffprobe codec name>
+PICTURE_CODEC_NAMES: dict[str, str] = {
+    "image/jpeg": "mjpeg",
+    "image/jpg": "mjpeg",
+    "image/png": "png",
+    "image/bmp": "bmp",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+# Vorbis comment and RIFF INFO field names: <ffprobe tag name>
+VORBIS_TAG_NAMES: dict[str, str] = {
+    "albumartist": "album_artist",
+    "album artist": "album_artist",
+    "tracknumber": "track",
+    "discnumber": "disc",
+    "organization": "publisher",
+}
+RIFF_INFO_TAG_NAMES: dict[bytes, str] = {
+    b"INAM": "title",
+    b"IART": "artist",
+    b"IPRD": "album",
+    b"IGNR": "genre",
+    b"ICMT": "comment",
+    b"ICRD": "date",
+    b"ITRK": "track",
+    b"IPRT": "track",
+    b"ICOP": "copyright",
+    b"ISFT": "encoder",
+}
+ID3_TAG_NAMES: dict[str, str] = {
+    "TIT2": "title",
+    "TPE1": "artist",
+    "TALB": "album",
+    "TPE2": "album_artist",
+    "TCON": "genre",
+    "TRCK": "track",
+    "TPOS": "disc",
+    "TYER": "date",
+    "TDRC": "date",
+    "TCOM": "composer",
+    "TPUB": "publisher",
+    "TCOP": "copyright",
+    "TLAN": "language",
+    "TSSE": "encoder",
+    # ID3v2.2 frames
+    "TT2": "title",
+    "TP1": "artist",
+    "TAL": "album",
+    "TP2": "album_artist",
+    "TCO": "genre",
+    "TRK": "track",
+    "TPA": "disc",
+    "TYE": "date",
+    "TCM": "composer",
+    "TPB": "publisher",
+}
+
+# WAVE format tag: <(ffprobe codec name prefix, codec long name)>
+WAVE_FORMAT_CODECS: dict[int, tuple[str, str]] = {
+    0x0001: ("pcm_s", "PCM signed little-endian"),
+    0x0003: ("pcm_f", "PCM floating point little-endian"),
+    0x0006: ("pcm_alaw", "PCM A-law / G.711 A-law"),
+    0x0007: ("pcm_mulaw", "PCM mu-law / G.711 mu-law"),
+}
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# MPEG audio version bits: <version>
+MPEG_VERSIONS: dict[int, str] = {0: "2.5", 2: "2", 3: "1"}
+MPEG_LAYERS: dict[int, int] = {1: 3, 2: 2, 3: 1}
+MPEG_SAMPLE_RATES: dict[str, tuple[int, int, int]] = {
+    "1": (44100, 48000, 32000),
+    "2": (22050, 24000, 16000),
+    "2.5": (11025, 12000, 8000),
+}
+# <(MPEG version 1, layer)>: bit rates in kbit/s
+MPEG_BIT_RATES: dict[tuple[bool, int], tuple[int, ...]] = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MPEG_CODECS: dict[int, tuple[str, str]] = {
+    1: ("mp1", "MP1 (MPEG audio layer 1)"),
+    2: ("mp2", "MP2 (MPEG audio layer 2)"),
+    3: ("mp3", "MP3 (MPEG audio layer 3)"),
+}
+
+
+class ProbeError(ValueError):
+    """
+    File can't be probed by the header parser
+    """
+
+
+def read_exactly(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ProbeError("Unexpected end of file")
+
+    return data
+
+
+def read_syncsafe_int(data: bytes) -> int:
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+
+    return value
+
+
+def parse_vorbis_comment(data: bytes, tags: dict[str, str]) -> list[bytes]:
+    """
+    Parse Vorbis comment packet (without the framing bit) into `tags`.
+    Returns base64 encoded `METADATA_BLOCK_PICTURE` values
+    """
+    pictures = []
+    stream = io.BytesIO(data)
+    vendor_length = struct.unpack("<I", read_exactly(stream, 4))[0]
+    stream.seek(vendor_length, io.SEEK_CUR)
+    comments_count = struct.unpack("<I", read_exactly(stream, 4))[0]
+    for _ in range(comments_count):
+        comment_length = struct.unpack("<I", read_exactly(stream, 4))[0]
+        comment = read_exactly(stream, comment_length)
+        key, _, value = comment.partition(b"=")
+        key = key.decode("ascii", "replace").lower()
+        if key == "metadata_block_picture":
+            pictures.append(value)
+            continue
+
+        key = VORBIS_TAG_NAMES.get(key, key)
+        # Keep the first value of the repeated fields
+        tags.setdefault(key, value.decode("utf-8", "replace"))
+
+    return pictures
+
+
+def parse_flac_picture(data: bytes) -> Union[dict, None]:
+    """
+    Parse FLAC `PICTURE` block. Returns picture stream description
+    """
+    stream = io.BytesIO(data)
+    picture_type, mime_type_length = struct.unpack(">II", read_exactly(stream, 8))
+    mime_type = read_exactly(stream, mime_type_length).decode("ascii", "replace").lower()
+    description_length = struct.unpack(">I", read_exactly(stream, 4))[0]
+    stream.seek(description_length, io.SEEK_CUR)
+    width, height = struct.unpack(">II", read_exactly(stream, 8))
+    return get_picture_stream(mime_type, width, height)
+
+
+def get_picture_stream(mime_type: str, width: int = None, height: int = None) -> dict:
+    stream = {
+        "codec_name": PICTURE_CODEC_NAMES.get(mime_type, "mjpeg"),
+        "codec_type": "video",
+        "disposition": {"attached_pic": 1},
+    }
+    if width and height:
+        stream["width"] = width
+        stream["height"] = height
+
+    return stream
 
 
 class ProbeBuilder:
+    """
+    Base header parser.
 
-    def probe_metadata(self) -> Metadata:
-        raise NotImplementedError
+    Subclasses fill `_tags`, `_audio_stream` and `_picture_streams`
+    in `probe_file`. `probe` returns them in the ffprobe output shape
+    """
+    format_name: str = None
+    format_long_name: str = None
 
-    def probe_file_info(self) -> FileInfo:
+    def __init__(self, filepath: Path) -> None:
+        self._filepath = filepath
+        self._file_size = 0
+        self._tags: dict[str, str] = {}
+        self._audio_stream: dict = {}
+        self._picture_streams: list[dict] = []
+
+    def probe_file(self, file: BinaryIO) -> None:
         raise NotImplementedError
 
+    def probe(self) -> dict:
+        """
+        Probe file
+
+        Raises:
+            ProbeError: file is damaged or its format isn't supported by the header parser
+        """
+        self._file_size = self._filepath.stat().st_size
+        with open(self._filepath, "rb") as file:
+            try:
+                self.probe_file(file)
+            except (struct.error, UnicodeDecodeError, IndexError) as e:
+                raise ProbeError(str(e)) from e
+
+        return self.get_probe_result()
+
+    def set_audio_stream(
+        self,
+        codec_name: str,
+        codec_long_name: str,
+        sample_rate: int,
+        channels: int,
+        bits_per_sample: int,
+        samples_count: int = None,
+        duration: float = None,
+        bit_rate: int = None,
+    ) -> None:
+        if not sample_rate or not channels:
+            raise ProbeError("Invalid audio stream parameters")
+
+        if duration is None:
+            duration = samples_count / sample_rate if samples_count is not None else 0.0
+        if samples_count is None:
+            samples_count = round(duration * sample_rate)
+        if bit_rate is None and duration > 0:
+            bit_rate = int(self._file_size * 8 / duration)
+
+        self._audio_stream = {
+            "codec_name": codec_name,
+            "codec_long_name": codec_long_name,
+            "codec_type": "audio",
+            "sample_rate": str(sample_rate),
+            "channels": channels,
+            "channel_layout": CHANNEL_LAYOUTS.get(channels),
+            "bits_per_sample": bits_per_sample,
+            "bits_per_raw_sample": str(bits_per_sample),
+            "bit_rate": str(bit_rate or 0),
+            # Time base is 1 / sample rate
+            "duration_ts": samples_count,
+            "duration": f"{duration:.6f}",
+            "disposition": {"attached_pic": 0},
+        }
+
+    def get_probe_result(self) -> dict:
+        if not self._audio_stream:
+            raise ProbeError("Audio stream not found")
+
+        streams = [self._audio_stream, *self._picture_streams]
+        for index, stream in enumerate(streams):
+            stream["index"] = index
+
+        # Empty audio data has zero duration and no bit rate
+        duration = float(self._audio_stream["duration"])
+        bit_rate = int(self._file_size * 8 / duration) if duration > 0 else 0
+        return {
+            "format": {
+                "filename": self._filepath.as_posix(),
+                "format_name": self.format_name,
+                "format_long_name": self.format_long_name,
+                "duration": self._audio_stream["duration"],
+                "bit_rate": str(bit_rate),
+                "size": str(self._file_size),
+                "tags": self._tags,
+            },
+            "streams": streams,
+        }
+
+    def skip_id3v2(self, file: BinaryIO) -> None:
+        """
+        Skip ID3v2 tag if the file starts with it
+        """
+        header = file.read(10)
+        if len(header) == 10 and header[:3] == b"ID3":
+            footer_size = 10 if header[5] & 0x10 else 0
+            file.seek(10 + read_syncsafe_int(header[6:10]) + footer_size)
+        else:
+            file.seek(0)
+
+
+class WaveProbe(ProbeBuilder):
+    format_name = "wav"
+    format_long_name = "WAV / WAVE (Waveform Audio)"
+
+    def probe_file(self, file: BinaryIO) -> None:
+        riff_id, _, wave_id = struct.unpack("<4sI4s", read_exactly(file, 12))
+        if riff_id != b"RIFF" or wave_id != b"WAVE":
+            # RF64 and other variants are probed by ffprobe
+            raise ProbeError("Not a RIFF/WAVE file")
+
+        fmt_chunk = None
+        data_size = None
+        while True:
+            chunk_header = file.read(8)
+            if len(chunk_header) < 8:
+                break
+
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            # Chunks are word aligned
+            next_chunk = file.tell() + chunk_size + (chunk_size & 1)
+            if chunk_id == b"fmt ":
+                fmt_chunk = read_exactly(file, min(chunk_size, 40))
+            elif chunk_id == b"data":
+                data_size = min(chunk_size, self._file_size - file.tell())
+            elif chunk_id == b"LIST" and chunk_size <= MAX_METADATA_SIZE:
+                self._parse_list_chunk(read_exactly(file, chunk_size))
+
+            file.seek(next_chunk)
+
+        if fmt_chunk is None or data_size is None:
+            raise ProbeError("Missing fmt or data chunk")
+
+        format_tag, channels, sample_rate, byte_rate, block_align, bits_per_sample = (
+            struct.unpack("<HHIIHH", fmt_chunk[:16])
+        )
+        if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt_chunk) >= 26:
+            # The first two bytes of the sub-format GUID is the format tag
+            format_tag = struct.unpack("<H", fmt_chunk[24:26])[0]
+
+        if format_tag not in WAVE_FORMAT_CODECS or not byte_rate:
+            raise ProbeError(f"Unsupported WAVE format {format_tag:#x}")
+
+        codec_name, codec_long_name = WAVE_FORMAT_CODECS[format_tag]
+        if codec_name == "pcm_s":
+            codec_name = "pcm_u8" if bits_per_sample == 8 else f"pcm_s{bits_per_sample}le"
+        elif codec_name == "pcm_f":
+            codec_name = f"pcm_f{bits_per_sample}le"
+
+        self.set_audio_stream(
+            codec_name=codec_name,
+            codec_long_name=codec_long_name,
+            sample_rate=sample_rate,
+            channels=channels,
+            bits_per_sample=bits_per_sample,
+            samples_count=data_size // block_align if block_align else None,
+            duration=data_size / byte_rate,
+            bit_rate=byte_rate * 8,
+        )
+
+    def _parse_list_chunk(self, data: bytes) -> None:
+        if data[:4] != b"INFO":
+            return
+
+        offset = 4
+        while offset + 8 <= len(data):
+            sub_chunk_id, sub_chunk_size = struct.unpack("<4sI", data[offset:offset + 8])
+            value = data[offset + 8:offset + 8 + sub_chunk_size]
+            offset += 8 + sub_chunk_size + (sub_chunk_size & 1)
+            if sub_chunk_id in RIFF_INFO_TAG_NAMES:
+                value = value.split(b"\x00", 1)[0].decode("utf-8", "replace").strip()
+                self._tags.setdefault(RIFF_INFO_TAG_NAMES[sub_chunk_id], value)
+
+
+class FlacProbe(ProbeBuilder):
+    format_name = "flac"
+    format_long_name = "raw FLAC"
+
+    def probe_file(self, file: BinaryIO) -> None:
+        self.skip_id3v2(file)
+        if file.read(4) != b"fLaC":
+            raise ProbeError("Not a FLAC file")
+
+        stream_info = None
+        is_last_block = False
+        while not is_last_block:
+            block_header = read_exactly(file, 4)
+            is_last_block = bool(block_header[0] & 0x80)
+            block_type = block_header[0] & 0x7F
+            block_size = int.from_bytes(block_header[1:4], "big")
+            next_block = file.tell() + block_size
+            if block_type == 0:
+                stream_info = read_exactly(file, 18)
+            elif block_type == 4 and block_size <= MAX_METADATA_SIZE:
+                parse_vorbis_comment(read_exactly(file, block_size), self._tags)
+            elif block_type == 6:
+                # Picture data is at the end of the block, so the header is enough
+                picture_stream = parse_flac_picture(file.read(min(block_size, 4096)))
+                if picture_stream:
+                    self._picture_streams.append(picture_stream)
+            elif block_type == 127:
+                raise ProbeError("Invalid metadata block")
+
+            file.seek(next_block)
+
+        if stream_info is None:
+            raise ProbeError("Missing STREAMINFO block")
+
+        # 20 bits of sample rate, 3 bits of channels - 1, 5 bits of bits per sample - 1, 36 bits of samples count
+        packed = int.from_bytes(stream_info[10:18], "big")
+        sample_rate = packed >> 44
+        channels = ((packed >> 41) & 0x07) + 1
+        bits_per_sample = ((packed >> 36) & 0x1F) + 1
+        samples_count = packed & 0xFFFFFFFFF
+
+        duration = samples_count / sample_rate if sample_rate else 0.0
+        audio_size = self._file_size - file.tell()
+        self.set_audio_stream(
+            codec_name="flac",
+            codec_long_name="FLAC (Free Lossless Audio Codec)",
+            sample_rate=sample_rate,
+            channels=channels,
+            bits_per_sample=bits_per_sample,
+            samples_count=samples_count,
+            bit_rate=int(audio_size * 8 / duration) if duration else 0,
+        )
+
 
 class VorbisProbe(ProbeBuilder):
+    format_name = "ogg"
+    format_long_name = "Ogg"
 
-    def __init__(self, filepath: Path) -> None:
-        self._filepath = filepath
+    def probe_file(self, file: BinaryIO) -> None:
+        serial_number, packets = self._read_header_packets(file, 2)
+        identification, comment = packets
+        if identification[:7] != b"\x01vorbis" or comment[:7] != b"\x03vorbis":
+            # Opus, FLAC and other codecs in the Ogg container are probed by ffprobe
+            raise ProbeError("Not an Ogg Vorbis file")
+
+        _, channels, sample_rate, _, nominal_bit_rate, _ = struct.unpack("<IBIiii", identification[7:28])
+        for picture in parse_vorbis_comment(comment[7:], self._tags):
+            picture_stream = self._get_picture_stream(picture)
+            if picture_stream:
+                self._picture_streams.append(picture_stream)
+
+        samples_count = self._read_last_granule_position(file, serial_number)
+        duration = samples_count / sample_rate if sample_rate else 0.0
+        self.set_audio_stream(
+            codec_name="vorbis",
+            codec_long_name="Vorbis",
+            sample_rate=sample_rate,
+            channels=channels,
+            bits_per_sample=0,
+            samples_count=samples_count,
+            bit_rate=nominal_bit_rate if nominal_bit_rate > 0 else None,
+        )
+
+    @staticmethod
+    def _read_header_packets(file: BinaryIO, packets_count: int) -> tuple[int, list[bytes]]:
+        """
+        Read the first `packets_count` packets of the first logical stream
+        """
+        packets: list[bytes] = []
+        packet = bytearray()
+        serial_number = None
+        while len(packets) < packets_count:
+            page_header = read_exactly(file, 27)
+            if page_header[:4] != b"OggS":
+                raise ProbeError("Invalid Ogg page")
+
+            page_serial_number = struct.unpack("<I", page_header[14:18])[0]
+            segments = read_exactly(file, page_header[26])
+            page_data = read_exactly(file, sum(segments))
+            if serial_number is None:
+                serial_number = page_serial_number
+            elif page_serial_number != serial_number:
+                continue
+
+            offset = 0
+            for segment_size in segments:
+                packet += page_data[offset:offset + segment_size]
+                offset += segment_size
+                if len(packet) > MAX_METADATA_SIZE:
+                    raise ProbeError("Header packet is too big")
+
+                # Packet ends with the segment shorter than 255 bytes
+                if segment_size < 255:
+                    packets.append(bytes(packet))
+                    packet = bytearray()
+                    if len(packets) == packets_count:
+                        break
+
+        return serial_number, packets
+
+    def _read_last_granule_position(self, file: BinaryIO, serial_number: int) -> int:
+        scan_size = min(self._file_size, MAX_LAST_PAGE_SCAN_SIZE)
+        file.seek(self._file_size - scan_size)
+        data = file.read(scan_size)
+        offset = data.rfind(b"OggS")
+        while offset != -1:
+            if len(data) - offset >= 27:
+                granule_position, page_serial_number = struct.unpack("<qI", data[offset + 6:offset + 18])
+                if page_serial_number == serial_number and granule_position >= 0:
+                    return granule_position
+
+            offset = data.rfind(b"OggS", 0, offset)
+
+        raise ProbeError("Last Ogg page not found")
+
+    @staticmethod
+    def _get_picture_stream(picture: bytes) -> Union[dict, None]:
+        # Picture header is enough, so decode only the beginning of the base64 string
+        picture = picture[:8192]
+        try:
+            return parse_flac_picture(base64.b64decode(picture + b"=" * (-len(picture) % 4)))
+        except (binascii.Error, ProbeError, struct.error):
+            return None
+
+
+class MP3Probe(ProbeBuilder):
+    format_name = "mp3"
+    format_long_name = "MP2/3 (MPEG audio layer 2/3)"
+
+    def probe_file(self, file: BinaryIO) -> None:
+        audio_offset = self._parse_id3v2(file)
+        audio_end = self._file_size
+        if self._file_size - audio_offset >= 128:
+            audio_end -= self._parse_id3v1(file)
+
+        file.seek(audio_offset)
+        data = file.read(MAX_FRAME_SYNC_SCAN_SIZE)
+        frame_offset, frame = self._find_first_frame(data)
+        version, layer, bit_rate, sample_rate, channels, frame_size = frame
+        is_mpeg1 = version == "1"
+        samples_per_frame = 384 if layer == 1 else 1152 if (layer == 2 or is_mpeg1) else 576
+
+        frames_count = None
+        audio_size = max(audio_end - audio_offset - frame_offset, 0)
+        xing_header = self._parse_xing_header(data[frame_offset:frame_offset + 200], is_mpeg1, channels)
+        if xing_header is not None:
+            frames_count, bytes_count = xing_header
+            if bytes_count:
+                audio_size = bytes_count
+
+        if frames_count:
+            duration = frames_count * samples_per_frame / sample_rate
+            bit_rate = int(audio_size * 8 / duration) if duration else bit_rate
+        else:
+            # Constant bit rate
+            duration = audio_size * 8 / bit_rate
+
+        codec_name, codec_long_name = MPEG_CODECS[layer]
+        self.set_audio_stream(
+            codec_name=codec_name,
+            codec_long_name=codec_long_name,
+            sample_rate=sample_rate,
+            channels=channels,
+            bits_per_sample=0,
+            duration=duration,
+            bit_rate=bit_rate,
+        )
+
+    def _parse_id3v2(self, file: BinaryIO) -> int:
+        """
+        Parse ID3v2 tag. Returns its size
+        """
+        header = file.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return 0
+
+        major_version, flags = header[3], header[5]
+        tag_size = read_syncsafe_int(header[6:10])
+        footer_size = 10 if flags & 0x10 else 0
+        if major_version not in (2, 3, 4) or tag_size > MAX_METADATA_SIZE:
+            return 10 + tag_size + footer_size
+
+        data = file.read(tag_size)
+        if flags & 0x80 and major_version < 4:
+            # Tag level unsynchronisation
+            data = data.replace(b"\xff\x00", b"\xff")
+
+        offset = 0
+        if flags & 0x40 and major_version > 2:
+            # Skip extended header
+            extended_header_size = struct.unpack(">I", data[:4])[0]
+            offset = read_syncsafe_int(data[:4]) if major_version == 4 else extended_header_size + 4
+
+        frame_header_size = 6 if major_version == 2 else 10
+        while offset + frame_header_size <= len(data):
+            if major_version == 2:
+                frame_id = data[offset:offset + 3]
+                frame_size = int.from_bytes(data[offset + 3:offset + 6], "big")
+            else:
+                frame_id = data[offset:offset + 4]
+                size_bytes = data[offset + 4:offset + 8]
+                frame_size = read_syncsafe_int(size_bytes) if major_version == 4 else int.from_bytes(size_bytes, "big")
+
+            # Padding
+            if not frame_id.strip(b"\x00") or frame_size <= 0:
+                break
+
+            frame_data = data[offset + frame_header_size:offset + frame_header_size + frame_size]
+            offset += frame_header_size + frame_size
+            frame_id = frame_id.decode("latin-1")
+            if frame_id in ID3_TAG_NAMES:
+                self._tags.setdefault(ID3_TAG_NAMES[frame_id], self._decode_text_frame(frame_data))
+            elif frame_id in ("APIC", "PIC"):
+                self._picture_streams.append(self._parse_picture_frame(frame_id, frame_data))
+
+        return 10 + tag_size + footer_size
+
+    def _parse_id3v1(self, file: BinaryIO) -> int:
+        """
+        Parse ID3v1 tag at the end of the file. Returns its size
+        """
+        file.seek(self._file_size - 128)
+        data = file.read(128)
+        if data[:3] != b"TAG":
+            return 0
+
+        fields = (("title", 3, 33), ("artist", 33, 63), ("album", 63, 93), ("date", 93, 97))
+        for (name, start, end) in fields:
+            value = data[start:end].split(b"\x00", 1)[0].decode("latin-1").strip()
+            if value:
+                self._tags.setdefault(name, value)
+
+        if data[125] == 0 and data[126]:
+            self._tags.setdefault("track", str(data[126]))
+
+        return 128
+
+    @staticmethod
+    def _decode_text_frame(data: bytes) -> str:
+        if not data:
+            return ""
+
+        encoding = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}.get(data[0], "latin-1")
+        value = data[1:].decode(encoding, "replace")
+        # ID3v2.4 multiple values are separated by null character
+        return value.strip("\x00").split("\x00", 1)[0].strip()
+
+    @staticmethod
+    def _parse_picture_frame(frame_id: str, data: bytes) -> dict:
+        if frame_id == "PIC":
+            image_format = data[1:4].decode("latin-1").lower()
+            mime_type = "image/png" if image_format == "png" else "image/jpeg"
+        else:
+            mime_type = data[1:].split(b"\x00", 1)[0].decode("latin-1").lower()
+            if "/" not in mime_type:
+                mime_type = f"image/{mime_type}"
+
+        return get_picture_stream(mime_type)
+
+    def _find_first_frame(self, data: bytes) -> tuple[int, tuple]:
+        """
+        Find the first valid frame. Its next frame must be valid too to avoid false sync
+        """
+        offset = data.find(b"\xff")
+        while offset != -1 and offset + 4 <= len(data):
+            frame = self._parse_frame_header(data[offset:offset + 4])
+            if frame is not None:
+                next_offset = offset + frame[-1]
+                if next_offset + 4 > len(data) or self._parse_frame_header(data[next_offset:next_offset + 4]):
+                    return offset, frame
+
+            offset = data.find(b"\xff", offset + 1)
+
+        raise ProbeError("MPEG audio frame not found")
+
+    @staticmethod
+    def _parse_frame_header(header: bytes) -> Union[tuple, None]:
+        if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+            return None
+
+        version = MPEG_VERSIONS.get((header[1] >> 3) & 0x03)
+        layer = MPEG_LAYERS.get((header[1] >> 1) & 0x03)
+        bit_rate_index = header[2] >> 4
+        sample_rate_index = (header[2] >> 2) & 0x03
+        if version is None or layer is None or bit_rate_index in (0, 15) or sample_rate_index == 3:
+            return None
+
+        is_mpeg1 = version == "1"
+        bit_rate = MPEG_BIT_RATES[(is_mpeg1, layer)][bit_rate_index] * 1000
+        sample_rate = MPEG_SAMPLE_RATES[version][sample_rate_index]
+        padding = (header[2] >> 1) & 0x01
+        channels = 1 if (header[3] >> 6) == 3 else 2
+        if layer == 1:
+            frame_size = (12 * bit_rate // sample_rate + padding) * 4
+        else:
+            frame_size = (144 if (layer == 2 or is_mpeg1) else 72) * bit_rate // sample_rate + padding
+
+        return version, layer, bit_rate, sample_rate, channels, frame_size
+
+    @staticmethod
+    def _parse_xing_header(frame: bytes, is_mpeg1: bool, channels: int) -> Union[tuple, None]:
+        """
+        Get frames and bytes count from Xing/Info or VBRI header
+        """
+        side_info_size = (32 if channels == 2 else 17) if is_mpeg1 else (17 if channels == 2 else 9)
+        xing_offset = 4 + side_info_size
+        if frame[xing_offset:xing_offset + 4] in (b"Xing", b"Info"):
+            flags = struct.unpack(">I", frame[xing_offset + 4:xing_offset + 8])[0]
+            offset = xing_offset + 8
+            frames_count = bytes_count = None
+            if flags & 0x01:
+                frames_count = struct.unpack(">I", frame[offset:offset + 4])[0]
+                offset += 4
+            if flags & 0x02:
+                bytes_count = struct.unpack(">I", frame[offset:offset + 4])[0]
+
+            return frames_count, bytes_count
 
-    def probe_metadata(self) -> Metadata:
-        pass
+        if frame[36:40] == b"VBRI":
+            bytes_count, frames_count = struct.unpack(">II", frame[46:54])
+            return frames_count, bytes_count
 
-    def probe_file_info(self) -> FileInfo:
-        pass
+        return None
 
 
 _PROBE_FILE_FORMAT_MAP = {
-    "mp3": ProbeBuilder,
-    "mp4": ProbeBuilder,
-    "wav": ProbeBuilder,
+    "wav": WaveProbe,
+    "wave": WaveProbe,
+    "flac": FlacProbe,
+    "mp3": MP3Probe,
+    "ogg": VorbisProbe,
+    "oga": VorbisProbe,
 }
 
 
-def get_probe_builder(filepath: Path) -> ProbeBuilder:
-    file_format = filepath.suffix
-    if file_format not in _PROBE_FILE_FORMAT_MAP:
-        raise KeyError("Unsupported file format")
+def get_probe_builder(filepath: Path) -> Union[ProbeBuilder, None]:
+    """
+    Get header parser of the file. Returns None if the file format isn't supported
+    """
+    probe_builder = _PROBE_FILE_FORMAT_MAP.get(filepath.suffix.replace(".", "").lower())
+    if probe_builder is None:
+        return None
 
-    probe = _PROBE_FILE_FORMAT_MAP.get(file_format)()
-    probe = probe(filepath)
-    return probe
+    return probe_builder(filepath)
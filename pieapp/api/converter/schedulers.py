@@ -0,0 +1,224 @@
+from __feature__ import snake_case
+
+import os
+import math
+from pathlib import Path
+from collections import deque
+
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QRunnable
+from PySide6.QtCore import QThreadPool
+
+from pieapp.api.converter.models import MediaFile
+from pieapp.api.converter.cache import ProbeCache
+from pieapp.api.converter.workers import ProbeWorker
+from pieapp.api.converter.workers import ConverterWorker
+from pieapp.api.converter.workers import ConverterSignals
+from pieapp.api.converter.workers import ConverterProcessSignals
+
+
+def split_into_chunks(media_files: list[MediaFile], chunk_size: int, workers_count: int) -> list[list[MediaFile]]:
+    """
+    Split media files into chunks of `chunk_size` elements at most.
+
+    Small batches are split into smaller chunks, so every worker gets its share
+    """
+    if not media_files:
+        return []
+
+    chunk_size = max(1, min(chunk_size, math.ceil(len(media_files) / max(1, workers_count))))
+    return [media_files[i:i + chunk_size] for i in range(0, len(media_files), chunk_size)]
+
+
+class WorkerScheduler(QObject):
+    """
+    Base scheduler that runs workers on its own thread pool.
+
+    The batch is split into chunks of `chunk_size` media files. Only `max_thread_count` chunks
+    are submitted to the pool at once, the next chunk is submitted when one of them is completed
+    """
+
+    def __init__(
+        self,
+        max_thread_count: int = None,
+        chunk_size: int = 10,
+        parent: QObject = None
+    ) -> None:
+        super().__init__(parent)
+
+        # Maximum count of media files per worker
+        self._chunk_size = chunk_size
+        # Chunks that are waiting to be submitted
+        self._pending_chunks: deque[list[MediaFile]] = deque()
+        # Workers that are submitted to the pool
+        self._workers: list[QRunnable] = []
+
+        self._pool = QThreadPool(self)
+        self._pool.set_max_thread_count(max_thread_count or os.cpu_count() or 1)
+
+    def create_worker(self, media_files: list[MediaFile]) -> QRunnable:
+        """
+        Create a worker for the chunk and connect its signals
+        """
+        raise NotImplementedError
+
+    def on_started(self) -> None:
+        """
+        Called when the batch is started
+        """
+
+    def on_worker_completed(self, *args) -> None:
+        """
+        Called with the arguments of the worker's `completed` signal
+        """
+
+    def on_completed(self) -> None:
+        """
+        Called when all chunks of the batch are completed
+        """
+
+    def is_running(self) -> bool:
+        return len(self._workers) > 0 or len(self._pending_chunks) > 0
+
+    def start(self, media_files: list[MediaFile]) -> None:
+        """
+        Submit a batch of media files.
+        A batch submitted while another one is running is merged into it
+        """
+        chunks = split_into_chunks(media_files, self._chunk_size, self._pool.max_thread_count())
+        if not chunks:
+            return
+
+        is_running = self.is_running()
+        self._pending_chunks.extend(chunks)
+        if not is_running:
+            self.on_started()
+
+        self._submit_pending_chunks()
+
+    def stop(self) -> None:
+        """
+        Drop pending chunks and wait for the running ones
+        """
+        self._pending_chunks.clear()
+        self._pool.wait_for_done()
+        self._workers = []
+
+    def _submit_pending_chunks(self) -> None:
+        while self._pending_chunks and len(self._workers) < self._pool.max_thread_count():
+            worker = self.create_worker(self._pending_chunks.popleft())
+            worker.signals.completed.connect(lambda *args, w=worker: self._on_worker_completed(w, *args))
+            self._workers.append(worker)
+            self._pool.start(worker)
+
+    def _on_worker_completed(self, worker: QRunnable, *args) -> None:
+        if worker not in self._workers:
+            return
+
+        self._workers.remove(worker)
+        self.on_worker_completed(*args)
+        self._submit_pending_chunks()
+        if not self.is_running():
+            self.on_completed()
+
+
+class ConverterScheduler(WorkerScheduler):
+    """
+    Runs `ConverterWorker` instances.
+    At most `max_processes` ffmpeg processes are running at once
+    """
+
+    def __init__(
+        self,
+        ffmpeg_command: Path,
+        max_processes: int = None,
+        chunk_size: int = 10,
+        parent: QObject = None
+    ) -> None:
+        super().__init__(max_processes, chunk_size, parent)
+
+        # Binary path
+        self._ffmpeg_command = ffmpeg_command
+        # Batch signals. Workers' element signals are forwarded here
+        self._signals = ConverterProcessSignals()
+
+    @property
+    def signals(self) -> ConverterProcessSignals:
+        return self._signals
+
+    def create_worker(self, media_files: list[MediaFile]) -> ConverterWorker:
+        converter_worker = ConverterWorker(media_files, self._ffmpeg_command)
+        converter_worker.signals.started_element.connect(self._signals.started_element)
+        converter_worker.signals.completed_element.connect(self._signals.completed_element)
+        converter_worker.signals.failed_element.connect(self._signals.failed_element)
+        converter_worker.signals.failed.connect(self._signals.failed)
+        return converter_worker
+
+    def on_started(self) -> None:
+        self._signals.started.emit()
+
+    def on_completed(self) -> None:
+        self._signals.completed.emit()
+
+
+class ProbeScheduler(WorkerScheduler):
+    """
+    Runs `ProbeWorker` instances.
+
+    Every probed media file is emitted via `completed_element` as soon as it's ready,
+    `completed` is emitted with all probed media files when the whole batch is done
+    """
+
+    def __init__(
+        self,
+        temp_folder: Path,
+        ffmpeg_command: Path,
+        ffprobe_command: Path,
+        probe_cache: ProbeCache = None,
+        max_processes: int = None,
+        chunk_size: int = 10,
+        parent: QObject = None
+    ) -> None:
+        super().__init__(max_processes, chunk_size, parent)
+
+        self._temp_folder = temp_folder
+        self._ffmpeg_command = ffmpeg_command
+        self._ffprobe_command = ffprobe_command
+        self._probe_cache = probe_cache
+        # Batch signals. Workers' element signals are forwarded here
+        self._signals = ConverterSignals()
+        # Probed media files of the current batch
+        self._probe_results: list[MediaFile] = []
+
+    @property
+    def signals(self) -> ConverterSignals:
+        return self._signals
+
+    def set_temp_folder(self, temp_folder: Path) -> None:
+        self._temp_folder = temp_folder
+
+    def create_worker(self, media_files: list[MediaFile]) -> ProbeWorker:
+        probe_worker = ProbeWorker(
+            media_files=media_files,
+            temp_folder=self._temp_folder,
+            ffmpeg_command=self._ffmpeg_command,
+            ffprobe_command=self._ffprobe_command,
+            probe_cache=self._probe_cache,
+        )
+        probe_worker.signals.completed_element.connect(self._signals.completed_element)
+        probe_worker.signals.failed.connect(self._signals.failed)
+        return probe_worker
+
+    def on_started(self) -> None:
+        self._probe_results = []
+        self._signals.started.emit()
+
+    def on_worker_completed(self, probe_results: list[MediaFile]) -> None:
+        self._probe_results.extend(probe_results)
+
+    def on_completed(self) -> None:
+        if self._probe_cache is not None:
+            self._probe_cache.save()
+
+        probe_results, self._probe_results = self._probe_results, []
+        self._signals.completed.emit(probe_results)
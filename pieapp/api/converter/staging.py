@@ -0,0 +1,121 @@
+"""
+Session staging.
+
+Selected files are staged into the session temp directory before probing.
+Depending on `workflow.staging_mode` they're copied, hard linked or referenced in place
+"""
+import os
+import dataclasses as dt
+from pathlib import Path
+from typing import Callable, Union
+
+from pieapp.api.globals import Global
+from pieapp.api.utils.logger import logger
+from pieapp.api.utils.files import copy_file, read_json, write_json
+
+
+@dt.dataclass(frozen=True, slots=True, eq=False)
+class StagingMode:
+    # Copy files. Reflinks are used on Linux filesystems that support them (btrfs, xfs)
+    Copy = "copy"
+    # Hard link files on the same filesystem, copy otherwise
+    HardLink = "hardlink"
+    # Don't stage files, use originals read-only
+    Reference = "reference"
+
+
+def stage_file(
+    source: Path,
+    temp_directory: Path,
+    staging_mode: str = StagingMode.Copy,
+    progress: Callable[[int], None] = None
+) -> Path:
+    """
+    Stage file into the session temp directory
+
+    Args:
+        source (pathlib.Path): selected file path
+        temp_directory (pathlib.Path): session temp directory
+        staging_mode (str): `StagingMode` value
+        progress (Callable[[int], None]): called with the count of staged bytes
+
+    Returns:
+        Staged file path
+    """
+    if staging_mode == StagingMode.Reference or source.parent == temp_directory:
+        if progress:
+            progress(source.stat().st_size)
+        return source
+
+    if staging_mode == StagingMode.HardLink:
+        destination = temp_directory / source.name
+        try:
+            if destination.exists() and os.path.samefile(source, destination):
+                return destination
+
+            os.link(source, destination)
+            if progress:
+                progress(source.stat().st_size)
+            return destination
+
+        except OSError as e:
+            # Different filesystem or hard links aren't supported
+            logger.debug(f"Can't hard link {source.name}: {e!s}")
+
+    return copy_file(source, temp_directory, progress)
+
+
+def is_staged_copy(file_path: Path, temp_directory: Path) -> bool:
+    """
+    Check if file is staged into the session temp directory, so it can be deleted with the session
+    """
+    return file_path.parent == temp_directory
+
+
+# Session manifest methods
+
+
+def read_session_manifest(temp_directory: Path) -> list[Path]:
+    """
+    Get staged files of the session. Files that don't exist anymore are skipped
+    """
+    manifest = read_json(temp_directory / Global.SESSION_MANIFEST_FILE_NAME, {}, raise_exception=False)
+    return [Path(i) for i in manifest.get("files", []) if Path(i).exists()]
+
+
+def update_session_manifest(
+    temp_directory: Path,
+    staging_mode: str,
+    added_files: list[Path] = None,
+    removed_files: list[Path] = None
+) -> None:
+    """
+    Add and remove staged files of the session
+    """
+    manifest_file = temp_directory / Global.SESSION_MANIFEST_FILE_NAME
+    manifest = read_json(manifest_file, {}, raise_exception=False)
+    files: list[str] = manifest.get("files", [])
+    removed_files = {Path(i).as_posix() for i in removed_files or []}
+    files = [i for i in files if i not in removed_files]
+    for file in added_files or []:
+        if file.as_posix() not in files:
+            files.append(file.as_posix())
+
+    try:
+        write_json(manifest_file, {"staging_mode": staging_mode, "files": files})
+    except OSError as e:
+        logger.debug(f"Can't write session manifest: {e!s}")
+
+
+def get_session_files(temp_directory: Union[str, os.PathLike]) -> list[Path]:
+    """
+    Get files to restore the session from its manifest or from the temp directory contents
+    """
+    temp_directory = Path(temp_directory)
+    if (temp_directory / Global.SESSION_MANIFEST_FILE_NAME).exists():
+        return read_session_manifest(temp_directory)
+
+    return [
+        i for i in temp_directory.iterdir()
+        if i.suffix.replace(".", "") in Global.AUDIO_EXTENSIONS_SUFFIXES
+    ]
@@ -1,14 +1,68 @@
+from typing import Union
+
 import ffmpeg
 from pathlib import Path
 
+from pieapp.api.utils.logger import logger
+
+
+# Attached picture codec name: <file format>
+ALBUM_COVER_FILE_FORMATS: dict[str, str] = {
+    "mjpeg": "jpg",
+    "png": "png",
+    "bmp": "bmp",
+    "gif": "gif",
+    "webp": "webp",
+}
+
+# Album cover thumbnail size. Same as the `ImagePreview` tooltip size
+ALBUM_COVER_THUMBNAIL_SIZE = 264
+
+
+def get_album_cover_stream(streams: list[dict]) -> Union[dict, None]:
+    """
+    Get the attached picture stream from the ffprobe streams list
+    """
+    for stream in streams:
+        if stream.get("codec_type") == "video" and stream.get("disposition", {}).get("attached_pic"):
+            return stream
+
+    return None
+
+
+def get_album_cover_thumbnail(
+    cmd: Path,
+    filepath: Path,
+    stream_index: int,
+    output_path: Path,
+    size: int = ALBUM_COVER_THUMBNAIL_SIZE
+) -> Union[Path, None]:
+    """
+    Extract the attached picture stream and scale it down to fit the `size` square.
+    Blocks until ffmpeg is finished, so the caller decides how many processes are running at once
 
-def get_cover_album(cmd: Path, filepath: Path, temp_folder: Path) -> Path:
-    cover_image_path = temp_folder / f"{filepath.stem!s}.jpg"
-    (
-        ffmpeg
-        .input(filepath.as_posix())
-        .output(cover_image_path.as_posix(), acodec="copy")
-        .run_async(cmd=cmd.as_posix(), overwrite_output=True, pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
-    )
+    Args:
+        cmd (pathlib.Path): ffmpeg binary path
+        filepath (pathlib.Path): media file path
+        stream_index (int): attached picture stream index
+        output_path (pathlib.Path): thumbnail image path
+        size (int): thumbnail size
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        (
+            ffmpeg
+            .input(filepath.as_posix())
+            .output(
+                output_path.as_posix(),
+                map=f"0:{stream_index}",
+                vf=f"scale={size}:{size}:force_original_aspect_ratio=decrease",
+                vframes=1,
+            )
+            .run(cmd=cmd.as_posix(), overwrite_output=True, quiet=True)
+        )
+    except ffmpeg.Error as e:
+        logger.debug(e.stderr)
+        return None
 
-    return cover_image_path
+    return output_path
@@ -1,10 +1,11 @@
 import os
-import uuid
-import shutil
 import tarfile
 import zipfile
+import threading
+import dataclasses as dt
 from pathlib import Path
 from urllib import request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ffmpeg
 from dotty_dict import Dotty
@@ -17,16 +18,25 @@ from PySide6.QtCore import QRunnable
 from pieapp.api.globals import Global
 from pieapp.api.utils.logger import logger
 from pieapp.api.exceptions import NotificationError
+from pieapp.api.converter.staging import StagingMode
+from pieapp.api.converter.staging import stage_file
 
 from pieapp.api.converter.models import Codec
 from pieapp.api.converter.models import FileInfo
 from pieapp.api.converter.models import AlbumCover
 from pieapp.api.converter.models import Metadata
 from pieapp.api.converter.models import MediaFile
+from pieapp.api.converter.cache import ProbeCache
+from pieapp.api.converter.cache import AlbumCoverCache
+from pieapp.api.converter.cache import compact_probe_result
 from pieapp.api.converter.builders import get_query_builder
+from pieapp.api.converter.probe import ProbeError
+from pieapp.api.converter.probe import get_probe_builder
 
 from pieapp.api.registries.locales.helpers import translate
-from pieapp.api.converter.utils import get_cover_album
+from pieapp.api.converter.utils import get_album_cover_stream
+from pieapp.api.converter.utils import get_album_cover_thumbnail
+from pieapp.api.converter.utils import ALBUM_COVER_FILE_FORMATS
 
 
 ARCHIVE_URL_NAME: dict[str, str] = {
@@ -39,26 +49,40 @@ ARCHIVE_TYPE_NAME: dict[str, str] = {
     "linux": "tar.xz"
 }
 
+# Minimal count of copied bytes between progress updates
+COPY_PROGRESS_STEP = 16 * 1024 * 1024
+
 
 class CopyFilesSignals(QObject):
     started = Signal()
+    # Copied bytes, total bytes
+    progress = Signal(int, int)
+    failed_element = Signal(str, Exception)
     completed = Signal()
     failed = Signal(Exception)
 
 
 class ConverterSignals(QObject):
     started = Signal()
+    completed_element = Signal(MediaFile)
     completed = Signal(list)
     failed = Signal(Exception)
 
 
 class ConverterProcessSignals(QObject):
     started = Signal()
+    started_element = Signal(str)
     completed_element = Signal(str)
+    failed_element = Signal(str, Exception)
     completed = Signal()
     failed = Signal(Exception)
 
 
+class AlbumCoverSignals(QObject):
+    completed = Signal(str, str)
+    failed = Signal(str, Exception)
+
+
 class DownloadWorkerSignals(QObject):
     download_done = Signal(str)
     unpack_ready = Signal(str)
@@ -132,38 +156,77 @@ class DownloadWorker(QObject):
 
 
 class CopyFilesWorker(QRunnable):
+    """
+    Stage selected files into the destination folder in parallel.
+
+    `selected_files` list is updated in place: staged files are replaced with their new paths,
+    failed ones are removed and reported via `failed_element`
+    """
 
-    def __init__(self, selected_files: list[Path], destination: Path) -> None:
+    def __init__(
+        self,
+        selected_files: list[Path],
+        destination: Path,
+        max_workers: int = 4,
+        staging_mode: str = StagingMode.Copy
+    ) -> None:
         super(CopyFilesWorker, self).__init__()
 
         self._signals = CopyFilesSignals()
         self._selected_files = selected_files
         self._destination = destination
+        self._max_workers = max_workers
+        self._staging_mode = staging_mode
+
+        self._lock = threading.Lock()
+        self._copied_bytes = 0
+        self._reported_bytes = 0
+        self._total_bytes = 0
 
     @property
     def signals(self) -> CopyFilesSignals:
         return self._signals
 
-    def _wait_files_to_copy(self) -> None:
-        files_ready = False
-        while not files_ready:
-            if all([i.exists() for i in self._selected_files]):
-                files_ready = True
+    def _update_progress(self, copied_bytes: int) -> None:
+        with self._lock:
+            self._copied_bytes += copied_bytes
+            # Don't flood the event loop with the small updates
+            if self._copied_bytes - self._reported_bytes < COPY_PROGRESS_STEP and self._copied_bytes < self._total_bytes:
+                return
+
+            self._reported_bytes = self._copied_bytes
 
-        # QTimer.single_shot(500, lambda: self._wait_files_to_copy(self._files))
-        self._signals.completed.emit()
+        self._signals.progress.emit(self._copied_bytes, self._total_bytes)
 
     @Slot()
     def run(self) -> None:
         self._signals.started.emit()
-        for index, file in enumerate(self._selected_files):
-            try:
-                shutil.copy2(str(file), str(self._destination))
-                self._selected_files[index] = self._destination / file.name
-            except Exception as e:
-                self._signals.failed.emit(e)
+        try:
+            self._total_bytes = sum(i.stat().st_size for i in self._selected_files if i.exists())
+            copied_files: dict[Path, Path] = {}
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        stage_file, file, self._destination, self._staging_mode, self._update_progress
+                    ): file
+                    for file in self._selected_files
+                }
+                for future in as_completed(futures):
+                    file = futures[future]
+                    try:
+                        copied_files[file] = future.result()
+                    except Exception as e:
+                        logger.debug(e)
+                        self._signals.failed_element.emit(file.name, e)
+
+            self._selected_files[:] = [copied_files[i] for i in self._selected_files if i in copied_files]
+
+        except Exception as e:
+            logger.debug(e)
+            self._signals.failed.emit(e)
 
-        self._wait_files_to_copy()
+        finally:
+            self._signals.completed.emit()
 
 
 class ProbeWorker(QRunnable):
@@ -174,6 +237,7 @@ class ProbeWorker(QRunnable):
         temp_folder: Path,
         ffmpeg_command: Path,
         ffprobe_command: Path,
+        probe_cache: ProbeCache = None,
     ) -> None:
         super(ProbeWorker, self).__init__()
 
@@ -181,12 +245,48 @@ class ProbeWorker(QRunnable):
         self._temp_folder = temp_folder
         self._ffmpeg_command = ffmpeg_command
         self._ffprobe_command = ffprobe_command
+        self._probe_cache = probe_cache
         self._signals = ConverterSignals()
 
     @property
     def signals(self) -> ConverterSignals:
         return self._signals
 
+    def _probe(self, media_file: MediaFile) -> dict:
+        """
+        Parse file headers, get ffprobe result from the cache or run ffprobe
+        """
+        probe_builder = get_probe_builder(media_file.path)
+        if probe_builder is not None:
+            try:
+                return probe_builder.probe()
+            except (ProbeError, OSError) as e:
+                logger.debug(f"Can't parse {media_file.path.name} headers, fallback to ffprobe: {e!s}")
+
+        if self._probe_cache is not None:
+            probe_result = self._probe_cache.get(media_file.path)
+            if probe_result is not None:
+                return probe_result
+
+        probe_result = compact_probe_result(ffmpeg.probe(media_file.path.as_posix(), self._ffprobe_command.as_posix()))
+        if self._probe_cache is not None:
+            self._probe_cache.put(media_file.path, probe_result)
+
+        return probe_result
+
+    def _get_album_cover(self, streams: list[dict]) -> AlbumCover:
+        """
+        Remember the attached picture stream. The image itself is extracted on demand
+        """
+        cover_stream = get_album_cover_stream(streams)
+        if cover_stream is None:
+            return AlbumCover()
+
+        return AlbumCover(
+            image_file_format=ALBUM_COVER_FILE_FORMATS.get(cover_stream.get("codec_name"), "jpg"),
+            stream_index=cover_stream["index"],
+        )
+
     @Slot()
     def run(self) -> None:
         """
@@ -196,16 +296,12 @@ class ProbeWorker(QRunnable):
         probe_results: list[MediaFile] = []
         for media_file in self._media_files:
             try:
-                probe_result = Dotty(ffmpeg.probe(media_file.path.as_posix(), self._ffprobe_command.as_posix()))
-                album_cover_path = get_cover_album(self._ffmpeg_command, media_file.path, self._temp_folder)
-                album_cover = AlbumCover(
-                    image_path=album_cover_path,
-                    image_file_format=album_cover_path.stem,
-                )
-
-                if probe_result:
-                    probe_result["stream"] = probe_result["streams"][0]
-                    probe_result.pop("streams")
+                probe_result = self._probe(media_file)
+                if probe_result and probe_result["streams"]:
+                    streams = probe_result["streams"]
+                    album_cover = self._get_album_cover(streams)
+                    audio_stream = next((i for i in streams if i.get("codec_type") == "audio"), streams[0])
+                    probe_result = Dotty({"format": probe_result["format"], "stream": audio_stream})
                     metadata = Metadata(
                         title=probe_result.get("format.tags.title"),
                         genre=probe_result.get("format.tags.genre"),
@@ -218,23 +314,22 @@ class ProbeWorker(QRunnable):
                     codec = Codec(
                         name=probe_result.get("stream.codec_name"),
                         type=probe_result.get("stream.codec_type"),
-                        long_name=probe_result.get("format.codec_long_name")
+                        long_name=probe_result.get("stream.codec_long_name")
                     )
                     info = FileInfo(
-                        filename=os.path.basename(probe_result.get("format.filename")),
+                        filename=media_file.path.name,
                         file_format=media_file.path.suffix.replace(".", ""),
                         bit_rate=int(probe_result.get("stream.bit_rate", 0)),
-                        bit_depth=probe_result.get("stream.bit_per_sample"),
+                        bit_depth=probe_result.get("stream.bits_per_sample"),
                         sample_rate=int(probe_result.get("stream.sample_rate")),
                         duration=probe_result.get("stream.duration_ts"),
                         channels=probe_result.get("stream.channels"),
                         channels_layout=probe_result.get("stream.channel_layout"),
                         codec=codec,
                     )
-                    media_file.uuid = str(uuid.uuid4())
-                    media_file.info = info
-                    media_file.metadata = metadata
+                    media_file = dt.replace(media_file, info=info, metadata=metadata)
                     probe_results.append(media_file)
+                    self._signals.completed_element.emit(media_file)
 
             except ffmpeg.Error as e:
                 logger.debug(e.stderr)
@@ -264,18 +359,80 @@ class ConverterWorker(QRunnable):
 
     @Slot()
     def run(self) -> None:
+        """
+        Convert media files one by one.
+        A failed file is reported via `failed_element` and doesn't stop the rest of the chunk
+        """
         self._signals.started.emit()
-        for media_file in self._media_files:
+        try:
+            for media_file in self._media_files:
+                self._convert(media_file)
+
+        except Exception as e:
+            logger.debug(e)
+            self._signals.failed.emit(e)
+
+        finally:
+            # Always notify about the finished chunk, otherwise the scheduler will wait forever
+            self._signals.completed.emit()
+
+    def _convert(self, media_file: MediaFile) -> None:
+        query_builder = get_query_builder(media_file)
+        if not query_builder:
+            return
+
+        self._signals.started_element.emit(media_file.name)
+        try:
             audio_stream = ffmpeg.input(media_file.path.as_posix()).audio
-            query_builder = get_query_builder(media_file)
-            if not query_builder:
-                continue
-            try:
-                converter_query = query_builder.build()
-                # output_file = (media_file.output_path.parent / f"{media_file.path.stem}.mp3").as_posix()
-                audio_stream = audio_stream.output(media_file.output_path.as_posix(), **converter_query)
-                ffmpeg.run(audio_stream, cmd=self._ffmpeg_command.as_posix(), overwrite_output=True)
-            except Exception as e:
-                raise NotificationError(
-                    title=translate("Converter error"),
-                    description=f"{translate('An error has been occurred while processing file')} - {media_file.name}")
+            converter_query = query_builder.build()
+            audio_stream = audio_stream.output(media_file.output_path.as_posix(), **converter_query)
+            ffmpeg.run(audio_stream, cmd=self._ffmpeg_command.as_posix(), overwrite_output=True, quiet=True)
+            self._signals.completed_element.emit(media_file.name)
+
+        except Exception as e:
+            logger.debug(e.stderr if isinstance(e, ffmpeg.Error) else e)
+            self._signals.failed_element.emit(media_file.name, NotificationError(
+                title=translate("Converter error"),
+                description=f"{translate('An error has been occurred while processing file')} - {media_file.name}"
+            ))
+
+
+class AlbumCoverWorker(QRunnable):
+    """
+    Extract the album cover thumbnail of a single media file on demand
+    """
+
+    def __init__(self, media_file: MediaFile, ffmpeg_command: Path, album_cover_cache: AlbumCoverCache) -> None:
+        super(AlbumCoverWorker, self).__init__()
+        self._media_file_name = media_file.name
+        self._media_file_path = media_file.path
+        self._stream_index = media_file.metadata.album_cover.stream_index
+        self._ffmpeg_command = ffmpeg_command
+        self._album_cover_cache = album_cover_cache
+        self._signals = AlbumCoverSignals()
+
+    @property
+    def signals(self) -> AlbumCoverSignals:
+        return self._signals
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            thumbnail_path = self._album_cover_cache.get(self._media_file_path, self._stream_index)
+            if thumbnail_path is None:
+                thumbnail_path = get_album_cover_thumbnail(
+                    self._ffmpeg_command,
+                    self._media_file_path,
+                    self._stream_index,
+                    self._album_cover_cache.get_path(self._media_file_path, self._stream_index)
+                )
+                if thumbnail_path is None:
+                    raise FileNotFoundError(f"Can't extract album cover of {self._media_file_name}")
+
+                self._album_cover_cache.put(thumbnail_path)
+
+            self._signals.completed.emit(self._media_file_name, thumbnail_path.as_posix())
+
+        except Exception as e:
+            logger.debug(e)
+            self._signals.failed.emit(self._media_file_name, e)
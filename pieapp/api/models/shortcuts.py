@@ -6,5 +6,12 @@ from PySide6.QtGui import QShortcut
 class ShortcutDict(TypedDict):
     shortcut: QShortcut
     target: str
+    shortcut_key: str
     title: Union[str, None]
     description: Union[str, None]
+    hidden: bool
+    # Plugin and its method that the shortcut triggers. Recorded in the plugin manifest
+    plugin: Union[str, None]
+    method: Union[str, None]
+    # Stands in for the shortcut of the deferred plugin until the plugin is loaded
+    deferred: bool
@@ -0,0 +1,114 @@
+"""
+Plugin manifests.
+
+A manifest describes the plugin without importing its code: its name, version, dependencies
+and the quick actions, shortcuts and menu items it provides. Manifests are written after the plugins are loaded
+and are used on the next start to resolve the dependency graph and to defer the lazy plugins
+"""
+import os
+import dataclasses as dt
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from pieapp.api.utils.files import read_json, write_json
+
+# Plugin files that the manifest is built from
+PLUGIN_MANIFEST_FILES = ("__init__.py", "plugin.py", "globals.py")
+
+
+def get_manifest_key(plugin_path: Path) -> list[Union[int, None]]:
+    """
+    Get modification times of the plugin files. Manifest is valid as long as they don't change
+    """
+    key = []
+    for file in PLUGIN_MANIFEST_FILES:
+        try:
+            key.append(os.stat(plugin_path / file).st_mtime_ns)
+        except OSError:
+            key.append(None)
+
+    return key
+
+
+def get_trigger_method(instance: Any, triggered: Callable) -> Union[str, None]:
+    """
+    Get name of the plugin method that the shortcut or the menu item triggers.
+    Only the plugin methods are recorded in the manifest, the deferred plugin can't call the rest
+    """
+    if not hasattr(instance, "lazy") or getattr(triggered, "__self__", None) is not instance:
+        return None
+
+    return triggered.__name__
+
+
+@dt.dataclass(slots=True)
+class PluginManifest:
+    name: str
+    path: str
+    key: list[Union[int, None]]
+    version: str = None
+    lazy: bool = False
+    requires: list[str] = dt.field(default_factory=list)
+    optional: list[str] = dt.field(default_factory=list)
+    # Quick actions: {"class": <import string>, "enabled": bool, "before": str, "after": str}
+    quick_actions: list[dict[str, Any]] = dt.field(default_factory=list)
+    # Shortcuts: {"name": str, "shortcut": str, "method": str, "target": str,
+    # "title": str, "description": str, "hidden": bool}
+    shortcuts: list[dict[str, Any]] = dt.field(default_factory=list)
+    # Menu items: {"scope": str, "menu": str, "name": str, "text": str, "method": str,
+    # "before": str, "after": str, "index": int}
+    menu_items: list[dict[str, Any]] = dt.field(default_factory=list)
+
+
+class PluginManifestCache:
+    """
+    Plugin manifests stored in the cache file
+    """
+
+    version: int = 2
+
+    def __init__(self, cache_file: Path, app_version: str) -> None:
+        self._cache_file = cache_file
+        self._app_version = app_version
+        # <plugin path>: <manifest>
+        self._manifests: dict[str, PluginManifest] = {}
+
+        data = read_json(cache_file, raise_exception=False, default={})
+        if not isinstance(data, dict):
+            return
+
+        if data.get("version") != self.version or data.get("app_version") != app_version:
+            return
+
+        for manifest in data.get("plugins", []):
+            try:
+                manifest = PluginManifest(**manifest)
+            except TypeError:
+                continue
+            self._manifests[manifest.path] = manifest
+
+    def get(self, plugin_path: Path) -> Union[PluginManifest, None]:
+        """
+        Get manifest of the plugin if its files haven't changed
+        """
+        manifest = self._manifests.get(plugin_path.as_posix())
+        if manifest is None or manifest.key != get_manifest_key(plugin_path):
+            return None
+
+        return manifest
+
+    def set(self, manifest: PluginManifest) -> None:
+        self._manifests[manifest.path] = manifest
+
+    def save(self) -> None:
+        data = {
+            "version": self.version,
+            "app_version": self._app_version,
+            "plugins": [dt.asdict(i) for i in self._manifests.values()],
+        }
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_json(self._cache_file, data)
+        except OSError:
+            # The cache is optional
+            pass
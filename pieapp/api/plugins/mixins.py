@@ -49,7 +49,7 @@ class DialogWidgetMixin(ConfigAccessorMixin, WidgetsAccessorMixins):
         self.update_plugin_config("ui.geometry", Scope.User, (
             geometry.x(), geometry.y(), geometry.size().width(), geometry.size().height()
         ))
-        self.save_plugin_config("ui", Scope.User, create=True)
+        self.save_plugin_config("ui", Scope.User)
 
     def restore_widget_geometry(self) -> None:
         self.set_geometry(*self.get_plugin_config("ui.geometry", Scope.User, self.get_default_geometry()))
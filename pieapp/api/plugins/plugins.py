@@ -30,6 +30,10 @@ class PieBasePlugin(QObject, PluginsObserverMixin):
     # List of optional built-in plugins
     optional: list[str] = []
 
+    # Load the plugin on the first `get_plugin` call or on its quick action trigger.
+    # Its quick actions are registered from the cached plugin manifest until then
+    lazy: bool = False
+
     # Signals
 
     # Emit when all plugins are ready
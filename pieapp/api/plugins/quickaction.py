@@ -20,7 +20,6 @@ class QuickAction(QObject):
         self._plugin_name = plugin.name
         self._full_name = f"{plugin.name}_{self.name}"
         self._enabled = enabled
-        self._media_file_name = None
         self._file_filter = None
         self._before = before
         self._after = after
@@ -29,10 +28,18 @@ class QuickAction(QObject):
     def plugin_call_method(self) -> callable:
         return self._plugin_call_method
 
+    @property
+    def plugin_name(self) -> str:
+        return self._plugin_name
+
     @property
     def full_name(self) -> str:
         return self._full_name
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
     @property
     def before(self) -> str:
         return self._before
@@ -47,24 +54,19 @@ class QuickAction(QObject):
     def get_icon(self) -> QIcon:
         return QIcon()
 
-    def on_click(self) -> None:
+    def on_click(self, media_file_name: str) -> None:
         raise NotImplementedError
 
-    def get_enabled(self) -> tuple[bool, str]:
+    def get_enabled(self, media_file_name: str) -> tuple[bool, str]:
         """
         Reimplement this method.
-        For example, you can filter file format to enable or disable button
+        For example, you can filter file format to enable or disable button.
+        Quick actions are shared between the rows, so the media file name is passed explicitly
         """
         return True, ""
 
     def set_disabled(self, state: bool) -> None:
         self.set_disabled(state)
 
-    def set_snapshot_name(self, media_file_name: str):
-        self._media_file_name = media_file_name
-
-    def get_media_file_name(self) -> str:
-        return self._media_file_name
-
     def __repr__(self) -> str:
         return f"({self.__class__.__name__}) <name: {self.name}, enabled: {self._enabled}>"
@@ -1,21 +1,49 @@
 from __feature__ import snake_case
 
 from types import ModuleType
+from typing import Any, Union
 
-import sys
+import os
+import importlib
+import functools
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from version_parser import Version
 
 from PySide6.QtCore import Signal, QObject
+from PySide6.QtGui import QIcon, QShortcut, QKeySequence
 
 from pieapp.api.exceptions import PieError
 from pieapp.api.globals import Global
 from pieapp.api.models.plugins import SysPlugin
 from pieapp.api.plugins.plugins import PiePlugin
 from pieapp.api.plugins.types import PluginType
-from pieapp.api.utils.modules import import_by_path
+from pieapp.api.plugins.manifest import PluginManifest
+from pieapp.api.plugins.manifest import PluginManifestCache
+from pieapp.api.plugins.manifest import get_manifest_key
+from pieapp.api.registries.configs.registry import ConfigRegistry
+from pieapp.api.registries.locales.registry import LocaleRegistry
+from pieapp.api.utils.graph import DependencyCycleError, get_topological_waves
+from pieapp.api.utils.modules import PluginFinder, import_by_string
 from pieapp.api.utils.qt import get_main_window
 from pieapp.api.utils.logger import logger
+from pieapp.api.utils.tracer import Tracer
+
+
+class DeferredPlugin:
+    """
+    Stands in for a deferred plugin in its quick actions, shortcuts and menu items.
+    The plugin is loaded on the first call
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def call(self, *args, **kwargs) -> None:
+        return PluginRegistry.get_plugin(self.name).call(*args, **kwargs)
+
+    def trigger(self, method: str, *args) -> None:
+        return getattr(PluginRegistry.get_plugin(self.name), method)(*args)
 
 
 class PluginRegistryClass(QObject):
@@ -43,8 +71,21 @@ class PluginRegistryClass(QObject):
         # PiePlugins dictionary with availability boolean status
         self._plugin_availability: dict[str, bool] = {}
 
+        # <plugin name>: ready PiePlugins that depend on the plugin and wait for it
+        self._waiting_plugins: dict[str, list[str]] = {}
+
         self._plugin_type_registry: dict[str, set] = {k: set() for k in PluginType.fields()}
 
+        # Manifests of the loaded plugins
+        self._plugin_manifests: dict[str, PluginManifest] = {}
+
+        # Manifests of the lazy plugins that are not loaded yet
+        self._deferred_plugins: dict[str, PluginManifest] = {}
+
+        self._plugin_manifest_cache: PluginManifestCache = None
+        self._plugin_finder = PluginFinder()
+        self._is_ready: bool = False
+
     def init_globals(self) -> None:
         """
         Collect all "globals.py" files before the core registries start
@@ -56,10 +97,56 @@ class PluginRegistryClass(QObject):
         if not self._main_window:
             raise PieError(f"Can't find an initialized QMainWindow instance")
 
-        # Initialize plugins then
-        self.initialize_from_packages(Global.APP_ROOT / Global.PLUGINS_DIR_NAME)
-        self.initialize_from_packages(Global.USER_ROOT / Global.PLUGINS_DIR_NAME)
-        self.sig_plugins_ready.emit()
+        self._plugin_manifest_cache = PluginManifestCache(
+            Global.USER_ROOT / Global.CACHE_DIR_NAME / "plugins.json",
+            Global.PIEAPP_VERSION
+        )
+        self._plugin_finder.install()
+
+        # Find plugins then
+        plugin_paths = [
+            *self.find_plugins(Global.APP_ROOT / Global.PLUGINS_DIR_NAME),
+            *self.find_plugins(Global.USER_ROOT / Global.PLUGINS_DIR_NAME),
+        ]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            # Dependencies are read from the manifests. Plugins without the valid manifest
+            # are imported and created to get them
+            plugin_manifests: dict[str, PluginManifest] = {}
+            unknown_plugin_paths: list[Path] = []
+            for plugin_path in plugin_paths:
+                manifest = self._plugin_manifest_cache.get(plugin_path)
+                if manifest is None:
+                    unknown_plugin_paths.append(plugin_path)
+                else:
+                    plugin_manifests[manifest.name] = manifest
+
+            plugin_instances = self.create_plugins(unknown_plugin_paths, executor)
+
+            # Lazy plugins that the other plugins require can't wait
+            required_plugins = [*plugin_manifests.values(), *plugin_instances.values()]
+            while required_plugins:
+                for plugin in required_plugins.pop().requires:
+                    if plugin in self._deferred_plugins:
+                        plugin_manifests[plugin] = self._deferred_plugins.pop(plugin)
+                        required_plugins.append(plugin_manifests[plugin])
+
+            self.initialize_plugins(plugin_manifests, plugin_instances, executor)
+
+            # Deferred plugins aren't loaded, but their quick actions may use their configs and translations
+            deferred_plugin_paths = [Path(i.path) for i in self._deferred_plugins.values()]
+            resources = [executor.submit(self.read_plugin_resources, i) for i in deferred_plugin_paths]
+            for plugin_path, future in zip(deferred_plugin_paths, resources):
+                self.update_plugin_resources(plugin_path, future.result())
+
+        self.register_deferred_quick_actions()
+        self.register_deferred_shortcuts()
+        self.register_deferred_menu_items()
+        self.update_manifests()
+
+        with Tracer.span("on_plugins_ready", "plugin"):
+            self.sig_plugins_ready.emit()
+        self._is_ready = True
 
     def shutdown_plugins(self, *plugins: str, all_plugins: bool = False) -> None:
         """
@@ -117,7 +204,10 @@ class PluginRegistryClass(QObject):
         return True
 
     def get_plugin(self, plugin_name: str) -> PiePlugin:
-        """ Get PiePlugin instance by its name """
+        """ Get PiePlugin instance by its name. Deferred plugin is loaded on the first call """
+        if plugin_name in self._deferred_plugins:
+            return self.load_deferred_plugin(plugin_name)
+
         return self._plugin_registry.get(plugin_name, None)
 
     def get_plugins(self) -> list[PiePlugin]:
@@ -146,39 +236,365 @@ class PluginRegistryClass(QObject):
             raise AttributeError(f"PieKit version ({sys_piekit_version}) is not compatible with plugin"
                                  f"{plugin_package.name} version ({plugin_package.piekit_version})")
 
-    def initialize_from_packages(self, folder: "Path") -> None:
+    def find_plugins(self, folder: Path) -> list[Path]:
+        """
+        Find plugin packages in the folder. Lazy plugins with the valid manifest are deferred
+
+        Args:
+            folder (pathlib.Path): Plugins folder
+        """
         if not folder.exists():
             logger.warning(f"Plugins folder {folder.name} doesn't exist")
-            return
+            return []
 
-        sys.path.insert(0, folder.as_posix())
+        # Plugin packages are imported by their folder names: `<plugin name>.plugin`
+        self._plugin_finder.add_folder(folder)
 
+        plugin_paths: list[Path] = []
         for package in folder.iterdir():
-            if package.is_dir() and package.name not in ("__pycache__",):
-                logger.debug(f"Preparing plugin {package.name}")
-
+            if package.is_dir() and package.name.isidentifier() and package.name != "__pycache__":
                 # Plugin path: pieapp/plugins/<plugin name>
                 plugin_path = folder / package.name
 
-                if (plugin_path / "globals.py").exists():
-                    Global.load_by_path(plugin_path / "globals.py")
-
-                # Add our plugin into sys.path
-                plugin_package_module = import_by_path(str(plugin_path / "__init__.py"))
+                # Globals are loaded even for the deferred plugins, their quick actions may use them
                 try:
-                    self.check_versions(plugin_package_module)
-                except AttributeError:
-                    self.delete_plugin(package.name)
+                    Global.import_module(f"{package.name}.globals")
+                except ModuleNotFoundError as e:
+                    if e.name != f"{package.name}.globals":
+                        raise e
+
+                manifest = self._plugin_manifest_cache.get(plugin_path)
+                if manifest is not None and manifest.lazy:
+                    logger.debug(f"Deferring plugin {manifest.name}")
+                    self._deferred_plugins[manifest.name] = manifest
+                    continue
+
+                plugin_paths.append(plugin_path)
+
+        return plugin_paths
+
+    def import_plugin(self, plugin_path: Path) -> tuple[ModuleType, ModuleType]:
+        """
+        Import the plugin package and its module. Doesn't touch Qt objects, so it can be called from any thread
+
+        Args:
+            plugin_path (pathlib.Path): Plugin package path
+        """
+        with Tracer.span(f"{plugin_path.name}: import", "plugin"):
+            plugin_package_module = importlib.import_module(plugin_path.name)
+            plugin_module = importlib.import_module(f"{plugin_path.name}.plugin")
 
-                # Importing plugin module
-                plugin_module = import_by_path(str(plugin_path / "plugin.py"))
+        return plugin_package_module, plugin_module
+
+    def get_imported_plugin(self, plugin_path: Path, future: Future) -> tuple[ModuleType, ModuleType]:
+        """
+        Get modules of the plugin imported on the thread pool
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            # For example, plugins import each other's modules. Try again in the GUI thread
+            logger.debug(f"Can't import plugin {plugin_path.name} on the thread pool: {e!s}")
+            return self.import_plugin(plugin_path)
+
+    @staticmethod
+    def read_plugin_resources(plugin_path: Path) -> tuple[list[tuple[str, Any]], Union[dict[str, str], None]]:
+        """
+        Read config and locale files of the plugin. Doesn't touch the registries, so it can be called from any thread
+
+        Args:
+            plugin_path (pathlib.Path): Plugin package path
+        """
+        with Tracer.span(f"{plugin_path.name}: read resources", "plugin"):
+            configs: list[tuple[str, Any]] = []
+            if plugin_path.parent == Global.APP_ROOT / Global.PLUGINS_DIR_NAME:
+                configs.extend(ConfigRegistry.read_plugin_configs(plugin_path))
+
+            # User configs folder overrides the app one: %USER%/.pie/configs/<plugin name>
+            user_configs_folder = Global.USER_ROOT / Global.CONFIGS_DIR_NAME / plugin_path.name
+            if user_configs_folder.is_dir():
+                configs.extend(ConfigRegistry.read_plugin_configs(user_configs_folder))
+
+            translations = LocaleRegistry.read_plugin_locales(plugin_path)
+
+        return configs, translations
+
+    @staticmethod
+    def update_plugin_resources(
+        plugin_path: Path,
+        resources: tuple[list[tuple[str, Any]], Union[dict[str, str], None]]
+    ) -> None:
+        """
+        Add configs and translations read by `read_plugin_resources` to the registries
+        """
+        configs, translations = resources
+        ConfigRegistry.update_plugin_configs(configs)
+        LocaleRegistry.update_plugin_locales(plugin_path.name, translations)
+
+    def create_plugin(
+        self,
+        plugin_path: Path,
+        plugin_package_module: ModuleType,
+        plugin_module: ModuleType
+    ) -> PiePlugin:
+        """
+        Create the plugin instance in the GUI thread
+        """
+        logger.debug(f"Preparing plugin {plugin_path.name}")
+        try:
+            self.check_versions(plugin_package_module)
+        except AttributeError:
+            self.delete_plugin(plugin_path.name)
+
+        plugin_instance = getattr(plugin_module, "main")(self._main_window, plugin_path)
+        if plugin_instance:
+            self._plugin_manifests[plugin_instance.name] = PluginManifest(
+                name=plugin_instance.name,
+                path=plugin_path.as_posix(),
+                key=get_manifest_key(plugin_path),
+                version=getattr(plugin_package_module, "version", None),
+                lazy=plugin_instance.lazy,
+                requires=list(plugin_instance.requires),
+                optional=list(plugin_instance.optional),
+            )
+
+        return plugin_instance
+
+    def create_plugins(self, plugin_paths: list[Path], executor: ThreadPoolExecutor) -> dict[str, PiePlugin]:
+        """
+        Import plugins on the thread pool and create their instances in the GUI thread
+
+        Args:
+            plugin_paths (list[pathlib.Path]): Plugin package paths
+            executor (ThreadPoolExecutor): Thread pool
+        """
+        futures = [executor.submit(self.import_plugin, i) for i in plugin_paths]
 
-                # Initializing plugin instance
-                plugin_instance = getattr(plugin_module, "main")(self._main_window, plugin_path)
-                # if plugin_instance.name in (SysPlugin.Converter, SysPlugin.MetadataEditor):
-                #     continue
-                if plugin_instance:
-                    self.initialize_plugin(plugin_instance)
+        plugin_instances: dict[str, PiePlugin] = {}
+        for plugin_path, future in zip(plugin_paths, futures):
+            plugin_instance = self.create_plugin(plugin_path, *self.get_imported_plugin(plugin_path, future))
+            if plugin_instance:
+                plugin_instances[plugin_instance.name] = plugin_instance
+
+        return plugin_instances
+
+    def initialize_plugins(
+        self,
+        plugin_manifests: dict[str, PluginManifest],
+        plugin_instances: dict[str, PiePlugin],
+        executor: ThreadPoolExecutor
+    ) -> None:
+        """
+        Initialize plugins in topological waves: every plugin is prepared after the plugins it depends on.
+        Imports, config and locale reads of the wave run on the thread pool,
+        then the plugins of the wave are created and prepared in the GUI thread
+
+        Args:
+            plugin_manifests (dict): <plugin name>: <manifest of the plugin that isn't imported yet>
+            plugin_instances (dict): <plugin name>: <created plugin instance>
+            executor (ThreadPoolExecutor): Thread pool
+        """
+        plugins = {**plugin_manifests, **plugin_instances}
+        try:
+            waves = get_topological_waves(
+                {k: v.requires for (k, v) in plugins.items()},
+                {k: v.optional for (k, v) in plugins.items()}
+            )
+        except DependencyCycleError as e:
+            raise PieError("Plugins dependency cycle", str(e))
+
+        for index, wave in enumerate(waves):
+            with Tracer.span(f"Wave {index}: {', '.join(wave)}", "plugin"):
+                plugin_paths = {
+                    plugin: plugin_instances[plugin].get_path() if plugin in plugin_instances
+                    else Path(plugin_manifests[plugin].path)
+                    for plugin in wave
+                }
+                imports = {
+                    plugin: executor.submit(self.import_plugin, plugin_paths[plugin])
+                    for plugin in wave if plugin not in plugin_instances
+                }
+                resources = {
+                    plugin: executor.submit(self.read_plugin_resources, plugin_paths[plugin])
+                    for plugin in wave
+                }
+
+                for plugin in wave:
+                    plugin_path = plugin_paths[plugin]
+                    self.update_plugin_resources(plugin_path, resources[plugin].result())
+
+                    plugin_instance = plugin_instances.get(plugin)
+                    if plugin_instance is None:
+                        plugin_modules = self.get_imported_plugin(plugin_path, imports[plugin])
+                        plugin_instance = self.create_plugin(plugin_path, *plugin_modules)
+                    if plugin_instance:
+                        self.initialize_plugin(plugin_instance)
+
+    def load_plugin(self, plugin_path: Path) -> PiePlugin:
+        """
+        Import, create and initialize the plugin
+
+        Args:
+            plugin_path (pathlib.Path): Plugin package path
+        """
+        plugin_instance = self.create_plugin(plugin_path, *self.import_plugin(plugin_path))
+        if plugin_instance:
+            self.initialize_plugin(plugin_instance)
+
+        return plugin_instance
+
+    def load_deferred_plugin(self, plugin_name: str) -> PiePlugin:
+        """
+        Load the deferred plugin and the deferred plugins it requires
+
+        Args:
+            plugin_name (str): Plugin name
+        """
+        manifest = self._deferred_plugins.pop(plugin_name, None)
+        if manifest is None:
+            return self._plugin_registry.get(plugin_name, None)
+
+        for plugin in manifest.requires:
+            self.load_deferred_plugin(plugin)
+
+        logger.debug(f"Loading deferred plugin {plugin_name}")
+        plugin_instance = self.load_plugin(Path(manifest.path))
+        if plugin_instance and self._is_ready:
+            plugin_instance.sig_reg_plugins_ready.emit()
+            self.update_manifests()
+
+        return plugin_instance
+
+    def register_deferred_quick_actions(self) -> None:
+        """
+        Register quick actions of the deferred plugins from their manifests.
+        The plugin replaces them with its own ones when it's loaded
+        """
+        from pieapp.api.registries.quickactions.registry import QuickActionRegistry
+
+        for manifest in self._deferred_plugins.values():
+            deferred_plugin = DeferredPlugin(manifest.name)
+            for quick_action in manifest.quick_actions:
+                try:
+                    quick_action_class = import_by_string(quick_action["class"])
+                except (ImportError, AttributeError, TypeError) as e:
+                    logger.warning(f"Can't import quick action of the plugin {manifest.name}: {e!s}")
+                    continue
+
+                QuickActionRegistry.add(quick_action_class(
+                    deferred_plugin,
+                    enabled=quick_action.get("enabled", False),
+                    before=quick_action.get("before"),
+                    after=quick_action.get("after"),
+                ))
+
+    def register_deferred_shortcuts(self) -> None:
+        """
+        Register shortcuts of the deferred plugins from their manifests. Shortcuts are bound to the main window.
+        The plugin replaces them with its own ones when it's loaded
+        """
+        from pieapp.api.registries.shortcuts.registry import ShortcutRegistry
+
+        for manifest in self._deferred_plugins.values():
+            deferred_plugin = DeferredPlugin(manifest.name)
+            for shortcut in manifest.shortcuts:
+                shortcut_instance = QShortcut(QKeySequence(shortcut["shortcut"]), self._main_window)
+                shortcut_instance.activated.connect(functools.partial(deferred_plugin.trigger, shortcut["method"]))
+                ShortcutRegistry.add(
+                    shortcut["name"],
+                    shortcut_instance,
+                    shortcut.get("target"),
+                    shortcut.get("title"),
+                    shortcut["shortcut"],
+                    shortcut.get("description"),
+                    shortcut.get("hidden", False),
+                    plugin=manifest.name,
+                    method=shortcut["method"],
+                    deferred=True
+                )
+
+    def register_deferred_menu_items(self) -> None:
+        """
+        Register menu items of the deferred plugins from their manifests.
+        The plugin replaces them with its own ones when it's loaded
+        """
+        from pieapp.api.registries.menus.registry import MenuRegistry
+
+        for manifest in self._deferred_plugins.values():
+            deferred_plugin = DeferredPlugin(manifest.name)
+            for menu_item in manifest.menu_items:
+                try:
+                    menu = MenuRegistry.get_menu(menu_item["scope"], menu_item["menu"])
+                except PieError as e:
+                    logger.warning(f"Can't add menu item of the plugin {manifest.name}: {e!s}")
+                    continue
+
+                menu.add_menu_item(
+                    menu_item["name"],
+                    menu_item.get("text"),
+                    functools.partial(deferred_plugin.trigger, menu_item["method"]),
+                    QIcon(),
+                    before=menu_item.get("before"),
+                    after=menu_item.get("after"),
+                    index=menu_item.get("index"),
+                    plugin=manifest.name,
+                    method=menu_item["method"],
+                    deferred=True
+                )
+                MenuRegistry.add_menu_item(menu_item["scope"], menu_item["menu"], menu_item["name"], menu)
+
+    def update_manifests(self) -> None:
+        """
+        Update manifests of the loaded plugins with their quick actions, shortcuts and menu items and save them
+        """
+        from pieapp.api.registries.quickactions.registry import QuickActionRegistry
+        from pieapp.api.registries.shortcuts.registry import ShortcutRegistry
+        from pieapp.api.registries.menus.registry import MenuRegistry
+
+        quick_actions: dict[str, list[dict]] = {}
+        for quick_action in QuickActionRegistry.values():
+            quick_actions.setdefault(quick_action.plugin_name, []).append({
+                "class": f"{quick_action.__class__.__module__}.{quick_action.__class__.__qualname__}",
+                "enabled": quick_action.enabled,
+                "before": quick_action.before,
+                "after": quick_action.after,
+            })
+
+        shortcuts: dict[str, list[dict]] = {}
+        for (name, shortcut) in ShortcutRegistry.items():
+            if shortcut["method"] is not None:
+                shortcuts.setdefault(shortcut["plugin"], []).append({
+                    "name": name,
+                    "shortcut": shortcut["shortcut_key"],
+                    "method": shortcut["method"],
+                    "target": shortcut["target"],
+                    "title": shortcut["title"],
+                    "description": shortcut["description"],
+                    "hidden": shortcut["hidden"],
+                })
+
+        menu_items: dict[str, list[dict]] = {}
+        for (scope, menu) in MenuRegistry.get_menus():
+            for (name, menu_item) in menu.get_items().items():
+                if menu_item["method"] is not None:
+                    menu_items.setdefault(menu_item["plugin"], []).append({
+                        "scope": scope,
+                        "menu": menu.name,
+                        "name": name,
+                        "text": menu_item["text"],
+                        "method": menu_item["method"],
+                        "before": menu_item["before"],
+                        "after": menu_item["after"],
+                        "index": menu_item["index"],
+                    })
+
+        for manifest in self._plugin_manifests.values():
+            manifest.quick_actions = quick_actions.get(manifest.name, [])
+            manifest.shortcuts = shortcuts.get(manifest.name, [])
+            manifest.menu_items = menu_items.get(manifest.name, [])
+            self._plugin_manifest_cache.set(manifest)
+
+        self._plugin_manifest_cache.save()
 
     def shutdown_plugin(self, plugin_name: str):
         """ Shutdown a plugin from its dependencies """
@@ -217,52 +633,40 @@ class PluginRegistryClass(QObject):
         self._main_window.sig_on_before_main_window_show.connect(plugin_instance.sig_on_before_main_window_show)
 
         # Connect plugin observer signals
-        plugin_instance.sig_plugin_ready.connect(lambda: (
-            self._notify_plugin_dependencies(plugin_instance.name),
-            self._notify_plugin_availability(plugin_instance.name)
-        ))
+        plugin_instance.sig_plugin_ready.connect(lambda: self._notify_plugin_ready(plugin_instance.name))
 
         try:
-            plugin_instance.prepare()
+            with Tracer.span(f"{plugin_instance.name}: prepare", "plugin"):
+                plugin_instance.prepare()
         except Exception as e:
             logger.debug(f"Error {plugin_instance.name}: {e!s}")
             self.delete_plugin(plugin_instance.name)
             raise e
 
-    def _notify_plugin_availability(
-        self,
-        name: str,
-    ) -> None:
+    def _notify_plugin_ready(self, name: str) -> None:
         """
-        Notify dependent PiePlugins that our PiePlugin is available
+        Notify the PiePlugin about its available dependencies and the waiting PiePlugins about the PiePlugin.
+
+        Dependencies are prepared in the earlier waves, so they are usually available already.
+        The rest, optional dependencies of a cycle and deferred plugins, notify the PiePlugin when they are ready
 
         Args:
             name (str): PiePlugin name
         """
         self._plugin_availability[name] = True
 
-        # Notify plugin dependents
-        plugin_dependents = self._plugin_dependents.get(name, {})
-        required_plugins = plugin_dependents.get("requires", [])
-        optional_plugins = plugin_dependents.get("optional", [])
-
-        for plugin in required_plugins + optional_plugins:
-            if plugin in self._plugin_registry:
-                plugin_instance = self._plugin_registry[plugin]
-                plugin_instance.on_plugin_available(name)
-
-    def _notify_plugin_dependencies(self, name: str) -> None:
-        """ Notify PiePlugins dependencies """
         plugin_instance = self._plugin_registry[name]
-        plugin_dependencies = self._plugin_dependencies.get(name, {})
-        required_plugins = plugin_dependencies.get("requires", [])
-        optional_plugins = plugin_dependencies.get("optional", [])
+        for plugin in dict.fromkeys(plugin_instance.requires + plugin_instance.optional):
+            if self._plugin_availability.get(plugin, False):
+                with Tracer.span(f"{name}: on_plugin_available({plugin})", "plugin"):
+                    plugin_instance.on_plugin_available(plugin)
+            else:
+                self._waiting_plugins.setdefault(plugin, []).append(name)
 
-        for plugin in required_plugins + optional_plugins:
+        for plugin in self._waiting_plugins.pop(name, []):
             if plugin in self._plugin_registry:
-                if self._plugin_availability.get(plugin, False):
-                    logger.debug(f"Plugin {plugin} has already loaded")
-                    plugin_instance.on_plugin_available(plugin)
+                with Tracer.span(f"{plugin}: on_plugin_available({name})", "plugin"):
+                    self._plugin_registry[plugin].on_plugin_available(name)
 
     def _update_plugin_info(
         self,
@@ -2,7 +2,7 @@ from typing import Any
 
 from pieapp.api.globals import Global
 from pieapp.api.models.scopes import Scope
-from pieapp.api.registries.configs.registry import ConfigRegistry
+from pieapp.api.registries.configs.registry import ConfigHandle, ConfigRegistry
 
 
 class ConfigAccessorMixin:
@@ -22,8 +22,15 @@ class ConfigAccessorMixin:
         inner_scope: str = Scope.Inner,
         default: Any = None
     ) -> Any:
-        file_name, key = self._build_file_name_and_key(key)
-        return self._get_config(Scope.Root, inner_scope, file_name, key, default)
+        return self._get_config(Scope.Root, inner_scope, key, default)
+
+    def get_app_config_handle(
+        self,
+        key: str = None,
+        inner_scope: str = Scope.Inner,
+        default: Any = None
+    ) -> ConfigHandle:
+        return ConfigRegistry.get_handle(f"{Scope.Root}.{inner_scope}", key, default)
 
     def update_app_config(
         self,
@@ -31,19 +38,17 @@ class ConfigAccessorMixin:
         inner_scope: str = Scope.Inner,
         data: Any = None,
         save: bool = False,
-        temp: bool = False,
-        create: bool = False
+        temp: bool = False
     ) -> Any:
         file_name, key = self._build_file_name_and_key(key)
-        return self._update_config(Scope.Root, inner_scope, file_name, key, data, save, temp, create)
+        return self._update_config(Scope.Root, inner_scope, file_name, key, data, save, temp)
 
     def save_app_config(
         self,
         file_name: str = Global.CONFIG_FILE_NAME,
-        inner_scope: str = Scope.Inner,
-        create: bool = False
+        inner_scope: str = Scope.Inner
     ) -> Any:
-        self._save_config(Scope.Root, inner_scope, file_name, create)
+        self._save_config(Scope.Root, inner_scope, file_name)
 
     def restore_app_config(
         self,
@@ -60,8 +65,15 @@ class ConfigAccessorMixin:
         inner_scope: str = Scope.Inner,
         default: Any = None
     ) -> Any:
-        file_name, key = self._build_file_name_and_key(key)
-        return self._get_config(self.name, inner_scope, file_name, key, default)
+        return self._get_config(self.name, inner_scope, key, default)
+
+    def get_plugin_config_handle(
+        self,
+        key: str = None,
+        inner_scope: str = Scope.Inner,
+        default: Any = None
+    ) -> ConfigHandle:
+        return ConfigRegistry.get_handle(f"{self.name}.{inner_scope}", key, default)
 
     def update_plugin_config(
         self,
@@ -69,19 +81,17 @@ class ConfigAccessorMixin:
         inner_scope: str = Scope.Inner,
         data: Any = None,
         save: bool = False,
-        temp: bool = False,
-        create: bool = False
+        temp: bool = False
     ) -> Any:
         file_name, key = self._build_file_name_and_key(key)
-        return self._update_config(self.name, inner_scope, file_name, key, data, save, temp, create)
+        return self._update_config(self.name, inner_scope, file_name, key, data, save, temp)
 
     def save_plugin_config(
         self,
         file_name: str = Global.CONFIG_FILE_NAME,
-        inner_scope: str = Scope.Inner,
-        create: bool = False
+        inner_scope: str = Scope.Inner
     ) -> Any:
-        self._save_config(self.name, inner_scope, file_name, create)
+        self._save_config(self.name, inner_scope, file_name)
 
     def restore_plugin_config(
         self,
@@ -94,12 +104,13 @@ class ConfigAccessorMixin:
 
     def _get_config(
         self,
-        scope: str, inner_scope: str,
-        file_name: str,
+        scope: str,
+        inner_scope: str,
         key: str,
         default: Any
     ) -> Any:
-        return ConfigRegistry.get(f"{scope}.{inner_scope}.{file_name}", key, default)
+        # Key includes the file name: <file name>.<key path>
+        return ConfigRegistry.get_by_key(f"{scope}.{inner_scope}.{key}", default)
 
     def _update_config(
         self,
@@ -109,19 +120,17 @@ class ConfigAccessorMixin:
         key: str,
         data: Any,
         save: bool,
-        temp: bool = False,
-        create: bool = False
+        temp: bool = False
     ) -> Any:
-        return ConfigRegistry.update(f"{scope}.{inner_scope}.{file_name}", key, data, temp, save, create)
+        return ConfigRegistry.update(f"{scope}.{inner_scope}.{file_name}", key, data, temp, save)
 
     def _save_config(
         self,
         scope: str,
         inner_scope: str,
-        file_name: str,
-        create: bool
+        file_name: str
     ) -> None:
-        return ConfigRegistry.save(f"{scope}.{inner_scope}.{file_name}", f"{file_name}.json", create)
+        return ConfigRegistry.save(f"{scope}.{inner_scope}.{file_name}", f"{file_name}.json")
 
     def _restore_config(
         self,
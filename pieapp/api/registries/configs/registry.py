@@ -1,17 +1,17 @@
-import copy
-from typing import Any
+import atexit
+from typing import Any, Union
 from pathlib import Path
 
 from dotty_dict import Dotty
 
 from pieapp.api.utils.logger import logger
 from pieapp.api.utils.files import read_json
-from pieapp.api.utils.files import write_json
 
 from pieapp.api.globals import Global
 from pieapp.api.models.scopes import Scope
 from pieapp.api.registries.sysregs import SysRegistry
 from pieapp.api.registries.base import BaseRegistry
+from pieapp.api.registries.configs.writer import ConfigWriter
 
 
 class ProtectedKey:
@@ -19,19 +19,68 @@ class ProtectedKey:
     Temporary: str = "__TEMP__"
 
 
+# Marks the keys that are missing in the configuration
+_MISSING = object()
+
+
+class ConfigHandle:
+    """
+    Cached accessor of the config key. Plugins can hold it and read the value
+    without the key lookup until the configuration is updated
+    """
+    __slots__ = ("_registry", "_key", "_default", "_generation", "_value")
+
+    def __init__(self, registry: "ConfigRegistryClass", key: str, default: Any = None) -> None:
+        self._registry = registry
+        self._key = key
+        self._default = default
+        self._generation: int = -1
+        self._value: Any = None
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    def get(self) -> Any:
+        if self._generation != self._registry.generation:
+            self._value = self._registry.get_by_key(self._key, self._default)
+            self._generation = self._registry.generation
+
+        return self._value
+
+
 class ConfigRegistryClass(BaseRegistry):
     name = SysRegistry.Configs
 
+    def __init__(self) -> None:
+        # Incremented on every update, so the `ConfigHandle` instances know their values are stale
+        self._generation: int = 0
+        self._config_writer: Union[ConfigWriter, None] = None
+
     def init(self) -> None:
         self._configuration: Dotty = Dotty({})
         self._temp_configuration: Dotty = Dotty({})
+        # Flat index of the looked up keys: <full key>: <value>. Cleared on every update
+        self._index: dict[str, Any] = {}
+        self._generation += 1
 
         app_root = Global.APP_ROOT / Global.CONFIGS_DIR_NAME
         user_root = Global.USER_ROOT / Global.CONFIGS_DIR_NAME / "pieapp"
         self.load_app_configs(app_root, f"{Scope.Root}.{Scope.Inner}")
         self.load_app_configs(user_root, f"{Scope.Root}.{Scope.User}")
-        self.load_plugins_configs(Global.APP_ROOT / Global.PLUGINS_DIR_NAME)
-        self.load_plugins_configs(Global.USER_ROOT / Global.CONFIGS_DIR_NAME)
+        # Plugin configs are read by the `PluginRegistry` along with the plugins
+
+        # Config files are written on the writer thread. Saves within the delay are coalesced
+        if self._config_writer is not None:
+            self._config_writer.close()
+
+        self._config_writer = ConfigWriter(
+            self.get(f"{Scope.Root}.{Scope.User}.config", "save_delay", 0.5),
+            self.get(f"{Scope.Root}.{Scope.User}.config", "save_max_delay", 2.0),
+            on_error=lambda file, e: logger.warning(f"Can't save config file {file!s}: {e!s}")
+        )
+        atexit.unregister(self.flush)
+        atexit.register(self.flush)
 
     def load_app_configs(self, folder: Path, scope: str) -> None:
         if folder.exists() is False:
@@ -56,46 +105,94 @@ class ConfigRegistryClass(BaseRegistry):
             ):
                 continue
 
-            app_plugin_folder = plugin_folder / f"{Global.CONFIG_FILE_NAME}.json"
-            user_plugin_folder = Global.USER_ROOT / Global.CONFIGS_DIR_NAME / plugin_folder.name
+            self.update_plugin_configs(self.read_plugin_configs(plugin_folder))
+
+    @staticmethod
+    def read_plugin_configs(plugin_folder: Path) -> list[tuple[str, Any]]:
+        """
+        Read configs of the plugin folder. Doesn't change the configuration, so it can be called from any thread
 
-            self._configuration[f"{plugin_folder.name}.{Scope.Inner}"] = {
+        Returns:
+            Full keys and data of the configs, in the order they are updated
+        """
+        app_plugin_folder = plugin_folder / f"{Global.CONFIG_FILE_NAME}.json"
+        user_plugin_folder = Global.USER_ROOT / Global.CONFIGS_DIR_NAME / plugin_folder.name
+
+        configs: list[tuple[str, Any]] = [
+            (f"{plugin_folder.name}.{Scope.Inner}", {
                 ProtectedKey.Folder: plugin_folder,
                 ProtectedKey.Temporary: set()
-            }
-            self._configuration[f"{plugin_folder.name}.{Scope.User}"] = {
+            }),
+            (f"{plugin_folder.name}.{Scope.User}", {
                 ProtectedKey.Folder: user_plugin_folder,
                 ProtectedKey.Temporary: set()
-            }
-
-            for config_file in app_plugin_folder.rglob("*.json"):
-                # Read config in app folder - <project name>/pieapp/plugins/<plugin name>/<file name>.json
-                config_data = read_json(config_file, {}, raise_exception=False)
-                if config_file.stem in config_data:
-                    del config_data[config_file.stem]
-                self._configuration[f"{plugin_folder.name}.{Scope.Inner}.{config_file.stem}"] = config_data
-
-            for user_config_file in user_plugin_folder.glob("*.json"):
-                # Read config in user folder - %USER%/.pie/configs/<plugin name>/config.json
-                user_config_data = read_json(user_config_file, raise_exception=True)
-                if user_config_file.stem in user_config_data:
-                    del user_config_data[user_config_file.stem]
-                self._configuration[f"{plugin_folder.name}.{Scope.User}.{user_config_file.stem}"] = user_config_data
+            }),
+        ]
+
+        for config_file in app_plugin_folder.rglob("*.json"):
+            # Read config in app folder - <project name>/pieapp/plugins/<plugin name>/<file name>.json
+            config_data = read_json(config_file, {}, raise_exception=False)
+            if config_file.stem in config_data:
+                del config_data[config_file.stem]
+            configs.append((f"{plugin_folder.name}.{Scope.Inner}.{config_file.stem}", config_data))
+
+        for user_config_file in user_plugin_folder.glob("*.json"):
+            # Read config in user folder - %USER%/.pie/configs/<plugin name>/config.json
+            user_config_data = read_json(user_config_file, raise_exception=True)
+            if user_config_file.stem in user_config_data:
+                del user_config_data[user_config_file.stem]
+            configs.append((f"{plugin_folder.name}.{Scope.User}.{user_config_file.stem}", user_config_data))
+
+        return configs
+
+    def update_plugin_configs(self, configs: list[tuple[str, Any]]) -> None:
+        """
+        Add configs read by `read_plugin_configs`
+        """
+        for key, config_data in configs:
+            self._configuration[key] = config_data
+
+        self._index.clear()
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def get(self, scope: str, key_path: str, default: Any = None) -> Any:
-        return self._configuration.get(f"{scope}.{key_path}", default=default)
+        return self.get_by_key(f"{scope}.{key_path}", default)
+
+    def get_by_key(self, key: str, default: Any = None) -> Any:
+        """
+        Get value by the full dotted key, for example: `root.user.config.theme`.
+        Values are looked up once and are served from the flat index until the next update
+        """
+        try:
+            value = self._index[key]
+        except KeyError:
+            value = self._index[key] = self._configuration.get(key, default=_MISSING)
 
-    def update(self, scope: str, path: str, data: Any,
-               temp: bool = False, save: bool = False, create: bool = False) -> None:
+        return default if value is _MISSING else value
+
+    def get_handle(self, scope: str, key_path: str, default: Any = None) -> ConfigHandle:
+        return ConfigHandle(self, f"{scope}.{key_path}", default)
+
+    def update(self, scope: str, path: str, data: Any, temp: bool = False, save: bool = False) -> None:
         self._configuration[f"{scope}.{path}"] = data
+        self._index.clear()
+        self._generation += 1
         if temp:
             self._configuration[f"{scope}.{ProtectedKey.Temporary}"].add(path.split(".")[0])
         if save is True:
             # scope = ".".join(scope.split(".")[0:2])
             file_name = f"{scope.split('.')[-1]}.json"
-            self.save(scope, file_name, create)
+            self.save(scope, file_name)
 
-    def save(self, scope: str, file_name: str, create: bool = False) -> None:
+    def save(self, scope: str, file_name: str) -> None:
+        """
+        Schedule writing the scoped config. The file is written atomically on the writer thread,
+        call `flush` to write it right away
+        """
         # Because all "root" configurations are stored in the multiple files
         parent_scope = scope
         if Scope.Root not in scope:
@@ -103,7 +200,7 @@ class ConfigRegistryClass(BaseRegistry):
 
         parent_scoped_data = self._configuration[parent_scope]
         plugin_directory = parent_scoped_data[ProtectedKey.Folder]
-        config_data = copy.deepcopy(self._configuration[scope])
+        config_data = self._configuration[scope]
         config_file = plugin_directory / file_name
         updated_config_data = {}
         for key, value in config_data.items():
@@ -120,9 +217,17 @@ class ConfigRegistryClass(BaseRegistry):
 
         logger.debug(f"Saving config file {config_file!s}")
         logger.debug(updated_config_data)
-        if plugin_directory.exists() is False:
-            plugin_directory.mkdir()
-        write_json(config_file, updated_config_data, create)
+        self._config_writer.write(config_file, updated_config_data)
+
+    def flush(self) -> None:
+        """
+        Write the scheduled config files
+        """
+        self._config_writer.flush()
+
+    def destroy(self) -> None:
+        if self._config_writer is not None:
+            self._config_writer.close()
 
 
 ConfigRegistry = ConfigRegistryClass()
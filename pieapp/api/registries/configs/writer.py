@@ -0,0 +1,152 @@
+"""
+Write-behind writer of the config files.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Callable, Union
+
+
+def write_file_atomic(file: Path, text: str) -> None:
+    """
+    Write the temporary file and replace the file with it,
+    so a crash in the middle of writing never leaves a truncated file
+    """
+    file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = file.with_name(f".{file.name}.tmp")
+    with open(temp_file, "w", encoding="utf-8") as output:
+        output.write(text)
+        output.flush()
+        os.fsync(output.fileno())
+
+    os.replace(temp_file, file)
+
+
+def get_write_deadline(now: float, first_write_time: float, delay: float, max_delay: float) -> float:
+    """
+    Get the time to write the pending files. Every write pushes the deadline back by `delay`,
+    but not later than `max_delay` after the first pending write
+
+    Args:
+        now (float): time of the write
+        first_write_time (float): time of the first pending write
+        delay (float): debounce delay
+        max_delay (float): maximum delay of the first pending write
+    """
+    return min(now + delay, first_write_time + max_delay)
+
+
+class ConfigWriter:
+    """
+    Writes the config files on a single background thread.
+
+    Files are written `delay` seconds after the last write, every write pushes the deadline back.
+    Continuous writes are written once per `max_delay` seconds at most, so they aren't postponed forever.
+    Writes of the same file are coalesced, only the latest data is written.
+    The data is serialized in the caller's thread, so it can be changed right after the `write` call
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.5,
+        max_delay: float = None,
+        on_error: Callable[[Path, OSError], None] = None
+    ) -> None:
+        self._delay = delay
+        self._max_delay = max(delay, max_delay if max_delay is not None else delay * 4)
+        self._on_error = on_error
+
+        # <file>: <serialized data>
+        self._pending: dict[Path, str] = {}
+        # Time of the first pending write and the time to write the pending files
+        self._first_write_time: Union[float, None] = None
+        self._deadline: Union[float, None] = None
+        self._condition = threading.Condition()
+        # Held while the files are written, so the older data never overwrites the newer one
+        self._write_lock = threading.Lock()
+        self._thread: Union[threading.Thread, None] = None
+        self._is_closed = False
+
+    @property
+    def pending_files(self) -> list[Path]:
+        with self._condition:
+            return list(self._pending)
+
+    def write(self, file: Path, data: Any) -> None:
+        """
+        Schedule writing the JSON data
+
+        Args:
+            file (pathlib.Path): Config file
+            data (Any): JSON serializable data
+        """
+        text = json.dumps(data, sort_keys=False, indent=4, ensure_ascii=False)
+        with self._condition:
+            self._pending[file] = text
+            now = time.monotonic()
+            if self._first_write_time is None:
+                self._first_write_time = now
+            self._deadline = get_write_deadline(now, self._first_write_time, self._delay, self._max_delay)
+
+            if not self._is_closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="ConfigWriter", daemon=True)
+                    self._thread.start()
+
+                self._condition.notify()
+                return
+
+        # The writer is closed, nothing is left to write it later
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the pending files in the caller's thread
+        """
+        with self._write_lock:
+            with self._condition:
+                pending = self._pending
+                self._pending = {}
+                self._first_write_time = None
+                self._deadline = None
+
+            self._write(pending)
+
+    def close(self) -> None:
+        """
+        Write the pending files and stop the writer thread
+        """
+        with self._condition:
+            self._is_closed = True
+            thread = self._thread
+            self._thread = None
+            self._condition.notify()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._is_closed and (self._deadline is None or time.monotonic() < self._deadline):
+                    timeout = None if self._deadline is None else self._deadline - time.monotonic()
+                    self._condition.wait(timeout)
+
+                if self._is_closed:
+                    return
+
+            self.flush()
+
+    def _write(self, pending: dict[Path, str]) -> None:
+        for file, text in pending.items():
+            try:
+                write_file_atomic(file, text)
+            except OSError as e:
+                if self._on_error is not None:
+                    self._on_error(file, e)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Union
 
 from pieapp.api.globals import Global
 from pieapp.api.utils.files import read_json
@@ -16,8 +17,7 @@ class LocalesRegistryClass(BaseRegistry, ConfigAccessorMixin):
         self._translations: dict[str, dict[str, str]] = {}
 
         self.load_app_locales()
-        self.load_plugins_locales(Global.APP_ROOT / Global.PLUGINS_DIR_NAME)
-        self.load_plugins_locales(Global.USER_ROOT / Global.PLUGINS_DIR_NAME)
+        # Plugin locales are read by the `PluginRegistry` along with the plugins
 
     def load_app_locales(self) -> None:
         # Read app/user configuration
@@ -26,14 +26,21 @@ class LocalesRegistryClass(BaseRegistry, ConfigAccessorMixin):
 
     def load_plugins_locales(self, plugins_folder: Path) -> None:
         for plugin_folder in plugins_folder.iterdir():
-            file = plugin_folder / Global.LOCALES_DIR / f"{self._locale}.json"
-            if not file.exists():
-                continue
+            self.update_plugin_locales(plugin_folder.name, self.read_plugin_locales(plugin_folder))
 
-            if not self._translations.get(file.name):
-                self._translations[plugin_folder.name] = {}
+    def read_plugin_locales(self, plugin_folder: Path) -> Union[dict[str, str], None]:
+        """
+        Read translations of the plugin folder. Doesn't change the translations, so it can be called from any thread
+        """
+        file = plugin_folder / Global.LOCALES_DIR / f"{self._locale}.json"
+        if not file.exists():
+            return None
 
-            self._translations[plugin_folder.name].update(**read_json(file))
+        return read_json(file)
+
+    def update_plugin_locales(self, plugin_name: str, translations: Union[dict[str, str], None]) -> None:
+        if translations is not None:
+            self._translations[plugin_name] = {**translations}
 
     def get(self, scope: str, key: str) -> str:
         if scope not in self._translations:
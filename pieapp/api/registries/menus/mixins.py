@@ -4,6 +4,7 @@ from PySide6.QtGui import QIcon
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QWidget
 
+from pieapp.api.plugins.manifest import get_trigger_method
 from pieapp.api.registries.menus.registry import MenuRegistry
 from pieapp.widgets.menus import PieMenu
 from pieapp.widgets.menus import PieMenuBar
@@ -47,7 +48,14 @@ class MenuAccessorMixin:
         index: Union[int] = None
     ) -> QAction:
         menu_instance: PieMenu = MenuRegistry.get_menu(scope, menu)
-        menu_instance.add_menu_item(name, text, triggered, icon, before, after, index)
+
+        # Items triggering the plugin methods are recorded in the plugin manifest
+        method = get_trigger_method(self, triggered)
+        menu_instance.add_menu_item(
+            name, text, triggered, icon, before, after, index,
+            plugin=self.name if method else None,
+            method=method
+        )
         return MenuRegistry.add_menu_item(scope or Scope.Shared, menu, name, menu_instance)
 
     def get_menu(self, scope: str, name: str) -> PieMenu:
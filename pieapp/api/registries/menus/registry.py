@@ -71,6 +71,12 @@ class MenuRegistryClass(BaseRegistry):
 
         return item
 
+    def get_menus(self) -> list[tuple[str, PieMenu]]:
+        """
+        Get scopes and menus of all registered menus
+        """
+        return [(scope, menu) for (scope, menus) in self._menus.items() for menu in menus.values()]
+
     def get_menu(self, scope: str, name: str) -> QMenu:
         if scope not in self._menus:
             raise PieError(f"Section {scope} doesn't exist")
@@ -1,6 +1,7 @@
 from typing import Type
 
 from pieapp.api.utils.logger import logger
+from pieapp.api.utils.tracer import Tracer
 from pieapp.api.utils.modules import import_by_string
 from pieapp.api.registries.base import BaseRegistry
 
@@ -22,16 +23,18 @@ class _RegistryContainer:
         registry_instance = registry_class()
         self._registries[registry_instance.name] = registry_instance
         logger.debug(f"Initializing \"{registry_instance.__class__.__name__}\"")
-        registry_instance.init()
+        with Tracer.span(registry_instance.__class__.__name__, "registry"):
+            registry_instance.init()
 
     def init_from_string(self, import_string: str) -> None:
         """
         Initialize registry from import string
         """
-        registry_instance = import_by_string(import_string)
-        self._registries[registry_instance.name] = registry_instance
-        logger.debug(f"Initializing \"{registry_instance.__class__.__name__}\"")
-        registry_instance.init()
+        with Tracer.span(import_string.split(".")[-1], "registry"):
+            registry_instance = import_by_string(import_string)
+            self._registries[registry_instance.name] = registry_instance
+            logger.debug(f"Initializing \"{registry_instance.__class__.__name__}\"")
+            registry_instance.init()
 
     def shutdown(self, *registries: tuple[BaseRegistry], all_registries: bool = False):
         registries = reversed(self._registries.keys()) if all_registries else registries
@@ -2,6 +2,7 @@ from PySide6.QtCore import QObject
 from PySide6.QtGui import QShortcut, QKeySequence
 
 from pieapp.api.exceptions import PieError
+from pieapp.api.plugins.manifest import get_trigger_method
 from pieapp.api.models.shortcuts import ShortcutDict
 from pieapp.api.registries.shortcuts.registry import ShortcutRegistry
 
@@ -19,13 +20,20 @@ class ShortcutAccessorMixin:
         hidden: bool = False
     ) -> None:
         name = f"{self.__class__.__name__}.{name}"
-        if ShortcutRegistry.contains(name):
+        if ShortcutRegistry.contains(name) and not ShortcutRegistry.is_deferred(name):
             raise PieError(f"Shortcut \"{name}/{shortcut}\" is already registered")
 
         shortcut_instance = QShortcut(QKeySequence(shortcut), target)
         shortcut_instance.activated.connect(triggered)
         target_name: str = getattr(target, "name", target.__class__.__name__)
-        ShortcutRegistry.add(name, shortcut_instance, target_name, title, shortcut, description, hidden)
+
+        # Shortcuts triggering the plugin methods are recorded in the plugin manifest
+        method = get_trigger_method(self, triggered)
+        ShortcutRegistry.add(
+            name, shortcut_instance, target_name, title, shortcut, description, hidden,
+            plugin=self.name if method else None,
+            method=method
+        )
 
     def remove_shortcut(self, shortcut_name: str) -> None:
         ShortcutRegistry.remove(f"{self.__class__.__name__}.{shortcut_name}")
@@ -20,7 +20,8 @@ class ShortcutRegistryClass(BaseRegistry):
         return self._shortcuts[name]["shortcut"]
 
     def add(self, name: str, shortcut: QShortcut, target: str,
-            title: str, shortcut_key: str, description: str, hidden: bool) -> None:
+            title: str, shortcut_key: str, description: str, hidden: bool,
+            plugin: str = None, method: str = None, deferred: bool = False) -> None:
         """
         Register a shortcut for given target
 
@@ -30,9 +31,16 @@ class ShortcutRegistryClass(BaseRegistry):
             target (str): Target
             title (str): Shortcut title
             description (str): Shortcut description
+            plugin (str): Plugin which method the shortcut triggers
+            method (str): Plugin method name
+            deferred (bool): Shortcut stands in for the deferred plugin. It's replaced when the plugin is loaded
         """
         if name in self._shortcuts:
-            raise KeyError(f"Shortcut \"{name}\" for target \"{target}\" is already registered")
+            if not self._shortcuts[name]["deferred"]:
+                raise KeyError(f"Shortcut \"{name}\" for target \"{target}\" is already registered")
+
+            self._shortcuts[name]["shortcut"].setEnabled(False)
+            self._shortcuts[name]["shortcut"].deleteLater()
 
         self._shortcuts[name] = {
             "shortcut": shortcut,
@@ -40,7 +48,10 @@ class ShortcutRegistryClass(BaseRegistry):
             "shortcut_key": shortcut_key,
             "title": title,
             "description": description,
-            "hidden": hidden
+            "hidden": hidden,
+            "plugin": plugin,
+            "method": method,
+            "deferred": deferred
         }
 
     def remove(self, name: str) -> None:
@@ -52,6 +63,9 @@ class ShortcutRegistryClass(BaseRegistry):
     def contains(self, name: str) -> bool:
         return name in self._shortcuts
 
+    def is_deferred(self, name: str) -> bool:
+        return name in self._shortcuts and self._shortcuts[name]["deferred"]
+
     def items(self, *args, **kwargs) -> Any:
         return self._shortcuts.items()
 
@@ -0,0 +1,274 @@
+"""
+Bounded history of the snapshot versions.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+import sys
+import dataclasses as dt
+from typing import Any, Iterator, Union
+
+from pieapp.api.converter.models import MediaFile, replace_field
+
+
+def get_delta(previous: Any, current: Any, prefix: str = "") -> dict[str, Any]:
+    """
+    Get changed fields of the `current` dataclass as `<dotted field path>: <value>`.
+    Shared (unchanged) models are skipped without comparing their fields
+    """
+    delta = {}
+    for field in dt.fields(current):
+        previous_value = getattr(previous, field.name)
+        current_value = getattr(current, field.name)
+        if previous_value is current_value:
+            continue
+
+        field_path = f"{prefix}{field.name}"
+        if (
+            dt.is_dataclass(previous_value)
+            and dt.is_dataclass(current_value)
+            and type(previous_value) is type(current_value)
+        ):
+            delta.update(get_delta(previous_value, current_value, f"{field_path}."))
+        elif previous_value != current_value:
+            delta[field_path] = current_value
+
+    return delta
+
+
+def apply_delta(media_file: MediaFile, delta: dict[str, Any]) -> MediaFile:
+    for field_path, value in delta.items():
+        media_file = replace_field(media_file, field_path, value)
+
+    return media_file
+
+
+def get_size(value: Any, seen: set[int] = None) -> int:
+    """
+    Approximate size of the value in bytes. Shared objects are counted once
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if dt.is_dataclass(value):
+        size += sum(get_size(getattr(value, i.name), seen) for i in dt.fields(value))
+    elif isinstance(value, dict):
+        size += sum(get_size(k, seen) + get_size(v, seen) for (k, v) in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(get_size(i, seen) for i in value)
+
+    return size
+
+
+@dt.dataclass(slots=True)
+class HistoryEntry:
+    # Full version for keyframes, changed fields for deltas
+    value: Union[MediaFile, dict[str, Any]]
+    is_keyframe: bool
+    size: int
+
+
+class SnapshotHistory:
+    """
+    List-like history of the snapshot versions.
+
+    Every `keyframe_interval`-th version, and every version of another media file,
+    is stored as is, the rest are stored as field deltas against the previous version.
+    Getting a version applies `keyframe_interval - 1` deltas at most.
+
+    When the history is bigger than `max_count` versions or `max_size` bytes,
+    the oldest versions are evicted
+    """
+
+    def __init__(self, max_count: int = None, max_size: int = None, keyframe_interval: int = 16) -> None:
+        self._max_count = max_count
+        self._max_size = max_size
+        self._keyframe_interval = max(1, keyframe_interval)
+
+        self._entries: list[HistoryEntry] = []
+        self._size: int = 0
+        # Last version, so the next delta is built without reconstruction
+        self._last_version: Union[MediaFile, None] = None
+        # Count of versions since the last keyframe
+        self._deltas_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return len(self._entries) > 0
+
+    def __iter__(self) -> Iterator[MediaFile]:
+        version = None
+        for entry in self._entries:
+            version = entry.value if entry.is_keyframe else apply_delta(version, entry.value)
+            yield version
+
+    def __contains__(self, media_file: MediaFile) -> bool:
+        return any(media_file == i for i in self)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[MediaFile, list[MediaFile]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        index = self._get_entry_index(index)
+        if index == len(self._entries) - 1:
+            return self._last_version
+
+        keyframe_index = index
+        while not self._entries[keyframe_index].is_keyframe:
+            keyframe_index -= 1
+
+        version = self._entries[keyframe_index].value
+        for entry in self._entries[keyframe_index + 1:index + 1]:
+            version = apply_delta(version, entry.value)
+
+        return version
+
+    def __setitem__(self, index: int, media_file: MediaFile) -> None:
+        """
+        Replace the version in place. Only its entry and the delta of the next version are re-encoded
+        """
+        index = self._get_entry_index(index)
+        previous = self[index - 1] if index > 0 else None
+        next_version = self[index + 1] if index + 1 < len(self._entries) else None
+
+        self._replace_entry(index, media_file, previous, self._entries[index].is_keyframe)
+        if next_version is None:
+            self._last_version = media_file
+        elif not self._entries[index + 1].is_keyframe:
+            self._replace_entry(index + 1, next_version, media_file)
+
+        self._update_deltas_count()
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if not isinstance(index, slice):
+            index = self._get_entry_index(index)
+            self._delete_entries(index, index + 1)
+            return
+
+        start, stop, step = index.indices(len(self._entries))
+        if step == 1:
+            if start < stop:
+                self._delete_entries(start, stop)
+            return
+
+        for entry_index in sorted(range(start, stop, step), reverse=True):
+            self._delete_entries(entry_index, entry_index + 1)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def is_last(self, media_file: MediaFile) -> bool:
+        """
+        Check if the media file is the same as the last version, not counting the generation
+        """
+        last_version = self._last_version
+        if last_version is None:
+            return False
+
+        return dt.replace(media_file, generation=last_version.generation) == last_version
+
+    def append(self, media_file: MediaFile) -> int:
+        """
+        Add a new version
+
+        Returns:
+            Count of evicted oldest versions
+        """
+        previous = self._last_version
+        if (
+            previous is None
+            or previous.name != media_file.name
+            or self._deltas_count + 1 >= self._keyframe_interval
+        ):
+            entry = HistoryEntry(media_file, True, get_size(media_file))
+            self._deltas_count = 0
+        else:
+            delta = get_delta(previous, media_file)
+            entry = HistoryEntry(delta, False, get_size(delta))
+            self._deltas_count += 1
+
+        self._entries.append(entry)
+        self._size += entry.size
+        self._last_version = media_file
+        return self._evict()
+
+    def clear(self) -> None:
+        self._entries = []
+        self._size = 0
+        self._last_version = None
+        self._deltas_count = 0
+
+    def _evict(self) -> int:
+        evicted = 0
+        while len(self._entries) > 1 and (
+            (self._max_count is not None and len(self._entries) > self._max_count)
+            or (self._max_size is not None and self._size > self._max_size)
+        ):
+            oldest = self._entries.pop(0)
+            self._size -= oldest.size
+            evicted += 1
+            # The next version becomes a keyframe
+            next_entry = self._entries[0]
+            if not next_entry.is_keyframe:
+                version = apply_delta(oldest.value, next_entry.value)
+                self._size -= next_entry.size
+                self._entries[0] = HistoryEntry(version, True, get_size(version))
+                self._size += self._entries[0].size
+
+        return evicted
+
+    def _get_entry_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._entries)
+        if not 0 <= index < len(self._entries):
+            raise IndexError(index)
+
+        return index
+
+    def _replace_entry(
+        self,
+        index: int,
+        version: MediaFile,
+        previous: Union[MediaFile, None],
+        is_keyframe: bool = False
+    ) -> None:
+        """
+        Encode the version against the previous one. The first version of the history
+        or of another media file is stored as a keyframe
+        """
+        if is_keyframe or previous is None or previous.name != version.name:
+            entry = HistoryEntry(version, True, get_size(version))
+        else:
+            delta = get_delta(previous, version)
+            entry = HistoryEntry(delta, False, get_size(delta))
+
+        self._size += entry.size - self._entries[index].size
+        self._entries[index] = entry
+
+    def _delete_entries(self, start: int, stop: int) -> None:
+        """
+        Delete the entries and re-encode the delta of the version after them
+        """
+        previous = self[start - 1] if start > 0 else None
+        next_version = self[stop] if stop < len(self._entries) else None
+
+        self._size -= sum(i.size for i in self._entries[start:stop])
+        del self._entries[start:stop]
+        if next_version is None:
+            self._last_version = previous
+        elif not self._entries[start].is_keyframe:
+            self._replace_entry(start, next_version, previous)
+
+        self._update_deltas_count()
+
+    def _update_deltas_count(self) -> None:
+        self._deltas_count = 0
+        for entry in reversed(self._entries):
+            if entry.is_keyframe:
+                break
+            self._deltas_count += 1
@@ -0,0 +1,200 @@
+"""
+Write-ahead journal of the snapshot operations.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+import os
+import json
+import time
+import datetime
+import dataclasses as dt
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+from pieapp.api.utils.logger import logger
+from pieapp.api.converter.models import AlbumCover, Codec, FileInfo, Metadata, MediaFile
+from pieapp.api.registries.snapshots.history import apply_delta, get_delta
+
+# Models that can be written into the journal: <model name>: <model>
+JOURNAL_MODELS: dict[str, type] = {i.__name__: i for i in (AlbumCover, Codec, FileInfo, Metadata, MediaFile)}
+
+
+@dt.dataclass(frozen=True, slots=True, eq=False)
+class JournalOperation:
+    Add = "add"
+    Update = "update"
+    Replace = "replace"
+    Remove = "remove"
+    Restore = "restore"
+    GlobalAdd = "global_add"
+    GlobalSync = "global_sync"
+    GlobalShift = "global_shift"
+    GlobalRemove = "global_remove"
+    GlobalRestore = "global_restore"
+    InnerSync = "inner_sync"
+    # Full state of the file history or global history written by the compactor
+    Checkpoint = "checkpoint"
+    GlobalCheckpoint = "global_checkpoint"
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert value to JSON. Models, paths and dates are tagged to be decoded back
+    """
+    if dt.is_dataclass(value):
+        fields = {i.name: encode_value(getattr(value, i.name)) for i in dt.fields(value)}
+        return {"$model": type(value).__name__, "fields": fields}
+    if isinstance(value, Path):
+        return {"$path": value.as_posix()}
+    if isinstance(value, datetime.date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, dict):
+        return {key: encode_value(i) for (key, i) in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(i) for i in value]
+
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode_value(i) for i in value]
+    if not isinstance(value, dict):
+        return value
+
+    if "$model" in value:
+        fields = {key: decode_value(i) for (key, i) in value["fields"].items()}
+        return JOURNAL_MODELS[value["$model"]](**fields)
+    if "$path" in value:
+        return Path(value["$path"])
+    if "$date" in value:
+        return datetime.date.fromisoformat(value["$date"])
+
+    return {key: decode_value(i) for (key, i) in value.items()}
+
+
+class SnapshotJournal:
+    """
+    Append-only JSON lines journal.
+
+    Every record is flushed to the OS right away, so it survives the application crash.
+    `fsync` is called once per `sync_count` records or `sync_interval` seconds,
+    so a power loss drops the last batch at most
+    """
+
+    def __init__(self, journal_file: Path, sync_count: int = 64, sync_interval: float = 1.0) -> None:
+        self._journal_file = Path(journal_file)
+        self._sync_count = max(1, sync_count)
+        self._sync_interval = sync_interval
+
+        self._file = None
+        self._records_count: int = 0
+        self._unsynced_count: int = 0
+        self._last_sync_time: float = time.monotonic()
+
+    @property
+    def journal_file(self) -> Path:
+        return self._journal_file
+
+    @property
+    def records_count(self) -> int:
+        return self._records_count
+
+    def open(self) -> None:
+        if self._file is None:
+            if self._journal_file.exists():
+                with open(self._journal_file, "r", encoding="utf-8") as file:
+                    self._records_count = sum(1 for _ in file)
+            self._file = open(self._journal_file, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def write(self, operation: str, **fields: Any) -> None:
+        if self._file is None:
+            return
+
+        record = {"op": operation, **{key: encode_value(value) for (key, value) in fields.items()}}
+        self._file.write(f"{json.dumps(record, ensure_ascii=False, separators=(',', ':'))}\n")
+        self._file.flush()
+        self._records_count += 1
+        self._unsynced_count += 1
+        if (
+            self._unsynced_count >= self._sync_count
+            or time.monotonic() - self._last_sync_time >= self._sync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        if self._file is not None and self._unsynced_count > 0:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+        self._unsynced_count = 0
+        self._last_sync_time = time.monotonic()
+
+    def read(self) -> Iterator[dict[str, Any]]:
+        """
+        Read decoded records. Reading stops at the first broken record,
+        which is the last one written before the crash
+        """
+        if not self._journal_file.exists():
+            return
+
+        with open(self._journal_file, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                try:
+                    record = json.loads(line)
+                    yield {key: decode_value(value) for (key, value) in record.items()}
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.debug(f"Journal {self._journal_file.name} is broken at line {line_number}: {e!s}")
+                    return
+
+    def compact(self, records: list[dict[str, Any]]) -> None:
+        """
+        Atomically replace journal contents with the given records
+        """
+        is_opened = self._file is not None
+        self.close()
+
+        temp_file = self._journal_file.with_name(f".{self._journal_file.name}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as file:
+            for record in records:
+                record = {key: encode_value(value) for (key, value) in record.items()}
+                file.write(f"{json.dumps(record, ensure_ascii=False, separators=(',', ':'))}\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_file, self._journal_file)
+        self._records_count = len(records)
+        if is_opened:
+            self._file = open(self._journal_file, "a", encoding="utf-8")
+
+
+def encode_versions(versions: list[MediaFile]) -> list[Union[MediaFile, dict[str, Any]]]:
+    """
+    Encode versions as full versions of the files and deltas between the next versions of the same file
+    """
+    encoded_versions = []
+    previous = None
+    for version in versions:
+        if previous is None or previous.name != version.name:
+            encoded_versions.append(version)
+        else:
+            encoded_versions.append(get_delta(previous, version))
+        previous = version
+
+    return encoded_versions
+
+
+def decode_versions(encoded_versions: list[Union[MediaFile, dict[str, Any]]]) -> list[MediaFile]:
+    versions = []
+    for version in encoded_versions:
+        if isinstance(version, dict):
+            version = apply_delta(versions[-1], version)
+        versions.append(version)
+
+    return versions
@@ -1,17 +1,45 @@
-from typing import Union, Any
+from typing import Union, Any, Iterable, Iterator
+from contextlib import contextmanager
 
+import dataclasses as dt
+
+from pathlib import Path
 from PySide6.QtCore import QObject, Signal
+from __feature__ import snake_case
 
 from pieapp.api.utils.logger import logger
 from pieapp.api.exceptions import PieError
 from pieapp.api.registries.base import BaseRegistry
 from pieapp.api.registries.sysregs import SysRegistry
 
+from pieapp.api.models.scopes import Scope
 from pieapp.api.models.indexes import Index
 from pieapp.api.converter.models import MediaFile
-
-
-class SnapshotRegistryClass(QObject, BaseRegistry):
+from pieapp.api.registries.configs.mixins import ConfigAccessorMixin
+from pieapp.api.registries.snapshots.history import SnapshotHistory
+from pieapp.api.registries.snapshots.history import apply_delta, get_delta
+from pieapp.api.registries.snapshots.journal import SnapshotJournal
+from pieapp.api.registries.snapshots.journal import JournalOperation
+from pieapp.api.registries.snapshots.journal import encode_versions, decode_versions
+from pieapp.api.registries.snapshots.storage import SnapshotStorage
+from pieapp.api.registries.snapshots.search import SearchIndex, get_search_text
+
+
+@dt.dataclass(frozen=True, slots=True)
+class SnapshotLimits:
+    """
+    History and journal limits. Read from `config.snapshots` of the user config
+    """
+    max_history_count: int = 256
+    max_history_size: int = 8 * 1024 * 1024
+    keyframe_interval: int = 16
+    journal_sync_count: int = 64
+    journal_sync_interval: float = 1.0
+    # Journal is compacted when it has more records than this or 4 records per file
+    journal_compact_size: int = 4096
+
+
+class SnapshotRegistryClass(QObject, BaseRegistry, ConfigAccessorMixin):
     name = SysRegistry.Snapshots
 
     # Emit on snapshot created
@@ -26,6 +54,9 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
     # Emit on inner snapshots registry restored
     sig_snapshots_restored = Signal()
 
+    # Emit once per batch instead of the signals above: created, modified and deleted snapshots
+    sig_snapshots_batch_updated = Signal(list, list, list)
+
     # Global snapshots
 
     # Emit on snapshot created
@@ -40,31 +71,57 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
     # Emit on global snapshots registry cleared
     sig_global_snapshot_restored = Signal()
 
-    def init(self) -> None:
-        # List of MediaFile models
-        self._inner_snapshots: list = []
+    def init(self, limits: SnapshotLimits = None) -> None:
+        # History and journal limits. Oldest versions are evicted first
+        self._limits = limits or self.load_limits()
 
-        # List of snapshot names
-        self.inner_snapshots_keys: list[str] = []
+        # <media file name>: <history of MediaFile models>
+        self._inner_snapshots = SnapshotStorage()
 
         # <media file name>: <index of the version>
         self._inner_snapshot_indexes: dict[str, int] = {}
 
-        # List of global snapshots
-        self._global_snapshots: list[MediaFile] = []
+        # History of global snapshots
+        self._global_snapshots: SnapshotHistory = self.create_history()
 
         # Current global snapshot index
         self._global_snapshots_index: int = 0
 
-        # Dictionary of local snapshots: <scope name>: <list of MediaFile models>
-        self._local_snapshots: dict[str, list[MediaFile]] = {}
+        # Dictionary of local snapshots: <scope name>: <history of MediaFile models>
+        self._local_snapshots: dict[str, SnapshotHistory] = {}
 
         # Dictionary of current local snapshot index: <scope name>: <current index>
         self._local_snapshots_index: dict[str, int] = {}
 
+        # Search index of the current versions
+        self._search_index = SearchIndex()
+
+        # Nesting depth of the batch update and snapshots collected during the batch
+        self._batch_depth: int = 0
+        self._batch_created: list[MediaFile] = []
+        self._batch_modified: list[MediaFile] = []
+        self._batch_deleted: list[MediaFile] = []
+
+        # Journal of the session. Local snapshots aren't written, they're not applied yet
+        self._journal: Union[SnapshotJournal, None] = None
+
+    def load_limits(self) -> SnapshotLimits:
+        return SnapshotLimits(**{
+            i.name: self.get_app_config(f"config.snapshots.{i.name}", Scope.User, i.default)
+            for i in dt.fields(SnapshotLimits)
+        })
+
+    def create_history(self) -> SnapshotHistory:
+        return SnapshotHistory(
+            max_count=self._limits.max_history_count,
+            max_size=self._limits.max_history_size,
+            keyframe_interval=self._limits.keyframe_interval
+        )
+
     # Global snapshots methods
 
     def add_global_snapshot(self, media_file: MediaFile) -> MediaFile:
+        self._write_journal(JournalOperation.GlobalAdd, **self._encode_snapshot(media_file))
         self._global_snapshots.append(media_file)
         self._global_snapshots_index = len(self._global_snapshots) - 1
         logger.debug(f"File {media_file.name} added")
@@ -84,6 +141,7 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
         """
         Update global_snapshot_index by shifting it
         """
+        self._write_journal(JournalOperation.GlobalShift, shift=shift)
         snapshots = self._global_snapshots
         global_index = self._global_snapshots_index + shift
         if global_index < 0:
@@ -102,11 +160,13 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
         return snapshots[global_index], is_array_end
 
     def remove_global_snapshot(self, index: int):
+        self._write_journal(JournalOperation.GlobalRemove, index=index)
         del self._global_snapshots[index]
         self.sig_global_snapshot_deleted.emit(index)
 
     def restore_global_snapshots(self) -> None:
-        self._global_snapshots = []
+        self._write_journal(JournalOperation.GlobalRestore)
+        self._global_snapshots = self.create_history()
         self._global_snapshots_index = 0
         self.sig_global_snapshot_restored.emit()
 
@@ -123,7 +183,7 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
 
     def add_local_snapshot(self, name: str, media_file: MediaFile) -> MediaFile:
         if name not in self._local_snapshots:
-            self._local_snapshots[name] = []
+            self._local_snapshots[name] = self.create_history()
 
         self._local_snapshots[name].append(media_file)
         self._local_snapshots_index[name] = len(self._local_snapshots[name]) - 1
@@ -151,9 +211,22 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
 
         return snapshots[local_index], is_array_end
 
+    def replace_local_snapshot(self, name: str, index: int, media_file: MediaFile) -> None:
+        """
+        Replace local snapshot version without adding a new one
+        """
+        try:
+            self._local_snapshots[name][index] = media_file
+        except (KeyError, IndexError):
+            pass
+
     def contains_local(self, name: str, media_file: MediaFile = None) -> bool:
+        """
+        Check if the local snapshots exist, or if `media_file` is the same as the last local snapshot.
+        New versions are built from the last one, so the older versions aren't compared
+        """
         if media_file:
-            return media_file in self._local_snapshots[name]
+            return self._local_snapshots[name].is_last(media_file)
         return name in self._local_snapshots
 
     def restore_local_snapshots(self, name: str = None) -> None:
@@ -161,7 +234,7 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
             self._local_snapshots = {}
             self._local_snapshots_index = {}
         else:
-            self._local_snapshots[name] = []
+            self._local_snapshots[name] = self.create_history()
             self._local_snapshots_index[name] = 0
 
     # Sync methods
@@ -173,26 +246,32 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
     def sync_local_to_global(self, media_file_name: str) -> None:
         local_index = self._local_snapshots_index[media_file_name]
         local_snapshot = self._local_snapshots[media_file_name][local_index]
-        self._global_snapshots.append(local_snapshot)
+        self._sync_to_global(local_snapshot)
+        logger.debug("Local synced with global")
+
+    def _sync_to_global(self, media_file: MediaFile) -> None:
+        self._write_journal(JournalOperation.GlobalSync, **self._encode_snapshot(media_file))
+        evicted = self._global_snapshots.append(media_file)
         if self._global_snapshots_index > 0:
-            self._global_snapshots_index += 1
+            self._global_snapshots_index = max(0, self._global_snapshots_index + 1 - evicted)
 
-        self.sig_global_snapshot_modified.emit(local_snapshot)
-        logger.debug("Local synced with global")
+        self.sig_global_snapshot_modified.emit(media_file)
 
     def sync_global_to_inner(self) -> None:
         if not self._global_snapshots:
             logger.debug(f"{len(self._global_snapshots)=}")
             return
 
+        self._write_journal(JournalOperation.InnerSync)
         global_index = self._global_snapshots_index
         global_snapshot = self._global_snapshots[global_index]
 
-        inner_index = self.inner_snapshots_keys.index(global_snapshot.name)
-        self._inner_snapshots[inner_index].append(global_snapshot)
-        self._inner_snapshot_indexes[global_snapshot.name] = len(self._inner_snapshots[inner_index]) - 1
+        snapshots = self._inner_snapshots[global_snapshot.name]
+        snapshots.append(global_snapshot)
+        self._inner_snapshot_indexes[global_snapshot.name] = len(snapshots) - 1
+        self._update_search_index(global_snapshot.name)
 
-        self.sig_snapshot_modified.emit(global_snapshot)
+        self._emit_snapshot_modified(global_snapshot)
         logger.debug("Global synced with inner")
 
     # Snapshot versions
@@ -201,25 +280,29 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
         """
         Add new record into registry
         """
-        if media_file.name not in self.inner_snapshots_keys:
-            self._inner_snapshots.append([media_file])
+        if media_file.name not in self._inner_snapshots:
+            self._write_journal(JournalOperation.Add, media_file=media_file)
+            snapshots = self.create_history()
+            snapshots.append(media_file)
+            self._inner_snapshots.add(media_file.name, snapshots)
             self._inner_snapshot_indexes[media_file.name] = 0
-            self.inner_snapshots_keys.append(media_file.name)
+            self._update_search_index(media_file.name)
         else:
             raise PieError(f"File {media_file.name} is already exists")
 
-        self.sig_snapshot_created.emit(media_file)
+        if self._batch_depth:
+            self._batch_created.append(media_file)
+        else:
+            self.sig_snapshot_created.emit(media_file)
         logger.debug(f"File {media_file.name} added")
 
     def get(self, name: str, version: int = None) -> Union[list[MediaFile], MediaFile]:
         logger.debug(f"Snapshot {name}:{version}")
-        logger.debug(self.inner_snapshots_keys)
-        if name not in self.inner_snapshots_keys:
+        snapshots = self._inner_snapshots.get(name)
+        if snapshots is None:
             return
             # raise PieException(f"File with \"{name}\" was not found")
 
-        index = self.inner_snapshots_keys.index(name)
-        snapshots = self._inner_snapshots[index]
         if version:
             return snapshots[version]
         else:
@@ -228,53 +311,94 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
 
     def update(self, name: str, new_media_file: MediaFile, version: int = None) -> None:
         logger.debug(f"Snapshot {name} was updated to {new_media_file}:{version}")
-        if name not in self.inner_snapshots_keys:
+        snapshots = self._inner_snapshots.get(name)
+        if snapshots is None:
             return
             # raise PieException(f"File with \"{name}\" was not found")
 
-        index = self.inner_snapshots_keys.index(name)
-        snapshots = self._inner_snapshots[index]
+        self._write_journal(JournalOperation.Update, version=version, **self._encode_snapshot(new_media_file))
         if version:
             snapshots[version] = new_media_file
         else:
-            snapshots.append(new_media_file)
+            evicted = snapshots.append(new_media_file)
+            self._inner_snapshot_indexes[name] = max(0, self._inner_snapshot_indexes[name] - evicted)
 
-        self.sig_snapshot_modified.emit(new_media_file)
+        self._update_search_index(name)
+        self._emit_snapshot_modified(new_media_file)
+
+    def replace(self, name: str, media_file: MediaFile) -> None:
+        """
+        Replace the current snapshot version without adding a new one.
+        Used to fill fields that aren't user edits, like probe results
+        """
+        snapshots = self._inner_snapshots.get(name)
+        if snapshots is None:
+            return
+
+        self._write_journal(JournalOperation.Replace, **self._encode_snapshot(media_file))
+        snapshots[self._inner_snapshot_indexes[name]] = media_file
+        self._update_search_index(name)
 
     def remove(self, name: str, version: int = None) -> None:
         logger.debug(f"Removing snapshot {name}:{version}")
-        if name not in self.inner_snapshots_keys:
+        snapshots = self._inner_snapshots.get(name)
+        if snapshots is None:
             return
 
-        index = self.inner_snapshots_keys.index(name)
-        snapshots = self._inner_snapshots[index]
+        self._write_journal(JournalOperation.Remove, name=name, version=version)
         if version:
-            self.sig_snapshot_deleted.emit(snapshots[name][version:Index.End])
-            del snapshots[name][version:Index.End]
+            self.sig_snapshot_deleted.emit(snapshots[version:Index.End])
+            del snapshots[version:Index.End]
         else:
-            self.sig_snapshot_deleted.emit(self._inner_snapshots[index][Index.End])
-            del self._inner_snapshots[index]
-            del self.inner_snapshots_keys[index]
+            if self._batch_depth:
+                self._batch_deleted.append(snapshots[Index.End])
+            else:
+                self.sig_snapshot_deleted.emit(snapshots[Index.End])
+            self._inner_snapshots.remove(name)
+            self._inner_snapshot_indexes.pop(name, None)
+
+        self._update_search_index(name)
 
         logger.debug(f"Snapshot {name}:{version} was removed")
 
     def contains(self, name: MediaFile) -> bool:
-        return name in self.inner_snapshots_keys
+        return name in self._inner_snapshots
 
     def values(self, as_path: bool = False) -> list[Any]:
-        return [i[-1].path if as_path else i[-1] for i in self._inner_snapshots]
+        return [i[-1].path if as_path else i[-1] for i in self._inner_snapshots.values()]
 
     def count(self) -> int:
         return len(self._inner_snapshots)
 
     def index(self, name: str) -> int:
-        return list(self.inner_snapshots_keys).index(name)
+        return self._inner_snapshots.index(name)
+
+    def search(self, query: str, candidates: Iterable[str] = None) -> set[str]:
+        """
+        Get names of the files which name or tags contain the query
+        """
+        return self._search_index.search(query, candidates)
+
+    def _update_search_index(self, name: str) -> None:
+        snapshots = self._inner_snapshots.get(name)
+        if not snapshots:
+            self._search_index.remove(name)
+            return
+
+        index = min(self._inner_snapshot_indexes.get(name, 0), len(snapshots) - 1)
+        self._search_index.update(name, get_search_text(snapshots[index]))
+
+    @property
+    def inner_snapshots_keys(self) -> list[str]:
+        return self._inner_snapshots.keys()
 
     def restore(self) -> None:
-        self._inner_snapshots = []
-        self.inner_snapshots_keys = []
+        self._write_journal(JournalOperation.Restore)
+        self._batch_created, self._batch_modified, self._batch_deleted = [], [], []
+        self._inner_snapshots.clear()
+        self._search_index.clear()
         self._inner_snapshot_indexes = {}
-        self._global_snapshots = []
+        self._global_snapshots = self.create_history()
         self._global_snapshots_index = 0
         self._local_snapshots = {}
         self._local_snapshots_index = {}
@@ -282,5 +406,179 @@ class SnapshotRegistryClass(QObject, BaseRegistry):
         self.sig_global_snapshot_restored.emit()
         logger.debug("Snapshots restored")
 
+    def destroy(self) -> None:
+        self.close_journal()
+
+    # Batch methods
+
+    def begin_batch(self) -> None:
+        """
+        Collect created, modified and deleted snapshots instead of emitting a signal for each of them
+        """
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """
+        Emit `sig_snapshots_batch_updated` once the outermost batch is finished
+        """
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth:
+            return
+
+        created, modified, deleted = self._batch_created, self._batch_modified, self._batch_deleted
+        self._batch_created, self._batch_modified, self._batch_deleted = [], [], []
+        if created or modified or deleted:
+            self.sig_snapshots_batch_updated.emit(created, modified, deleted)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    def _emit_snapshot_modified(self, media_file: MediaFile) -> None:
+        if self._batch_depth:
+            self._batch_modified.append(media_file)
+        else:
+            self.sig_snapshot_modified.emit(media_file)
+
+    # Journal methods
+
+    def open_journal(self, journal_file: Path) -> list[MediaFile]:
+        """
+        Open the session journal. Records of the existing journal are replayed first,
+        then the journal is compacted
+
+        Returns:
+            Latest versions of the files
+        """
+        journal_file = Path(journal_file)
+        if self._journal is not None and self._journal.journal_file == journal_file:
+            return self.values()
+
+        self.close_journal()
+        journal = SnapshotJournal(
+            journal_file, self._limits.journal_sync_count, self._limits.journal_sync_interval
+        )
+        self.replay_journal(journal.read())
+        try:
+            journal.compact(self._get_checkpoint_records())
+            journal.open()
+            self._journal = journal
+        except OSError as e:
+            logger.error(f"Can't open snapshots journal {journal_file.as_posix()}: {e!s}")
+
+        return self.values()
+
+    def close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def replay_journal(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Apply journal records without writing them again and without emitting signals
+        """
+        journal, self._journal = self._journal, None
+        self.block_signals(True)
+        try:
+            for record in records:
+                try:
+                    self._replay_record(record)
+                except (PieError, KeyError, IndexError, TypeError) as e:
+                    logger.debug(f"Can't replay journal record {record.get('op')}: {e!s}")
+        finally:
+            self.block_signals(False)
+            self._journal = journal
+
+    def _replay_record(self, record: dict[str, Any]) -> None:
+        operation = record["op"]
+        if operation == JournalOperation.Add:
+            self.add(record["media_file"])
+        elif operation == JournalOperation.Update:
+            self.update(record["name"], self._decode_snapshot(record), record["version"])
+        elif operation == JournalOperation.Replace:
+            self.replace(record["name"], self._decode_snapshot(record))
+        elif operation == JournalOperation.Remove:
+            self.remove(record["name"], record["version"])
+        elif operation == JournalOperation.Restore:
+            self.restore()
+        elif operation == JournalOperation.GlobalAdd:
+            self.add_global_snapshot(self._decode_snapshot(record))
+        elif operation == JournalOperation.GlobalSync:
+            self._sync_to_global(self._decode_snapshot(record))
+        elif operation == JournalOperation.GlobalShift:
+            self.update_global_snapshot_index(record["shift"])
+        elif operation == JournalOperation.GlobalRemove:
+            self.remove_global_snapshot(record["index"])
+        elif operation == JournalOperation.GlobalRestore:
+            self.restore_global_snapshots()
+        elif operation == JournalOperation.InnerSync:
+            self.sync_global_to_inner()
+        elif operation == JournalOperation.Checkpoint:
+            snapshots = self._create_history_from(decode_versions(record["versions"]))
+            self._inner_snapshots[record["name"]] = snapshots
+            self._inner_snapshot_indexes[record["name"]] = min(record["index"], len(snapshots) - 1)
+            self._update_search_index(record["name"])
+        elif operation == JournalOperation.GlobalCheckpoint:
+            self._global_snapshots = self._create_history_from(decode_versions(record["versions"]))
+            self._global_snapshots_index = max(0, min(record["index"], len(self._global_snapshots) - 1))
+        else:
+            logger.debug(f"Unknown journal record {operation}")
+
+    def _create_history_from(self, versions: list[MediaFile]) -> SnapshotHistory:
+        snapshots = self.create_history()
+        for version in versions:
+            snapshots.append(version)
+
+        return snapshots
+
+    def _write_journal(self, operation: str, **fields: Any) -> None:
+        if self._journal is None:
+            return
+
+        try:
+            # Compact before writing, so the checkpoint doesn't include the pending operation
+            if self._journal.records_count > max(self._limits.journal_compact_size, 4 * len(self._inner_snapshots)):
+                self._journal.compact(self._get_checkpoint_records())
+            self._journal.write(operation, **fields)
+        except OSError as e:
+            logger.error(f"Can't write snapshots journal: {e!s}")
+
+    def _get_checkpoint_records(self) -> list[dict[str, Any]]:
+        records = [
+            {
+                "op": JournalOperation.Checkpoint,
+                "name": name,
+                "versions": encode_versions(list(snapshots)),
+                "index": self._inner_snapshot_indexes[name]
+            }
+            for (name, snapshots) in self._inner_snapshots.items()
+        ]
+        records.append({
+            "op": JournalOperation.GlobalCheckpoint,
+            "versions": encode_versions(list(self._global_snapshots)),
+            "index": self._global_snapshots_index
+        })
+        return records
+
+    def _encode_snapshot(self, media_file: MediaFile) -> dict[str, Any]:
+        """
+        Encode snapshot as a delta against the latest version of the file if it exists
+        """
+        snapshots = self._inner_snapshots.get(media_file.name)
+        if snapshots:
+            return {"name": media_file.name, "delta": get_delta(snapshots[-1], media_file)}
+
+        return {"name": media_file.name, "media_file": media_file}
+
+    def _decode_snapshot(self, record: dict[str, Any]) -> MediaFile:
+        if "delta" in record:
+            return apply_delta(self._inner_snapshots[record["name"]][-1], record["delta"])
+
+        return record["media_file"]
+
 
 SnapshotRegistry = SnapshotRegistryClass()
@@ -0,0 +1,109 @@
+"""
+Search index of the snapshots.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+from typing import Iterable, Union
+
+from pieapp.api.converter.models import MediaFile
+
+# Metadata fields that are searched along with the file name
+SEARCH_METADATA_FIELDS: tuple[str, ...] = ("title", "primary_artist", "featured_artist", "genre", "subgenre")
+
+
+def get_search_text(media_file: MediaFile) -> str:
+    """
+    Get normalized text of the file name and its tags. Fields are separated by new lines,
+    so a query doesn't match across the fields
+    """
+    fields = [media_file.info.filename if media_file.info else media_file.path.name]
+    if media_file.metadata is not None:
+        fields.extend(getattr(media_file.metadata, i) or "" for i in SEARCH_METADATA_FIELDS)
+
+    return "\n".join(str(i) for i in fields if i).casefold()
+
+
+def get_trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Trigram index of the search texts.
+
+    Queries of three and more characters are answered by intersecting trigram postings,
+    and only the remaining candidates are checked for the substring.
+    Shorter queries scan the texts
+    """
+
+    def __init__(self) -> None:
+        # <name>: <search text>
+        self._texts: dict[str, str] = {}
+        # <trigram>: <names>
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._texts
+
+    def update(self, name: str, text: str) -> None:
+        """
+        Add or update the search text of the name
+        """
+        previous_text = self._texts.get(name)
+        if previous_text == text:
+            return
+
+        previous_trigrams = get_trigrams(previous_text) if previous_text is not None else set()
+        trigrams = get_trigrams(text)
+        self._remove_postings(name, previous_trigrams - trigrams)
+        for trigram in trigrams - previous_trigrams:
+            postings = self._trigrams.get(trigram)
+            if postings is None:
+                postings = self._trigrams[trigram] = set()
+            postings.add(name)
+
+        self._texts[name] = text
+
+    def remove(self, name: str) -> None:
+        text = self._texts.pop(name, None)
+        if text is not None:
+            self._remove_postings(name, get_trigrams(text))
+
+    def clear(self) -> None:
+        self._texts = {}
+        self._trigrams = {}
+
+    def search(self, query: str, candidates: Union[Iterable[str], None] = None) -> set[str]:
+        """
+        Get names which texts contain the query
+
+        Args:
+            query (str): search query
+            candidates (Iterable[str]): names to search in. For example, results of the previous query
+                when the new query extends it
+        """
+        query = query.casefold().strip()
+        if not query:
+            return set(self._texts if candidates is None else candidates)
+
+        if candidates is None:
+            trigrams = get_trigrams(query)
+            if trigrams:
+                postings = sorted((self._trigrams.get(i, set()) for i in trigrams), key=len)
+                candidates = postings[0].intersection(*postings[1:])
+            else:
+                candidates = self._texts
+
+        texts = self._texts
+        return {i for i in candidates if query in texts.get(i, "")}
+
+    def _remove_postings(self, name: str, trigrams: set[str]) -> None:
+        for trigram in trigrams:
+            postings = self._trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(name)
+                if not postings:
+                    del self._trigrams[trigram]
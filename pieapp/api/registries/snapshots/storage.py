@@ -0,0 +1,162 @@
+"""
+Keyed ordered storage of the snapshots.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+from typing import Any, Iterator, Union
+
+
+class SnapshotStorage:
+    """
+    Ordered mapping with O(1) lookups and O(log n) row index queries.
+
+    Every key gets a slot - a position in the insertion order. Slots of the removed keys
+    become holes, and a Fenwick tree over the live slots counts the keys before the slot,
+    so the row index survives removals without shifting anything.
+    Holes are compacted when they outnumber the live slots
+    """
+
+    # Don't compact storages smaller than this
+    min_compact_size: int = 1024
+
+    def __init__(self) -> None:
+        # <key>: <slot>
+        self._slots: dict[str, int] = {}
+        # <key>: <value>. Keeps the insertion order
+        self._values: dict[str, Any] = {}
+        # <slot>: <key>. Removed keys are replaced with None
+        self._slot_keys: list[Union[str, None]] = []
+        # 1-based Fenwick tree of the live slots
+        self._tree: list[int] = [0]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._values:
+            self._values[key] = value
+        else:
+            self.add(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.remove(key)
+
+    def add(self, key: str, value: Any) -> None:
+        """
+        Append a new key
+
+        Raises:
+            KeyError: key already exists
+        """
+        if key in self._values:
+            raise KeyError(key)
+
+        self._slots[key] = len(self._slot_keys)
+        self._values[key] = value
+        self._slot_keys.append(key)
+        self._append_tree_node(1)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def remove(self, key: str) -> Any:
+        """
+        Remove the key and return its value
+
+        Raises:
+            KeyError: key doesn't exist
+        """
+        value = self._values.pop(key)
+        slot = self._slots.pop(key)
+        self._slot_keys[slot] = None
+        self._update_tree(slot, -1)
+        if len(self._slot_keys) > self.min_compact_size and len(self._slot_keys) > 2 * len(self._values):
+            self._compact()
+
+        return value
+
+    def index(self, key: str) -> int:
+        """
+        Get row index of the key
+
+        Raises:
+            KeyError: key doesn't exist
+        """
+        return self._prefix_sum(self._slots[key] + 1) - 1
+
+    def key_at(self, index: int) -> str:
+        """
+        Get the key by its row index
+
+        Raises:
+            IndexError: index is out of range
+        """
+        if index < 0:
+            index += len(self._values)
+        if not 0 <= index < len(self._values):
+            raise IndexError(index)
+
+        # Find the smallest slot with `index + 1` live slots before it
+        position = 0
+        remaining = index + 1
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            next_position = position + step
+            if next_position < len(self._tree) and self._tree[next_position] < remaining:
+                position = next_position
+                remaining -= self._tree[next_position]
+            step >>= 1
+
+        return self._slot_keys[position]
+
+    def keys(self) -> list[str]:
+        return list(self._values.keys())
+
+    def values(self) -> list[Any]:
+        return list(self._values.values())
+
+    def items(self) -> list[tuple[str, Any]]:
+        return list(self._values.items())
+
+    def clear(self) -> None:
+        self._slots = {}
+        self._values = {}
+        self._slot_keys = []
+        self._tree = [0]
+
+    # Fenwick tree methods
+
+    def _append_tree_node(self, value: int) -> None:
+        # A new node covers `(position - lowbit(position), position]` range
+        position = len(self._tree)
+        lowest_bit = position & -position
+        self._tree.append(value + self._prefix_sum(position - 1) - self._prefix_sum(position - lowest_bit))
+
+    def _update_tree(self, slot: int, delta: int) -> None:
+        position = slot + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def _prefix_sum(self, position: int) -> int:
+        total = 0
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+
+        return total
+
+    def _compact(self) -> None:
+        self._slot_keys = list(self._values.keys())
+        self._slots = {key: slot for (slot, key) in enumerate(self._slot_keys)}
+        # Every slot is live, so each node holds the size of its range
+        self._tree = [0] + [position & -position for position in range(1, len(self._slot_keys) + 1)]
@@ -0,0 +1,99 @@
+"""
+Asset manifests of the themes.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Union
+
+from pieapp.api.utils.files import read_json, write_json
+
+# Directories modified within this interval are rescanned next time,
+# because a change in the same timestamp tick doesn't change the modification time
+RACY_MTIME_INTERVAL = 2_000_000_000
+
+
+def get_mtime(directory: Path) -> Union[int, None]:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+class AssetManifest:
+    """
+    Cached lists of the asset files.
+
+    A folder is scanned once and its manifest is stored in the cache file
+    along with the modification times of the folder and its subfolders.
+    Adding, removing or renaming a file changes the modification time of its directory,
+    so a manifest is revalidated by a few directory stats instead of a stat per file
+    """
+
+    def __init__(self, cache_file: Path, suffixes: Iterable[str]) -> None:
+        self._cache_file = cache_file
+        self._suffixes = tuple(suffixes)
+        # <folder>: {"dirs": {<relative directory>: <mtime>}, "files": [<relative file>]}
+        self._manifests: Union[dict[str, dict], None] = None
+
+    def get_files(self, folder: Path) -> list[Path]:
+        """
+        Get the asset files in the folder and its subfolders
+
+        Args:
+            folder (pathlib.Path): Assets folder
+        """
+        if self._manifests is None:
+            manifests = read_json(self._cache_file, raise_exception=False, default={})
+            self._manifests = manifests if isinstance(manifests, dict) else {}
+
+        manifest = self._manifests.get(folder.as_posix())
+        if manifest is None or not self.is_valid(folder, manifest):
+            manifest = self._manifests[folder.as_posix()] = self.scan(folder)
+            self.save()
+
+        return [folder / i for i in manifest["files"]]
+
+    @staticmethod
+    def is_valid(folder: Path, manifest: dict) -> bool:
+        return all(get_mtime(folder / directory) == mtime for (directory, mtime) in manifest["dirs"].items())
+
+    def scan(self, folder: Path) -> dict:
+        racy_mtime = time.time_ns() - RACY_MTIME_INTERVAL
+        dirs: dict[str, Union[int, None]] = {"": get_mtime(folder)}
+        files: list[str] = []
+        if dirs[""] is None:
+            return {"dirs": dirs, "files": files}
+
+        stack = [""]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(folder / directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = f"{directory}/{entry.name}" if directory else entry.name
+                if entry.is_dir():
+                    dirs[name] = get_mtime(folder / name)
+                    stack.append(name)
+                elif os.path.splitext(entry.name)[1] in self._suffixes:
+                    files.append(name)
+
+        for directory, mtime in dirs.items():
+            if mtime is not None and mtime > racy_mtime:
+                dirs[directory] = -1
+
+        files.sort()
+        return {"dirs": dirs, "files": files}
+
+    def save(self) -> None:
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_json(self._cache_file, self._manifests)
+        except OSError:
+            # The cache is optional
+            pass
@@ -1,27 +1,14 @@
 from __feature__ import snake_case
 
-from typing import Any, Union
+from typing import Any
 
-from PySide6.QtGui import QPixmap, QPainter, QColor, QIcon
+from PySide6.QtGui import QIcon
 
 from pieapp.api.models.scopes import Scope
+from pieapp.api.registries.themes.icons import as_svg
 from pieapp.api.registries.themes.registry import ThemeRegistry
 
 
-def as_svg(file: str, color: Union[str, list] = None) -> QIcon:
-    if not file:
-        return QIcon()
-
-    pixmap = QPixmap(file)
-    painter = QPainter(pixmap)
-    painter.set_composition_mode(QPainter.CompositionMode.CompositionMode_SourceIn)
-
-    painter.fill_rect(pixmap.rect(), QColor.from_string(color))
-    painter.end()
-
-    return QIcon(pixmap)
-
-
 def get_file_path(
     key: Any,
     default: Any = None,
@@ -44,8 +31,7 @@ def get_svg_icon(
     default: Any = None,
     scope: str = Scope.Shared
 ) -> QIcon:
-    icon_path = ThemeRegistry.get(scope, key, default)
-    return as_svg(icon_path, color)
+    return ThemeRegistry.get_svg_icon(scope, key, color, default=default)
 
 
 def get_current_theme() -> str:
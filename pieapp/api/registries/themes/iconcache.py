@@ -0,0 +1,37 @@
+"""
+Cache of the rendered icons.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+from typing import Any, Hashable
+from collections import OrderedDict
+
+
+class IconCache:
+    """
+    LRU cache of the rendered icons
+    """
+
+    def __init__(self, max_size: int = 512) -> None:
+        self._max_size = max(1, max_size)
+        self._icons: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        icon = self._icons.get(key)
+        if icon is None:
+            return default
+
+        self._icons.move_to_end(key)
+        return icon
+
+    def put(self, key: Hashable, icon: Any) -> None:
+        self._icons[key] = icon
+        self._icons.move_to_end(key)
+        while len(self._icons) > self._max_size:
+            self._icons.popitem(last=False)
+
+    def clear(self) -> None:
+        self._icons.clear()
@@ -0,0 +1,34 @@
+from typing import Union
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap, QPainter, QColor, QIcon, QImageReader
+from __feature__ import snake_case
+
+
+def as_svg(file: str, color: Union[str, list] = None, size: int = None) -> QIcon:
+    """
+    Render icon file filled with the color
+
+    Args:
+        file (str): icon file path
+        color (str): fill color
+        size (int): render size. Vector icons are rasterized at this size instead of being scaled
+    """
+    if not file:
+        return QIcon()
+
+    if size:
+        reader = QImageReader(file)
+        reader.set_scaled_size(QSize(size, size))
+        pixmap = QPixmap.from_image(reader.read())
+    else:
+        pixmap = QPixmap(file)
+
+    painter = QPainter(pixmap)
+    painter.set_composition_mode(QPainter.CompositionMode.CompositionMode_SourceIn)
+
+    painter.fill_rect(pixmap.rect(), QColor.from_string(color))
+    painter.end()
+
+    return QIcon(pixmap)
+
@@ -3,7 +3,6 @@ from typing import Any, Union
 from PySide6.QtGui import QIcon
 
 from pieapp.api.models.scopes import Scope
-from pieapp.api.registries.themes.helpers import as_svg
 from pieapp.api.registries.themes.registry import ThemeRegistry
 
 
@@ -37,12 +36,12 @@ class ThemeAccessorMixin:
         scope: str = Scope.Shared,
         color: str = None,
         prop: str = None,
-        default: Any = None
+        default: Any = None,
+        size: int = None
     ) -> QIcon:
         if prop:
             color = self.get_theme_property(prop)
-        icon_path = ThemeRegistry.get(scope or self.scope, key, default)
-        return as_svg(icon_path, color)
+        return ThemeRegistry.get_svg_icon(scope or self.scope, key, color, size, default)
 
     @staticmethod
     def get_themes() -> list[str]:
@@ -1,10 +1,10 @@
 from __feature__ import snake_case
 
 import os
-import re
 from pathlib import Path
 from typing import Any, Union
 
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
 from pieapp.api.globals import Global
@@ -17,6 +17,10 @@ from pieapp.api.utils.modules import import_by_path
 from pieapp.api.models.scopes import Scope
 from pieapp.api.registries.sysregs import SysRegistry
 from pieapp.api.registries.base import BaseRegistry
+from pieapp.api.registries.themes.icons import as_svg
+from pieapp.api.registries.themes.iconcache import IconCache
+from pieapp.api.registries.themes.assets import AssetManifest
+from pieapp.api.registries.themes.stylesheet import StyleSheetCompiler
 
 
 class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
@@ -39,14 +43,24 @@ class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
 
         # Registries
         self._files: dict[str, dict[str, Union[str, os.PathLike]]] = {}
+        # <scope>: [(<theme folder>, <icons folder>)]. Folders are resolved on the first `get` of the scope
+        self._folders: dict[str, list[tuple[Path, Path]]] = {}
+        self._asset_manifest = AssetManifest(
+            Global.USER_ROOT / Global.CACHE_DIR_NAME / "themes" / "assets.json",
+            Global.ICONS_ALLOWED_FORMATS
+        )
         self._stylesheet: str = ""
         self._stylesheet_props: dict[str, str] = {}
+        self._stylesheet_templates: list[Path] = []
+        # <(theme, scope, key, color, size)>: <rendered icon>
+        self._icon_cache = IconCache(self.get_app_config("config.icon_cache_size", Scope.User, 512))
 
         self._current_theme = self.get_app_config("config.theme", Scope.User, Global.DEFAULT_THEME)
         self._themes = self.load_themes()
         self.load_app_theme()
         self.load_plugins_theme(Global.APP_ROOT / Global.PLUGINS_DIR_NAME)
         self.load_plugins_theme(Global.USER_ROOT / Global.PLUGINS_DIR_NAME)
+        self.apply_style_sheet()
 
     def load_themes(self) -> list[str]:
         themes: list[str] = []
@@ -58,12 +72,7 @@ class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
 
     def load_app_theme(self) -> None:
         theme_folder = Global.APP_ROOT / Global.ASSETS_DIR_NAME / self._current_theme
-        for file in theme_folder.rglob("*.*"):
-            if not self.check_file(file):
-                continue
-
-            self.add_file(Scope.Shared, theme_folder, file)
-
+        self.add_folder(Scope.Shared, theme_folder, theme_folder)
         self._stylesheet_props["THEME_ROOT"] = theme_folder.as_posix()
 
         self._app = get_application()
@@ -88,17 +97,30 @@ class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
                 icons_folder = plugin_folder / Global.ASSETS_DIR_NAME
 
             self._stylesheet_props[f"{plugin_folder.name.upper()}_PLUGIN"] = theme_folder.as_posix()
-
-            for file in icons_folder.rglob("*.*"):
-                if not self.check_file(file):
-                    continue
-
-                self.add_file(plugin_folder.name, theme_folder, file)
+            self.add_folder(plugin_folder.name, theme_folder, icons_folder)
 
             if Global.USE_THEME:
                 self.load_style_sheet(theme_folder)
             self.load_palette(theme_folder)
-            self._app.set_style_sheet(self._stylesheet)
+
+    def add_folder(self, scope: str, theme_folder: Path, icons_folder: Path) -> None:
+        """
+        Add icons folder to the scope. Its files are resolved on the first `get` of the scope
+
+        Args:
+            scope (str|Scope): The file scope can be a plugin's name or `Section` item
+            theme_folder (pathlib.Path): Theme full path
+            icons_folder (pathlib.Path): Icons folder path
+        """
+        self._folders.setdefault(scope, []).append((theme_folder, icons_folder))
+
+    def load_files(self, scope: str) -> None:
+        """
+        Add files of the scope folders from the asset manifest
+        """
+        for theme_folder, icons_folder in self._folders.pop(scope, []):
+            for file in self._asset_manifest.get_files(icons_folder):
+                self.add_file(scope, theme_folder, file)
 
     def add_file(self, scope: str, theme_folder: Path, file: Path) -> None:
         """
@@ -121,42 +143,29 @@ class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
 
         self._files[scope][filename_key] = file.as_posix()
 
-    def check_file(self, file: Path) -> bool:
-        """
-        Check if file is not a directory, or it has the right file format
-
-        Args:
-            file (pathlib.Path): A file path
-        """
-        if file.is_dir() or file.suffix not in Global.ICONS_ALLOWED_FORMATS:
-            return False
-
-        return True
-
-    def parse_template(self, template_file: Path) -> None:
+    def load_style_sheet(self, theme_folder: Path) -> None:
         """
-        Parse template file
+        Load theme properties and add the style sheet template. Templates are compiled by `apply_style_sheet`
         """
-        pattern = re.compile(r"@([A-Za-z0-9-_\.]+)")
-        with open(str(template_file)) as lines:
-            for line in lines:
-                match_list = pattern.findall(line)
-                for match in match_list:
-                    if match in self._stylesheet_props:
-                        line = line.replace(match, self._stylesheet_props.get(match))
-                        line = line.replace("@", "")
-                    else:
-                        logger.debug(f"Can't find {match}/{line}")
-                self._stylesheet += line
-
-    def load_style_sheet(self, theme_folder: Path) -> None:
         theme_file = theme_folder / "theme.qss"
         if not theme_file.exists():
             return
 
         props_data = read_json(theme_folder / "props.json", raise_exception=False, default={})
         self._stylesheet_props.update(**props_data)
-        self.parse_template(theme_file)
+        self._stylesheet_templates.append(theme_file)
+
+    def apply_style_sheet(self) -> None:
+        """
+        Compile all templates in a single pass and apply the style sheet once.
+        The compiled style sheet is cached until the templates or the properties change
+        """
+        if not Global.USE_THEME:
+            return
+
+        compiler = StyleSheetCompiler(Global.USER_ROOT / Global.CACHE_DIR_NAME / "themes" / f"{self._current_theme}.json")
+        self._stylesheet = compiler.compile(self._stylesheet_templates, self._stylesheet_props)
+        self._app.set_style_sheet(self._stylesheet)
 
     def load_palette(self, theme_folder: Path) -> None:
         palette_file = theme_folder / "palette.py"
@@ -174,20 +183,52 @@ class ThemeRegistryClass(BaseRegistry, ConfigAccessorMixin):
             key (str): Icon name
             default (Any): Default value if icon was not found
         """
+        if scope in self._folders:
+            self.load_files(scope)
+
         try:
             return self._files[scope][key]
         except KeyError:
             logger.debug(f"File {key} not found")
             return default
 
+    def get_svg_icon(
+        self,
+        scope: str,
+        key: str,
+        color: str = None,
+        size: int = None,
+        default: Any = None
+    ) -> QIcon:
+        """
+        Get icon filled with the color. Rendered icons are cached until the theme is applied again
+
+        Args:
+            scope (str|Scope): The file scope can be a plugin's name or `Section` item
+            key (str): Icon name
+            color (str): Fill color
+            size (int): Render size
+            default (Any): Default icon path if icon was not found
+        """
+        cache_key = (self._current_theme, scope, key, color, size, default)
+        icon = self._icon_cache.get(cache_key)
+        if icon is None:
+            icon = as_svg(self.get(scope, key, default), color, size)
+            self._icon_cache.put(cache_key, icon)
+
+        return icon
+
     def apply_theme(self) -> None:
         self.destroy()
         self.init()
 
     def destroy(self) -> None:
+        self._icon_cache.clear()
         self._files = {}
+        self._folders = {}
         self._stylesheet = ""
         self._stylesheet_props = {}
+        self._stylesheet_templates = []
 
     def get_theme(self) -> str:
         return self._current_theme
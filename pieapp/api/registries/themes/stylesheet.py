@@ -0,0 +1,84 @@
+"""
+Style sheet compiler.
+
+Doesn't depend on Qt, so it can be used and tested on its own
+"""
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Union
+
+from pieapp.api.utils.files import read_json, write_json
+
+# Template property reference, for example: `@mainFontColor` or `@THEME_ROOT`
+STYLESHEET_PROP_PATTERN = re.compile(r"@([A-Za-z0-9-_\.]+)")
+
+
+def compile_style_sheet(templates: list[str], props: dict[str, Any]) -> str:
+    """
+    Substitute the properties in the joined templates in a single pass.
+    Unknown references are left as is
+
+    Args:
+        templates (list[str]): style sheet templates
+        props (dict): template properties
+    """
+    def replace(match: re.Match) -> str:
+        value = props.get(match[1])
+        return match[0] if value is None else str(value)
+
+    return STYLESHEET_PROP_PATTERN.sub(replace, "\n".join(templates))
+
+
+class StyleSheetCompiler:
+    """
+    Compiles the style sheet templates and keeps the result in the cache file.
+    The cache is keyed by the templates modification times and the properties,
+    so warm starts don't read and parse the templates at all
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        self._cache_file = cache_file
+
+    def compile(self, template_files: list[Path], props: dict[str, Any]) -> str:
+        """
+        Get the compiled style sheet from the cache or compile the templates
+
+        Args:
+            template_files (list[Path]): style sheet template files in the order of appearance
+            props (dict): template properties
+        """
+        key = self.get_key(template_files, props)
+        stylesheet = self.load(key)
+        if stylesheet is None:
+            templates = [i.read_text(encoding="utf-8") for i in template_files]
+            stylesheet = compile_style_sheet(templates, props)
+            self.save(key, stylesheet)
+
+        return stylesheet
+
+    @staticmethod
+    def get_key(template_files: list[Path], props: dict[str, Any]) -> str:
+        files = []
+        for file in template_files:
+            stat = file.stat()
+            files.append((file.as_posix(), stat.st_mtime_ns, stat.st_size))
+
+        data = json.dumps([files, props], sort_keys=True, default=str)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Union[str, None]:
+        data = read_json(self._cache_file, raise_exception=False, default={})
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+
+        return data.get("stylesheet")
+
+    def save(self, key: str, stylesheet: str) -> None:
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_json(self._cache_file, {"key": key, "stylesheet": stylesheet})
+        except OSError:
+            # The cache is optional
+            pass
@@ -0,0 +1,95 @@
+"""
+Dependency graph helpers
+"""
+from typing import Iterable, Union
+
+
+class DependencyCycleError(ValueError):
+
+    def __init__(self, cycle: list[str]) -> None:
+        self.cycle = cycle
+        super().__init__(" -> ".join(cycle))
+
+
+def find_cycle(graph: dict[str, set[str]]) -> Union[list[str], None]:
+    """
+    Find a cycle in the graph
+
+    Args:
+        graph (dict): <node>: <nodes it depends on>
+
+    Returns:
+        Nodes of the cycle, the first node is repeated at the end, or `None`
+    """
+    visited: set[str] = set()
+    for root in graph:
+        if root in visited:
+            continue
+
+        # Depth-first search with the explicit stack of the (node, dependencies iterator) pairs
+        path: list[str] = [root]
+        path_nodes: set[str] = {root}
+        stack = [iter(graph[root])]
+        visited.add(root)
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                path_nodes.discard(path.pop())
+            elif node in path_nodes:
+                return path[path.index(node):] + [node]
+            elif node not in visited and node in graph:
+                visited.add(node)
+                path.append(node)
+                path_nodes.add(node)
+                stack.append(iter(graph[node]))
+
+    return None
+
+
+def get_topological_waves(
+    requires: dict[str, Iterable[str]],
+    optional: dict[str, Iterable[str]] = None
+) -> list[list[str]]:
+    """
+    Split the nodes into waves, every node comes after the nodes it depends on.
+    Nodes of the same wave don't depend on each other and keep the order of the `requires` keys
+
+    Unknown nodes and self-dependencies are ignored. Optional dependencies only order the nodes
+    and are dropped when they close a cycle
+
+    Args:
+        requires (dict): <node>: <required nodes>
+        optional (dict): <node>: <optional nodes>
+
+    Raises:
+        DependencyCycleError: required dependencies have a cycle
+    """
+    optional = optional or {}
+    required_edges = {k: {i for i in v if i in requires and i != k} for (k, v) in requires.items()}
+    remaining = {
+        k: v | {i for i in optional.get(k, ()) if i in requires and i != k}
+        for (k, v) in required_edges.items()
+    }
+
+    waves: list[list[str]] = []
+    while remaining:
+        wave = [k for (k, v) in remaining.items() if not v]
+        if not wave:
+            # Drop the optional dependencies of the cycle
+            cycle = find_cycle(remaining)
+            optional_edges = [(a, b) for (a, b) in zip(cycle, cycle[1:]) if b not in required_edges[a]]
+            if not optional_edges:
+                raise DependencyCycleError(cycle)
+
+            for node, dependency in optional_edges:
+                remaining[node].discard(dependency)
+            continue
+
+        waves.append(wave)
+        for node in wave:
+            del remaining[node]
+        for dependencies in remaining.values():
+            dependencies.difference_update(wave)
+
+    return waves
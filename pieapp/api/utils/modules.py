@@ -3,7 +3,11 @@ import re
 import sys
 import types
 import importlib
+import importlib.abc
 import importlib.util
+import importlib.machinery
+from pathlib import Path
+from typing import Union
 
 
 def import_by_path(path: str) -> types.ModuleType:
@@ -13,6 +17,64 @@ def import_by_path(path: str) -> types.ModuleType:
     return module
 
 
+class PluginFinder(importlib.abc.MetaPathFinder):
+    """
+    Finds plugin packages in the plugin folders by their folder names, for example: `converter`,
+    so plugin modules get stable names (`converter.plugin`) and are registered in `sys.modules`.
+    Submodules are found by the regular path finder through the package `__path__`,
+    so they share the bytecode cache and are executed only once.
+
+    Packages without the sources on the disk are left to the other finders,
+    for example, to the loader of the frozen build
+    """
+
+    def __init__(self) -> None:
+        # <package name>: <package folder>
+        self._packages: dict[str, Path] = {}
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def add_folder(self, folder: Path) -> list[str]:
+        """
+        Add plugin packages of the folder. Packages of the latter folders override the former ones
+
+        Args:
+            folder (pathlib.Path): Plugins folder
+
+        Returns:
+            Names of the added packages
+        """
+        packages: list[str] = []
+        for package in folder.iterdir():
+            if package.is_dir() and package.name.isidentifier() and (package / "__init__.py").exists():
+                self._packages[package.name] = package
+                packages.append(package.name)
+
+        return packages
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Union[list[str], None] = None,
+        target: Union[types.ModuleType, None] = None
+    ) -> Union[importlib.machinery.ModuleSpec, None]:
+        package = self._packages.get(fullname) if path is None else None
+        if package is None:
+            return None
+
+        return importlib.util.spec_from_file_location(
+            fullname,
+            package / "__init__.py",
+            submodule_search_locations=[str(package)]
+        )
+
+
 def is_import_string(string: str):
     return True if re.match(r'^([a-zA-Z|a-zA-Z\d+.]+)$', string) else False
 
@@ -0,0 +1,128 @@
+"""
+Startup tracer.
+
+Enabled by the `PIE_TRACE_STARTUP` environment variable or the `--trace-startup` command line flag.
+Spans are written in the Chrome trace event format, so the trace can be opened
+in `chrome://tracing` or https://ui.perfetto.dev
+"""
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Iterator, Union
+
+# Environment variable. "1" enables the tracer, any other value except "0" is a trace file path
+TRACE_ENV_NAME = "PIE_TRACE_STARTUP"
+
+# Command line flag. The trace file path can be passed as `--trace-startup=<file>`
+TRACE_FLAG = "--trace-startup"
+
+
+def get_trace_file(argv: list[str], environ: dict[str, str] = None) -> Union[str, None]:
+    """
+    Get requested trace file path. Returns an empty string if the tracer is enabled
+    without the path and `None` if it's not enabled
+
+    Args:
+        argv (list[str]): command line arguments
+        environ (dict): environment variables
+    """
+    for arg in argv[1:]:
+        if arg == TRACE_FLAG:
+            return ""
+        if arg.startswith(f"{TRACE_FLAG}="):
+            return arg.split("=", 1)[1]
+
+    value = (os.environ if environ is None else environ).get(TRACE_ENV_NAME, "")
+    if value in ("", "0"):
+        return None
+
+    return "" if value == "1" else value
+
+
+class TracerClass:
+    """
+    Records wall and CPU time of the nested spans
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._events: list[dict[str, Any]] = []
+        # Nesting depth of the spans in each thread
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+        self._events = []
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+
+    def disable(self) -> None:
+        self._enabled = False
+
+    @contextmanager
+    def span(self, name: str, category: str = "startup", **args: Any) -> Iterator[None]:
+        """
+        Measure the block
+
+        Args:
+            name (str): span name
+            category (str): span category, for example: "phase", "registry" or "plugin"
+            args (Any): additional span arguments
+        """
+        if not self._enabled:
+            yield
+            return
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        wall_start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        try:
+            yield
+        finally:
+            cpu_time = time.thread_time_ns() - cpu_start
+            wall_time = time.perf_counter_ns() - wall_start
+            self._local.depth = depth
+            self._events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (wall_start - self._origin) / 1000,
+                "dur": wall_time / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {"cpu_ms": round(cpu_time / 1_000_000, 3), "depth": depth, **args},
+            })
+
+    def get_events(self) -> list[dict[str, Any]]:
+        return sorted(self._events, key=lambda i: i["ts"])
+
+    def write(self, trace_file: Path) -> None:
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(trace_file, "w", encoding="utf-8") as output:
+            json.dump({"traceEvents": self.get_events(), "displayTimeUnit": "ms"}, output)
+
+    def get_summary(self) -> str:
+        """
+        Get table of the spans in order of appearance, nested spans are indented
+        """
+        lines = [f"{'wall, ms':>10} {'cpu, ms':>10}  {'category':<10} span"]
+        for event in self.get_events():
+            indent = "  " * event["args"]["depth"]
+            lines.append(
+                f"{event['dur'] / 1000:>10.2f} {event['args']['cpu_ms']:>10.2f}  "
+                f"{event['cat']:<10} {indent}{event['name']}"
+            )
+
+        return "\n".join(lines)
+
+
+Tracer = TracerClass()
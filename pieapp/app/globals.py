@@ -46,6 +46,15 @@ DEFAULT_TEMP_DIR_NAME = "temp"
 # Media folder name
 MEDIA_FILES_DIR_NAME = "media"
 
+# Extracted album covers folder name
+ALBUM_COVERS_DIR_NAME = "covers"
+
+# Session manifest file name. Lists staged files of the session
+SESSION_MANIFEST_FILE_NAME = "session.json"
+
+# Session journal file name. Write-ahead journal of the snapshot operations
+SESSION_JOURNAL_FILE_NAME = "journal.jsonl"
+
 # Output folder name
 OUTPUT_DIR_NAME = "output"
 
@@ -55,6 +64,9 @@ DEFAULT_PLUGIN_ICON_NAME = "app"
 # Plugin folder name
 PLUGINS_DIR_NAME = "plugins"
 
+# Cache folder name
+CACHE_DIR_NAME = "cache"
+
 """
 Assets fields
 """
@@ -65,8 +77,11 @@ ASSETS_DIR_NAME = "assets"
 # Icons allowed formats list
 ICONS_ALLOWED_FORMATS = [".svg", ".png", ".ico"]
 
-_themes_list = tuple(i for i in (APP_ROOT / ASSETS_DIR_NAME).rglob("*") if i.is_dir())
-DEFAULT_THEME = _themes_list[0].name if _themes_list else None
+_themes_list = sorted(
+    i.name for i in os.scandir(APP_ROOT / ASSETS_DIR_NAME)
+    if i.is_dir() and not i.name.startswith("__")
+) if (APP_ROOT / ASSETS_DIR_NAME).is_dir() else []
+DEFAULT_THEME = _themes_list[0] if _themes_list else None
 USE_THEME = bool(int(os.getenv("PIE_USE_THEME", True)))
 
 """
@@ -1,14 +1,17 @@
 import sys
+from pathlib import Path
 
 from PySide6.QtCore import QSettings
 from __feature__ import snake_case
 
 from pieapp.api.plugins import PluginRegistry
 from pieapp.api.utils.errorhook import exception_hook
+from pieapp.api.utils.logger import logger
 from pieapp.api.utils.qapp import get_application
 from pieapp.api.utils.modules import is_debug
 from pieapp.api.utils.files import check_user_folders
 from pieapp.api.utils.files import restore_user_folders
+from pieapp.api.utils.tracer import Tracer, get_trace_file
 
 from pieapp.api.globals import Global
 from pieapp.api.registries.registry import RegistryContainer
@@ -21,8 +24,14 @@ def start_application(*args, **kwargs) -> None:
     """
     Main start-up entrypoint
     """
+    # Enable the startup tracer
+    trace_file = get_trace_file(sys.argv)
+    if trace_file is not None:
+        Tracer.enable()
+
     # Load globals from the application directory
-    Global.import_module("pieapp.app.globals")
+    with Tracer.span("Import globals", "phase"):
+        Global.import_module("pieapp.app.globals")
 
     # Swapping the exception hook
     if bool(int(Global.USE_EXCEPTION_HOOK)):
@@ -30,7 +39,8 @@ def start_application(*args, **kwargs) -> None:
 
     # Initialize "QApplication" instance
     splash = None
-    app = get_application(sys.argv)
+    with Tracer.span("Create QApplication", "phase"):
+        app = get_application(sys.argv)
     app.set_application_name(Global.PIEAPP_APPLICATION_NAME)
     app.set_application_version(Global.PIEAPP_VERSION)
     app.set_organization_name(Global.PIEAPP_ORGANIZATION_NAME)
@@ -39,8 +49,9 @@ def start_application(*args, **kwargs) -> None:
     # Prepare splash screen image
     splash_image = Global.APP_ROOT / Global.ASSETS_DIR_NAME / "splash.svg"
     if not is_debug() and splash_image.exists():
-        splash = SplashScreen(str(splash_image))
-        splash.show()
+        with Tracer.span("Show splash screen", "phase"):
+            splash = SplashScreen(str(splash_image))
+            splash.show()
 
     settings = QSettings()
 
@@ -68,23 +79,46 @@ def start_application(*args, **kwargs) -> None:
         sys.exit(app.exec())
 
     # Initialize all core registries
-    for manager in Global.CORE_REGISTRIES:
-        RegistryContainer.init_from_string(manager)
+    with Tracer.span("Initialize core registries", "phase"):
+        for manager in Global.CORE_REGISTRIES:
+            RegistryContainer.init_from_string(manager)
 
-    from pieapp.app.main import MainWindow
-    main_window = MainWindow()
+    with Tracer.span("Create main window", "phase"):
+        from pieapp.app.main import MainWindow
+        main_window = MainWindow()
 
     # Initialize all layout registries
-    for manager in Global.LAYOUT_REGISTRIES:
-        RegistryContainer.init_from_string(manager)
+    with Tracer.span("Initialize layout registries", "phase"):
+        for manager in Global.LAYOUT_REGISTRIES:
+            RegistryContainer.init_from_string(manager)
 
     # Initialize plugin registry and all plugins
-    PluginRegistry.init_plugins()
+    with Tracer.span("Initialize plugins", "phase"):
+        PluginRegistry.init_plugins()
 
     # Initialize main window
-    main_window.init()
+    with Tracer.span("Show main window", "phase"):
+        main_window.init()
 
     if splash is not None:
         splash.close()
 
+    if Tracer.is_enabled:
+        write_trace(Path(trace_file) if trace_file else Global.USER_ROOT / "startup-trace.json")
+
     sys.exit(app.exec())
+
+
+def write_trace(trace_file: Path) -> None:
+    """
+    Write the startup trace and print its summary
+    """
+    Tracer.disable()
+    try:
+        Tracer.write(trace_file)
+    except OSError as e:
+        logger.warning(f"Can't write startup trace to {trace_file}: {e!s}")
+    else:
+        logger.info(f"Startup trace was written to {trace_file}")
+
+    logger.info(f"Startup summary:\n{Tracer.get_summary()}")
@@ -11,6 +11,7 @@ from PySide6.QtCore import QThread
 
 from PySide6.QtWidgets import QWidget
 from PySide6.QtWidgets import QLabel
+from PySide6.QtWidgets import QComboBox
 from PySide6.QtWidgets import QLineEdit
 from PySide6.QtWidgets import QProgressBar
 from PySide6.QtWidgets import QFileDialog
@@ -22,6 +23,7 @@ from pieapp.api.models.plugins import SysPlugin
 from pieapp.api.models.themes import ThemeProperties, IconName
 from pieapp.api.plugins.confpage import ConfigPage
 from pieapp.api.converter.workers import DownloadWorker
+from pieapp.api.converter.staging import StagingMode
 
 from pieapp.api.models.scopes import Scope
 from pieapp.api.registries.locales.helpers import translate
@@ -98,8 +100,18 @@ class ConverterConfigPage(ConfigPage, ConfigAccessorMixin, ThemeAccessorMixin):
         layout.add_layout(ffmpeg_hbox)
         layout.add_widget(self._progress_bar)
 
+        self._staging_mode_combo_box = QComboBox()
+        self._staging_mode_combo_box.add_item(translate("Copy files"), StagingMode.Copy)
+        self._staging_mode_combo_box.add_item(translate("Hard link files"), StagingMode.HardLink)
+        self._staging_mode_combo_box.add_item(translate("Use original files"), StagingMode.Reference)
+        self._staging_mode_combo_box.set_current_index(self._staging_mode_combo_box.find_data(
+            self.get_app_config("workflow.staging_mode", Scope.User, StagingMode.HardLink)
+        ))
+        self._staging_mode_combo_box.currentIndexChanged.connect(self._staging_mode_changed)
+
         main_form_layout = QFormLayout()
         main_form_layout.add_row(layout)
+        main_form_layout.add_row(translate("Opened files"), self._staging_mode_combo_box)
         self._main_widget.set_layout(main_form_layout)
 
     def _start_downloader_thread(self) -> None:
@@ -159,14 +171,25 @@ class ConverterConfigPage(ConfigPage, ConfigAccessorMixin, ThemeAccessorMixin):
             self._ffmpeg_line_edit.set_text(directory_path)
             self.set_modified(True)
 
+    @Slot(int)
+    def _staging_mode_changed(self, index: int) -> None:
+        self.set_modified(True)
+
     def accept(self) -> None:
         self.save_app_config("config", Scope.User)
+        # Workflow config also keeps the session state, so update only the staging mode
+        self.update_app_config("workflow.staging_mode", Scope.User, self._staging_mode_combo_box.current_data())
+        self.save_app_config("workflow", Scope.User)
         self.set_modified(False)
 
     def cancel(self) -> None:
         self.restore_app_config("config", Scope.User)
+        self._staging_mode_combo_box.set_current_index(self._staging_mode_combo_box.find_data(
+            self.get_app_config("workflow.staging_mode", Scope.User, StagingMode.HardLink)
+        ))
 
     def set_page_state(self, disable: bool) -> None:
         self._ffmpeg_line_edit.set_disabled(disable)
         self._download_button.set_disabled(disable)
         self._progress_bar.set_disabled(disable)
+        self._staging_mode_combo_box.set_disabled(disable)
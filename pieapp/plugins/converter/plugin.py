@@ -8,6 +8,7 @@ from pathlib import Path
 
 from PySide6.QtCore import Slot
 from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer
 from PySide6.QtCore import QThreadPool
 
 from pieapp.api.globals import Global
@@ -44,9 +45,14 @@ from pieapp.api.utils.qapp import get_application
 from pieapp.widgets.buttons import Button, ButtonRole
 from pieapp.widgets.messagebox import MessageBox
 
-from pieapp.api.converter.workers import ProbeWorker
-from pieapp.api.converter.workers import ConverterWorker
+from pieapp.api.converter.cache import ProbeCache
 from pieapp.api.converter.workers import CopyFilesWorker
+from pieapp.api.converter.staging import StagingMode
+from pieapp.api.converter.staging import is_staged_copy
+from pieapp.api.converter.staging import get_session_files
+from pieapp.api.converter.staging import update_session_manifest
+from pieapp.api.converter.schedulers import ProbeScheduler
+from pieapp.api.converter.schedulers import ConverterScheduler
 from pieapp.api.converter.observers import FileSystemWatcher
 
 from converter.confpage import ConverterConfigPage
@@ -67,8 +73,8 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
 
     sig_files_ready = Signal()
 
-    # Emit on converter table item added to list
-    sig_table_item_added = Signal(MediaFile)
+    # Emit on converter table items added to list
+    sig_table_items_added = Signal(list)
 
     # Emit on snapshot created
     sig_snapshot_created = Signal(MediaFile)
@@ -147,11 +153,7 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
                 get_application().exit()
 
             elif message_box_reply == MessageBox.ButtonRole.YesRole:
-                selected_files = []
-                for file in Path(temp_directory).iterdir():
-                    if file.suffix.replace(".", "") in Global.AUDIO_EXTENSIONS_SUFFIXES:
-                        selected_files.append(file)
-                self.start_copy_files_worker(selected_files)
+                self.restore_session(temp_directory)
 
             elif message_box_reply == MessageBox.ButtonRole.NoRole:
                 delete_directory(temp_directory)
@@ -167,19 +169,64 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
         SnapshotRegistry.sig_snapshot_modified.connect(self._on_snapshot_modified)
         SnapshotRegistry.sig_snapshot_deleted.connect(self._on_snapshots_deleted)
         SnapshotRegistry.sig_snapshots_restored.connect(self._on_snapshots_restored)
+        SnapshotRegistry.sig_snapshots_batch_updated.connect(self._on_snapshots_batch_updated)
 
     def connect_widget_signals(self) -> None:
         widget = self.get_widget()
         widget.sig_files_selected.connect(self.on_files_selected)
         widget.sig_snapshot_deleted.connect(self._on_snapshots_deleted)
-        widget.sig_table_item_added.connect(self._on_table_item_added)
+        widget.sig_table_items_added.connect(self._on_table_items_added)
 
     def init(self) -> None:
         # Prepare workflow variables
         self.chunk_size = self.get_app_config("ffmpeg.chunk_size", Scope.User, 10)
+        self.max_processes = self.get_app_config("ffmpeg.max_processes", Scope.User, os.cpu_count())
         self.ffmpeg_command = Path(self.get_app_config("ffmpeg.ffmpeg", Scope.User, "ffmpeg"))
         self.ffprobe_command = Path(self.get_app_config("ffmpeg.ffprobe", Scope.User, "ffprobe"))
+
+        # Probed files are rendered in batches, not one by one
+        self._probed_media_files: list[MediaFile] = []
+        self._render_timer = QTimer(self)
+        self._render_timer.set_single_shot(True)
+        self._render_timer.set_interval(self.get_app_config("workflow.render_interval", Scope.User, 50))
+        self._render_timer.timeout.connect(self._render_probed_media_files)
         self.connect_widget_signals()
+        self.prepare_probe_scheduler()
+        self.prepare_converter_scheduler()
+
+    def prepare_probe_scheduler(self) -> None:
+        self._probe_cache = ProbeCache(
+            cache_file=Global.USER_ROOT / Global.CACHE_DIR_NAME / "probe.json",
+            max_size=self.get_app_config("ffmpeg.probe_cache_size", Scope.User, 4096),
+            use_content_hash=self.get_app_config("ffmpeg.probe_cache_hash", Scope.User, True)
+        )
+        self._probe_scheduler = ProbeScheduler(
+            temp_folder=None,
+            ffmpeg_command=self.ffmpeg_command,
+            ffprobe_command=self.ffprobe_command,
+            probe_cache=self._probe_cache,
+            max_processes=self.max_processes,
+            chunk_size=self.chunk_size,
+            parent=self
+        )
+        self._probe_scheduler.signals.started.connect(self.probe_worker_started)
+        self._probe_scheduler.signals.completed_element.connect(self.probe_worker_element_finished)
+        self._probe_scheduler.signals.completed.connect(self.probe_worker_finished)
+        self._probe_scheduler.signals.failed.connect(self.probe_worker_failed)
+
+    def prepare_converter_scheduler(self) -> None:
+        self._converter_scheduler = ConverterScheduler(
+            ffmpeg_command=self.ffmpeg_command,
+            max_processes=self.max_processes,
+            chunk_size=self.chunk_size,
+            parent=self
+        )
+        self._converter_scheduler.signals.started.connect(self.converter_worker_started)
+        self._converter_scheduler.signals.completed.connect(self.converter_worker_finished)
+        self._converter_scheduler.signals.failed.connect(self.converter_worker_failed)
+        self._converter_scheduler.signals.started_element.connect(self.converter_file_started)
+        self._converter_scheduler.signals.completed_element.connect(self.converter_file_finished)
+        self._converter_scheduler.signals.failed_element.connect(self.converter_file_failed)
 
     # QuickAction public proxy methods
 
@@ -204,7 +251,11 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
         """
         Clear content list, remove it from the `list_grid_layout` and disable clear button
         """
-        delete_files(SnapshotRegistry.values(as_path=True))
+        temp_directory = Path(self.get_app_config("workflow.temp_directory", Scope.User))
+        staged_files = SnapshotRegistry.values(as_path=True)
+        # Referenced originals must stay untouched
+        delete_files([i for i in staged_files if is_staged_copy(i, temp_directory)])
+        update_session_manifest(temp_directory, self.staging_mode, removed_files=staged_files)
         SnapshotRegistry.restore()
         self.get_widget().clear_content_list()
 
@@ -219,11 +270,49 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
             str(temp_directory)
         )
 
+        SnapshotRegistry.open_journal(temp_directory / Global.SESSION_JOURNAL_FILE_NAME)
+
         selected_files = list(map(Path, selected_files))
         last_opened_directory = selected_files[0]
         self.update_app_config("workflow.last_opened_directory", Scope.User, last_opened_directory, temp=True)
         self.start_copy_files_worker(selected_files)
 
+    def restore_session(self, temp_directory: Path) -> None:
+        """
+        Restore files and their edits from the session journal.
+        Only files that weren't probed before the application was closed are probed again
+        """
+        media_files = SnapshotRegistry.open_journal(temp_directory / Global.SESSION_JOURNAL_FILE_NAME)
+
+        # Files aren't rendered yet, so there's nothing to update on removal
+        SnapshotRegistry.block_signals(True)
+        for media_file in media_files:
+            if not media_file.path.exists():
+                SnapshotRegistry.remove(media_file.name)
+        SnapshotRegistry.block_signals(False)
+
+        media_files = SnapshotRegistry.values()
+        probed_media_files = [i for i in media_files if i.info is not None]
+        if probed_media_files:
+            self.get_widget().render_quick_actions(probed_media_files)
+            self.get_widget().on_snapshot_created()
+
+        unprobed_media_files = [i for i in media_files if i.info is None]
+        session_files = [
+            i for i in get_session_files(temp_directory)
+            if f"{i.parts[-2]}/{i.name}" not in SnapshotRegistry
+        ]
+        if session_files or not media_files:
+            self.start_copy_files_worker(session_files)
+        if unprobed_media_files:
+            self.start_probe_worker(unprobed_media_files)
+        elif not session_files and media_files:
+            self._watcher.start(str(temp_directory))
+
+    @property
+    def staging_mode(self) -> str:
+        return self.get_app_config("workflow.staging_mode", Scope.User, StagingMode.HardLink)
+
     def start_copy_files_worker(self, files: list[Path]) -> None:
         if len(files) == 0:
             status_bar = get_plugin(SysPlugin.StatusBar)
@@ -232,7 +321,14 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
             return
 
         temp_directory = Path(self.get_app_config("workflow.temp_directory", Scope.User))
-        copy_files_worker = CopyFilesWorker(files, temp_directory)
+        copy_files_worker = CopyFilesWorker(
+            selected_files=files,
+            destination=temp_directory,
+            max_workers=self.get_app_config("workflow.copy_workers", Scope.User, 4),
+            staging_mode=self.staging_mode
+        )
+        copy_files_worker.signals.progress.connect(self.copy_files_worker_progress)
+        copy_files_worker.signals.failed_element.connect(self.copy_files_worker_element_failed)
         copy_files_worker.signals.failed.connect(self.copy_files_worker_failed)
         copy_files_worker.signals.completed.connect(lambda: self.copy_files_worker_finished(files))
         copy_files_worker.signals.destroyed.connect(self.destroyed)
@@ -249,7 +345,7 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
             return
 
         media_file = SnapshotRegistry.get(f"{file_path.parts[-2]}/{file_path.name}")
-        index = len(SnapshotRegistry.values())
+        index = SnapshotRegistry.count()
         self.get_widget().on_file_created(index, media_file)
 
     @Slot(Path, str, bool)
@@ -307,12 +403,19 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
     def _on_snapshots_restored(self) -> None:
         self.get_widget().on_snapshots_restored()
 
+    @Slot(list, list, list)
+    def _on_snapshots_batch_updated(self, created: list, modified: list, deleted: list) -> None:
+        self.get_widget().on_snapshots_batch_updated(created, modified, deleted)
+
     # CopyFilesWorker handlers
 
     def copy_files_worker_finished(self, selected_files: list[Path]) -> None:
         """
         Start `ConverterProbeWorker` with selected files after `CopyFilesWorker` is finished
         """
+        temp_directory = Path(self.get_app_config("workflow.temp_directory", Scope.User))
+        update_session_manifest(temp_directory, self.staging_mode, added_files=selected_files)
+
         output_directory = self.get_app_config("workflow.output_directory", Scope.User)
         output_directory = Path(output_directory)
         selected_media_files = []
@@ -325,14 +428,31 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
             )
             selected_media_files.append(media_file)
 
-        for index, media_file in enumerate(selected_media_files):
-            if media_file.name not in SnapshotRegistry:
+        selected_media_files = list({
+            i.name: i for i in selected_media_files
+            if i.name not in SnapshotRegistry
+        }.values())
+        with SnapshotRegistry.batch():
+            for media_file in selected_media_files:
                 SnapshotRegistry.add(media_file)
-            else:
-                del selected_media_files[index]
 
         self.start_probe_worker(selected_media_files)
 
+    @Slot(int, int)
+    def copy_files_worker_progress(self, copied_bytes: int, total_bytes: int) -> None:
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar and total_bytes:
+            status_bar.show_message(f'{translate("Copying files")}: {copied_bytes * 100 // total_bytes}%')
+
+    @Slot(str, Exception)
+    def copy_files_worker_element_failed(self, file_name: str, exception: Exception) -> None:
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar:
+            status_bar.show_message(
+                f'{translate("Failed to copy file")} {file_name}: {exception!s}',
+                MessageStatus.Error
+            )
+
     @Slot(Exception)
     def copy_files_worker_failed(self, exception: Exception):
         self.get_widget().copy_files_worker_failed()
@@ -340,31 +460,40 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
         if status_bar:
             status_bar.show_message(f'{translate("Failed to copy files")}: {exception!s}', MessageStatus.Error)
 
-    def start_probe_worker(self, media_files) -> None:
-        probe_worker = ProbeWorker(
-            media_files=media_files,
-            temp_folder=Path(self.get_app_config("workflow.temp_directory", Scope.User)),
-            ffmpeg_command=self.ffmpeg_command,
-            ffprobe_command=self.ffprobe_command,
-        )
-        probe_worker.signals.started.connect(self.probe_worker_started)
-        probe_worker.signals.completed.connect(self.probe_worker_finished)
-        probe_worker.signals.failed.connect(self.probe_worker_failed)
-        probe_worker.signals.destroyed.connect(self.destroyed)
-
-        pool = QThreadPool.global_instance()
-        pool.start(probe_worker)
+    def start_probe_worker(self, media_files: list[MediaFile]) -> None:
+        self._probe_scheduler.set_temp_folder(Path(self.get_app_config("workflow.temp_directory", Scope.User)))
+        self._probe_scheduler.start(media_files)
 
-    # ProbeWorker handlers
+    # ProbeScheduler handlers
 
     def probe_worker_started(self) -> None:
         self.get_widget().probe_worker_started()
 
-    @Slot(Path)
+    @Slot(MediaFile)
+    def probe_worker_element_finished(self, media_file: MediaFile) -> None:
+        self._probed_media_files.append(media_file)
+        if not self._render_timer.is_active():
+            self._render_timer.start()
+
+    def _render_probed_media_files(self) -> None:
+        media_files, self._probed_media_files = self._probed_media_files, []
+        # Skip files deleted while they were probed
+        media_files = [i for i in media_files if i.name in SnapshotRegistry]
+        if not media_files:
+            return
+
+        widget = self.get_widget()
+        with SnapshotRegistry.batch(), widget.batch():
+            for media_file in media_files:
+                SnapshotRegistry.replace(media_file.name, media_file)
+            widget.render_quick_actions(media_files)
+
+    @Slot(list)
     def probe_worker_finished(self, models_list: list[MediaFile]) -> None:
+        self._render_timer.stop()
+        self._render_probed_media_files()
         self._watcher.start(self.get_app_config("workflow.temp_directory", Scope.User))
         self.get_widget().probe_worker_finished()
-        self.get_widget().render_quick_actions(models_list)
 
         status_bar = get_plugin(SysPlugin.StatusBar)
         if status_bar:
@@ -377,32 +506,51 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
         if status_bar:
             status_bar.show_message(f'{translate("Failed to process files")}: {exception!s}', MessageStatus.Error)
 
-    # ConverterWorker handlers
+    # ConverterScheduler methods
 
     @Slot(Path)
     def start_converter_worker(self, output_folder: Path) -> None:
-        media_files = SnapshotRegistry.values()
-        converter_worker = ConverterWorker(media_files, self.ffmpeg_command)
-        converter_worker.signals.started.connect(self.converter_worker_started)
-        converter_worker.signals.failed.connect(self.converter_worker_failed)
-        converter_worker.signals.completed.connect(self.converter_worker_finished)
+        if self._converter_scheduler.is_running():
+            return
 
-        pool = QThreadPool.global_instance()
-        pool.start(converter_worker)
+        self._converter_scheduler.start(SnapshotRegistry.values())
 
-    # ConverterWorker handlers
+    # ConverterScheduler handlers
 
     @Slot()
     def converter_worker_started(self) -> None:
-        pass
+        self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(False)
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar:
+            status_bar.show_message(translate("Converting files"), MessageStatus.Info)
 
     @Slot()
     def converter_worker_finished(self) -> None:
         logger.debug("Finished")
+        self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(SnapshotRegistry.count() > 0)
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar:
+            status_bar.show_message(translate("Done"), MessageStatus.Info)
 
-    @Slot(Exception, int)
-    def converter_worker_failed(self, exception: Exception, index: int) -> None:
-        pass
+    @Slot(Exception)
+    def converter_worker_failed(self, exception: Exception) -> None:
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar:
+            status_bar.show_message(f'{translate("Failed to process files")}: {exception!s}', MessageStatus.Error)
+
+    @Slot(str)
+    def converter_file_started(self, media_file_name: str) -> None:
+        logger.debug(f"Converting {media_file_name}")
+
+    @Slot(str)
+    def converter_file_finished(self, media_file_name: str) -> None:
+        logger.debug(f"Converted {media_file_name}")
+
+    @Slot(str, Exception)
+    def converter_file_failed(self, media_file_name: str, exception: Exception) -> None:
+        status_bar = get_plugin(SysPlugin.StatusBar)
+        if status_bar:
+            status_bar.show_message(str(exception), MessageStatus.Error)
 
     # Debug methods
 
@@ -425,8 +573,8 @@ class ConverterPlugin(PiePlugin, CoreAccessorsMixin, WidgetsAccessorMixins):
 
     # Widget methods
 
-    def _on_table_item_added(self, media_file: MediaFile) -> None:
-        self.sig_table_item_added.emit(media_file)
+    def _on_table_items_added(self, media_files: list[MediaFile]) -> None:
+        self.sig_table_items_added.emit(media_files)
 
     # Plugin event methods
 
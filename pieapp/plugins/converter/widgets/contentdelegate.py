@@ -0,0 +1,129 @@
+from __feature__ import snake_case
+
+from typing import Callable
+
+from PySide6.QtGui import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtGui import QIcon
+from PySide6.QtGui import QColor
+from PySide6.QtGui import QPainter
+from PySide6.QtGui import QPalette
+from PySide6.QtCore import QRect, QSize, QModelIndex
+from PySide6.QtWidgets import QStyle
+from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtWidgets import QStyleOptionViewItem
+
+from pieapp.api.plugins.quickaction import QuickAction
+from pieapp.api.registries.themes.mixins import ThemeAccessorMixin
+
+from converter.widgets.contentmodel import ContentListRole
+
+
+class ContentListDelegate(QStyledItemDelegate, ThemeAccessorMixin):
+    """
+    Paints the file format badge, title, description and quick action icons of the row.
+    Quick action buttons are created by the `ContentListWidget` for the hovered row only
+    """
+    row_height = 78
+    badge_size = 48
+    badge_radius = 17
+    quick_action_size = 24
+    quick_action_icon_size = 14
+    margins = (12, 15, 10, 15)
+
+    def __init__(self, get_quick_actions: Callable[[], list[QuickAction]], parent: "QObject" = None) -> None:
+        super().__init__(parent)
+
+        self._get_quick_actions = get_quick_actions
+
+    def size_hint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.row_height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        painter.save()
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.draw_primitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+
+        left, top, right, bottom = self.margins
+        rect = option.rect.adjusted(left, top, -right, -bottom)
+        painter.set_render_hint(QPainter.RenderHint.Antialiasing)
+
+        # File format badge
+        file_format = index.data(ContentListRole.FileFormat) or ""
+        colors = self.get_theme_property("converterItemColors", {})
+        badge_rect = QRect(rect.left(), rect.center().y() - self.badge_size // 2, self.badge_size, self.badge_size)
+        painter.set_pen(Qt.PenStyle.NoPen)
+        painter.set_brush(QColor(colors.get(file_format.lower(), colors.get("default", "#f5a569"))))
+        painter.draw_rounded_rect(badge_rect, self.badge_radius, self.badge_radius)
+
+        badge_font = QFont(option.font)
+        badge_font.set_bold(True)
+        painter.set_font(badge_font)
+        painter.set_pen(QColor("white"))
+        painter.draw_text(badge_rect, Qt.AlignmentFlag.AlignCenter, file_format.upper()[:4])
+
+        # Quick actions. The hovered row shows real buttons instead
+        quick_actions_rect = self.get_quick_actions_rect(option.rect)
+        if not option.state & QStyle.StateFlag.State_MouseOver:
+            self._paint_quick_actions(painter, quick_actions_rect, index.data(ContentListRole.MediaFileName))
+
+        # Title and description
+        text_rect = QRect(
+            badge_rect.right() + left,
+            rect.top(),
+            quick_actions_rect.left() - badge_rect.right() - 2 * left,
+            rect.height()
+        )
+        text_color = option.palette.color(QPalette.ColorRole.Text)
+        painter.set_pen(text_color)
+
+        title_font = QFont(option.font)
+        title_font.set_pixel_size(14)
+        painter.set_font(title_font)
+        title = painter.font_metrics().elided_text(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideRight,
+            text_rect.width()
+        )
+        painter.draw_text(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, title)
+
+        description_font = QFont(option.font)
+        description_font.set_italic(True)
+        painter.set_font(description_font)
+        painter.draw_text(
+            text_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            index.data(ContentListRole.Description) or ""
+        )
+        painter.restore()
+
+    def get_quick_actions_rect(self, rect: QRect) -> QRect:
+        width = len(self._get_quick_actions()) * self.quick_action_size
+        _, _, right, _ = self.margins
+        return QRect(
+            rect.right() - right - width,
+            rect.center().y() - self.quick_action_size // 2,
+            width,
+            self.quick_action_size
+        )
+
+    def _paint_quick_actions(self, painter: QPainter, rect: QRect, media_file_name: str) -> None:
+        icon_offset = (self.quick_action_size - self.quick_action_icon_size) // 2
+        for position, quick_action in enumerate(self._get_quick_actions()):
+            # Icons are cached by the `ThemeRegistry`
+            icon = quick_action.get_icon()
+            is_enabled, _ = quick_action.get_enabled(media_file_name)
+            icon_rect = QRect(
+                rect.left() + position * self.quick_action_size + icon_offset,
+                rect.top() + icon_offset,
+                self.quick_action_icon_size,
+                self.quick_action_icon_size
+            )
+            icon.paint(
+                painter,
+                icon_rect,
+                Qt.AlignmentFlag.AlignCenter,
+                QIcon.Mode.Normal if is_enabled else QIcon.Mode.Disabled
+            )
@@ -1,18 +1,33 @@
 from PySide6.QtCore import Signal
 from __feature__ import snake_case
 
+from typing import Callable, Union
+
 from PySide6.QtGui import Qt
-from PySide6.QtWidgets import QListWidget
+from PySide6.QtCore import Slot, QModelIndex
+from PySide6.QtWidgets import QListView
 from PySide6.QtWidgets import QSizePolicy
 from PySide6.QtWidgets import QAbstractItemView
 
+from pieapp.api.plugins.quickaction import QuickAction
+
+from converter.widgets.itemmenu import QuickActionMenu
+from converter.widgets.contentmodel import ContentListRole
+from converter.widgets.contentmodel import ContentListModel
+from converter.widgets.contentmodel import ContentListProxyModel
+from converter.widgets.contentdelegate import ContentListDelegate
 
-class ContentListWidget(QListWidget):
+
+class ContentListWidget(QListView):
+    """
+    List of the files. Rows are painted by the `ContentListDelegate`,
+    the only live widget is the `QuickActionMenu` of the hovered row
+    """
     sig_item_changed = Signal()
     sig_item_deleted = Signal()
     sig_item_pressed = Signal()
 
-    def __init__(self) -> None:
+    def __init__(self, get_quick_actions: Callable[[], list[QuickAction]]) -> None:
         super().__init__()
         self.set_contents_margins(0, 0, 0, 0)
 
@@ -21,7 +36,68 @@ class ContentListWidget(QListWidget):
 
         self.set_selection_behavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.set_selection_mode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.set_vertical_scroll_mode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.set_uniform_item_sizes(True)
+        self.set_mouse_tracking(True)
+
+        self._get_quick_actions = get_quick_actions
+        self._quick_action_menu: Union[QuickActionMenu, None] = None
+
+        self._content_list_model = ContentListModel(self)
+        self._content_list_proxy_model = ContentListProxyModel(self)
+        self._content_list_proxy_model.set_source_model(self._content_list_model)
+        self._content_list_delegate = ContentListDelegate(get_quick_actions, self)
+        self.set_model(self._content_list_proxy_model)
+        self.set_item_delegate(self._content_list_delegate)
+
+        self.entered.connect(self._show_quick_action_menu)
+        self.pressed.connect(self.sig_item_pressed)
+        self.vertical_scroll_bar().valueChanged.connect(self._hide_quick_action_menu)
+        self._content_list_model.dataChanged.connect(self.sig_item_changed)
+        self._content_list_model.rowsRemoved.connect(self.sig_item_deleted)
+        self._content_list_model.modelReset.connect(self.sig_item_deleted)
+        self._content_list_proxy_model.rowsRemoved.connect(self._hide_quick_action_menu)
+        self._content_list_proxy_model.modelReset.connect(self._hide_quick_action_menu)
+
+    @property
+    def content_list_model(self) -> ContentListModel:
+        return self._content_list_model
+
+    def count(self) -> int:
+        return self._content_list_model.row_count()
+
+    def set_filter_text(self, text: str) -> None:
+        self._content_list_proxy_model.set_filter_text(text)
+
+    def leave_event(self, event: "QEvent") -> None:
+        self._hide_quick_action_menu()
+        super().leave_event(event)
+
+    @Slot(QModelIndex)
+    def _show_quick_action_menu(self, index: QModelIndex) -> None:
+        media_file_name = index.data(ContentListRole.MediaFileName)
+        if self._quick_action_menu is not None and self._quick_action_menu.media_file_name == media_file_name:
+            return
+
+        self._hide_quick_action_menu()
+        self.set_current_index(index)
+
+        quick_action_menu = QuickActionMenu(self.viewport(), media_file_name)
+        for quick_action in self._get_quick_actions():
+            quick_action_menu.add_item(quick_action)
+
+        quick_actions_rect = self._content_list_delegate.get_quick_actions_rect(self.visual_rect(index))
+        quick_action_menu.adjust_size()
+        quick_action_menu.move(
+            quick_actions_rect.right() - quick_action_menu.width() + 1,
+            quick_actions_rect.center().y() - quick_action_menu.height() // 2
+        )
+        quick_action_menu.show()
+        self._quick_action_menu = quick_action_menu
 
-        self.itemChanged.connect(self.sig_item_changed)
-        self.itemPressed.connect(self.sig_item_pressed)
-        self.model().rowsRemoved.connect(self.sig_item_deleted)
+    @Slot()
+    def _hide_quick_action_menu(self, *args) -> None:
+        if self._quick_action_menu is not None:
+            self._quick_action_menu.hide()
+            self._quick_action_menu.delete_later()
+            self._quick_action_menu = None
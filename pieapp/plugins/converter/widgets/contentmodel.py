@@ -0,0 +1,349 @@
+from __feature__ import snake_case
+
+import bisect
+from typing import Any, Union
+import dataclasses as dt
+
+from PySide6.QtCore import Qt
+from PySide6.QtCore import QModelIndex
+from PySide6.QtCore import QAbstractListModel
+from PySide6.QtCore import QAbstractProxyModel
+
+from pieapp.api.converter.models import MediaFile
+from pieapp.api.registries.snapshots.registry import SnapshotRegistry
+from pieapp.api.registries.snapshots.storage import SnapshotStorage
+
+
+@dt.dataclass(frozen=True, slots=True, eq=False)
+class ContentListRole:
+    MediaFileName = Qt.ItemDataRole.UserRole + 1
+    MediaFile = Qt.ItemDataRole.UserRole + 2
+    Description = Qt.ItemDataRole.UserRole + 3
+    FileFormat = Qt.ItemDataRole.UserRole + 4
+
+
+class ContentListModel(QAbstractListModel):
+    """
+    List model of the rendered files.
+    Only names of the files are stored, the rest is read from the `SnapshotRegistry` on demand
+    """
+
+    def __init__(self, parent: "QObject" = None) -> None:
+        super().__init__(parent)
+
+        # <media file name>: None. Ordered, with O(log n) row lookups
+        self._names = SnapshotStorage()
+
+    def row_count(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.is_valid():
+            return 0
+
+        return len(self._names)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.is_valid() or not 0 <= index.row() < len(self._names):
+            return None
+
+        media_file_name = self._names.key_at(index.row())
+        if role == ContentListRole.MediaFileName:
+            return media_file_name
+
+        media_file: MediaFile = SnapshotRegistry.get(media_file_name)
+        if media_file is None or media_file.info is None:
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return media_file.info.filename
+        elif role == ContentListRole.Description:
+            return media_file.info.bit_rate_string
+        elif role == ContentListRole.FileFormat:
+            return media_file.info.file_format
+        elif role == ContentListRole.MediaFile:
+            return media_file
+
+        return None
+
+    def add_media_files(self, media_files: list[MediaFile]) -> None:
+        """
+        Append rows of the files with a single insert
+        """
+        media_file_names = list(dict.fromkeys(i.name for i in media_files if i.name not in self._names))
+        if not media_file_names:
+            return
+
+        first_row = len(self._names)
+        self.begin_insert_rows(QModelIndex(), first_row, first_row + len(media_file_names) - 1)
+        for media_file_name in media_file_names:
+            self._names.add(media_file_name, None)
+        self.end_insert_rows()
+
+    def remove_media_file(self, media_file_name: str) -> None:
+        if media_file_name not in self._names:
+            return
+
+        row = self._names.index(media_file_name)
+        self.begin_remove_rows(QModelIndex(), row, row)
+        self._names.remove(media_file_name)
+        self.end_remove_rows()
+
+    def remove_media_files(self, media_file_names: list[str]) -> None:
+        """
+        Remove rows of the files. Several rows are removed with a single model reset
+        """
+        media_file_names = [i for i in media_file_names if i in self._names]
+        if len(media_file_names) < 2:
+            for media_file_name in media_file_names:
+                self.remove_media_file(media_file_name)
+            return
+
+        self.begin_reset_model()
+        for media_file_name in media_file_names:
+            self._names.remove(media_file_name)
+        self.end_reset_model()
+
+    def update_media_file(self, media_file_name: str) -> None:
+        """
+        Repaint the row of the file
+        """
+        if media_file_name not in self._names:
+            return
+
+        index = self.index(self._names.index(media_file_name))
+        self.dataChanged.emit(index, index)
+
+    def update_media_files(self, media_file_names: list[str]) -> None:
+        """
+        Repaint rows of the files with a single `dataChanged` signal
+        """
+        rows = [self._names.index(i) for i in media_file_names if i in self._names]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+
+    def get_media_file_name(self, row: int) -> str:
+        return self._names.key_at(row)
+
+    def get_row(self, media_file_name: str) -> int:
+        return self._names.index(media_file_name)
+
+    def get_rows(self, media_file_names: set[str]) -> list[int]:
+        """
+        Get sorted rows of the files with a single pass over the names
+        """
+        return [row for (row, name) in enumerate(self._names) if name in media_file_names]
+
+    def clear(self) -> None:
+        self.begin_reset_model()
+        self._names.clear()
+        self.end_reset_model()
+
+
+class ContentListProxyModel(QAbstractProxyModel):
+    """
+    Shows rows of the files matching the filter text.
+
+    Matches come from the `SnapshotRegistry` search index. When the new text extends the previous one,
+    only previous matches are searched. Inserted and changed rows are matched on their own
+    and are inserted or removed from the filtered rows. Unfiltered model passes source rows through as is
+    """
+
+    def __init__(self, parent: "QObject" = None) -> None:
+        super().__init__(parent)
+
+        self._filter_text: str = ""
+        # Names of the matching files, None if the model isn't filtered
+        self._matches: Union[set[str], None] = None
+        # <proxy row>: <source row>
+        self._source_rows: Union[list[int], None] = None
+        # <source row>: <proxy row>. Built on demand
+        self._proxy_rows: Union[dict[int, int], None] = None
+        # Range of the filtered rows which source rows are being removed
+        self._removed_rows: tuple[int, int] = (0, 0)
+
+    def set_source_model(self, source_model: ContentListModel) -> None:
+        super().set_source_model(source_model)
+        source_model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        source_model.rowsInserted.connect(self._on_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        source_model.rowsRemoved.connect(self._on_rows_removed)
+        source_model.modelAboutToBeReset.connect(self.begin_reset_model)
+        source_model.modelReset.connect(self._on_model_reset)
+        source_model.dataChanged.connect(self._on_data_changed)
+
+    @property
+    def is_filtered(self) -> bool:
+        return self._matches is not None
+
+    def set_filter_text(self, text: str) -> None:
+        text = text.casefold().strip()
+        if text == self._filter_text:
+            return
+
+        candidates = None
+        if self._matches is not None and self._filter_text in text:
+            candidates = self._matches
+
+        self.begin_reset_model()
+        self._filter_text = text
+        self._matches = SnapshotRegistry.search(text, candidates) if text else None
+        self._update_source_rows()
+        self.end_reset_model()
+
+    # QAbstractProxyModel methods
+
+    def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.is_valid() or column != 0 or not 0 <= row < self.row_count():
+            return QModelIndex()
+
+        return self.create_index(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def row_count(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.is_valid() or self.source_model() is None:
+            return 0
+        if self._source_rows is None:
+            return self.source_model().row_count()
+
+        return len(self._source_rows)
+
+    def column_count(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.is_valid() else 1
+
+    def map_to_source(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.is_valid() or self.source_model() is None:
+            return QModelIndex()
+
+        row = proxy_index.row()
+        if self._source_rows is not None:
+            if row >= len(self._source_rows):
+                return QModelIndex()
+            row = self._source_rows[row]
+
+        return self.source_model().index(row, 0)
+
+    def map_from_source(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.is_valid():
+            return QModelIndex()
+        if self._source_rows is None:
+            return self.index(source_index.row(), 0)
+
+        if self._proxy_rows is None:
+            self._proxy_rows = {source_row: row for (row, source_row) in enumerate(self._source_rows)}
+
+        row = self._proxy_rows.get(source_index.row())
+        return QModelIndex() if row is None else self.index(row, 0)
+
+    # Source model handlers
+
+    def _update_source_rows(self) -> None:
+        self._proxy_rows = None
+        if self._matches is None:
+            self._source_rows = None
+        else:
+            self._source_rows = self.source_model().get_rows(self._matches)
+
+    def _shift_source_rows(self, first: int, count: int) -> None:
+        """
+        Move the source rows starting from the first one by the count
+        """
+        self._proxy_rows = None
+        for row in range(bisect.bisect_left(self._source_rows, first), len(self._source_rows)):
+            self._source_rows[row] += count
+
+    def _insert_source_row(self, source_row: int, media_file_name: str) -> None:
+        row = bisect.bisect_left(self._source_rows, source_row)
+        self.begin_insert_rows(QModelIndex(), row, row)
+        self._source_rows.insert(row, source_row)
+        self._matches.add(media_file_name)
+        self._proxy_rows = None
+        self.end_insert_rows()
+
+    def _remove_source_row(self, source_row: int, media_file_name: str) -> None:
+        row = bisect.bisect_left(self._source_rows, source_row)
+        self.begin_remove_rows(QModelIndex(), row, row)
+        del self._source_rows[row]
+        self._matches.discard(media_file_name)
+        self._proxy_rows = None
+        self.end_remove_rows()
+
+    def _on_rows_about_to_be_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._matches is None:
+            self.begin_insert_rows(QModelIndex(), first, last)
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._matches is None:
+            self.end_insert_rows()
+            return
+
+        # Filtered rows stay in place, only their source rows are moved
+        self._shift_source_rows(first, last - first + 1)
+
+        # Only the new files are matched against the filter
+        source_model = self.source_model()
+        media_file_names = [source_model.get_media_file_name(i) for i in range(first, last + 1)]
+        matches = SnapshotRegistry.search(self._filter_text, media_file_names)
+        source_rows = [first + i for (i, name) in enumerate(media_file_names) if name in matches]
+        if not source_rows:
+            return
+
+        row = bisect.bisect_left(self._source_rows, first)
+        self.begin_insert_rows(QModelIndex(), row, row + len(source_rows) - 1)
+        self._source_rows[row:row] = source_rows
+        self._matches.update(matches)
+        self._proxy_rows = None
+        self.end_insert_rows()
+
+    def _on_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._matches is None:
+            self.begin_remove_rows(QModelIndex(), first, last)
+            return
+
+        # Source rows are sorted, so the removed filtered rows are contiguous
+        start = bisect.bisect_left(self._source_rows, first)
+        stop = bisect.bisect_right(self._source_rows, last)
+        self._removed_rows = (start, stop)
+        if start < stop:
+            source_model = self.source_model()
+            self._matches.difference_update(
+                source_model.get_media_file_name(i) for i in self._source_rows[start:stop]
+            )
+            self.begin_remove_rows(QModelIndex(), start, stop - 1)
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._matches is None:
+            self.end_remove_rows()
+            return
+
+        start, stop = self._removed_rows
+        del self._source_rows[start:stop]
+        self._shift_source_rows(first, first - last - 1)
+        if start < stop:
+            self.end_remove_rows()
+
+    def _on_model_reset(self) -> None:
+        self._update_source_rows()
+        self.end_reset_model()
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list[int] = None) -> None:
+        if self._matches is None:
+            self.dataChanged.emit(self.index(top_left.row()), self.index(bottom_right.row()))
+            return
+
+        # Changed tags may change the matches, only the changed rows are matched against the filter
+        source_model = self.source_model()
+        source_rows = {
+            source_model.get_media_file_name(i): i
+            for i in range(top_left.row(), bottom_right.row() + 1)
+        }
+        matches = SnapshotRegistry.search(self._filter_text, source_rows)
+        for (media_file_name, source_row) in source_rows.items():
+            if media_file_name in matches and media_file_name not in self._matches:
+                self._insert_source_row(source_row, media_file_name)
+            elif media_file_name not in matches and media_file_name in self._matches:
+                self._remove_source_row(source_row, media_file_name)
+
+        start = bisect.bisect_left(self._source_rows, top_left.row())
+        stop = bisect.bisect_right(self._source_rows, bottom_right.row())
+        if start < stop:
+            self.dataChanged.emit(self.index(start), self.index(stop - 1))
@@ -41,6 +41,10 @@ class QuickActionMenu(QWidget):
         self.set_size_policy(menu_size_policy)
         self.hide()
 
+    @property
+    def media_file_name(self) -> str:
+        return self._media_file_name
+
     def get_items(self) -> list[QToolButton]:
         return list(self._items_dict.values())
 
@@ -56,13 +60,14 @@ class QuickActionMenu(QWidget):
         tool_button.set_icon(quick_action.get_icon())
         tool_button.set_icon_size(QSize(14, 14))
 
-        is_enabled, reason = quick_action.get_enabled()
+        # Quick actions are shared between the rows
+        is_enabled, reason = quick_action.get_enabled(self._media_file_name)
         tool_button.set_enabled(is_enabled)
         if is_enabled is False:
             tool_button.set_tool_tip(reason)
 
         tool_button.set_object_name("QuickActionToolButton")
-        tool_button.clicked.connect(lambda: quick_action.on_click())
+        tool_button.clicked.connect(lambda: self._on_item_clicked(quick_action))
 
         self._items_dict[quick_action.full_name] = tool_button
         item_index: Union[int, None] = None
@@ -79,3 +84,6 @@ class QuickActionMenu(QWidget):
             self._menu_hbox.add_widget(tool_button, alignment=Qt.AlignmentFlag.AlignRight)
 
         return tool_button
+
+    def _on_item_clicked(self, quick_action: QuickAction) -> None:
+        quick_action.on_click(self._media_file_name)
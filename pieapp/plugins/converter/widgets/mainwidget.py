@@ -1,17 +1,18 @@
 from __feature__ import snake_case
 
 import os
+from typing import Iterator, Union
+from contextlib import contextmanager
 
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Slot
 from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer
 
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QWidget
 from PySide6.QtWidgets import QFileDialog
-from PySide6.QtWidgets import QListWidgetItem
 from PySide6.QtWidgets import QGridLayout
-from PySide6.QtWidgets import QHBoxLayout
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QSpacerItem
 from PySide6.QtWidgets import QSizePolicy
@@ -25,6 +26,7 @@ from pieapp.api.models.themes import IconName
 from pieapp.api.models.themes import ThemeProperties
 from pieapp.api.models.toolbars import ToolBarItem
 from pieapp.api.converter.models import MediaFile
+from pieapp.api.plugins.quickaction import QuickAction
 
 from pieapp.api.plugins.widgets import PiePluginWidget
 from pieapp.api.plugins.mixins import CoreAccessorsMixin
@@ -37,9 +39,9 @@ from pieapp.api.registries.quickactions.registry import QuickActionRegistry
 from converter.widgets.quickaction import DeleteQuickAction
 from pieapp.widgets.waitingspinner import create_wait_spinner
 
-from converter.widgets.itemlist import QuickActionList
 from converter.widgets.search import ContentListSearch
 from converter.widgets.contentlist import ContentListWidget
+from converter.widgets.contentmodel import ContentListModel
 
 
 class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins):
@@ -58,8 +60,8 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
     # Emit on global snapshot restored
     sig_snapshots_restored = Signal()
 
-    # Emit on new list item added
-    sig_table_item_added = Signal(MediaFile)
+    # Emit on new list items added
+    sig_table_items_added = Signal(list)
 
     def init(self) -> None:
         self.supported_formats = ""
@@ -68,13 +70,16 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
             self.supported_formats += f"{translate(description)} {file_format} ;; "
 
         # Prepare widget
-        self._converter_item_widgets: list[QuickActionList] = []
+        self._delete_quick_action: Union[DeleteQuickAction, None] = None
+        # Nesting depth of the batch update and files rendered during the batch
+        self._batch_depth: int = 0
+        self._batch_media_files: list[MediaFile] = []
         self._main_grid_layout = QGridLayout()
         self._main_grid_layout.set_spacing(0)
         self._main_grid_layout.set_contents_margins(0, 0, 0, 0)
 
         # Setup content list
-        self._content_list_widget = ContentListWidget()
+        self._content_list_widget = ContentListWidget(self.get_quick_actions)
         self._content_list_widget.sig_item_pressed.connect(self.content_list_item_selected)
         self._content_list_widget.sig_item_changed.connect(self.content_list_item_removed)
         self._content_list_widget.sig_item_deleted.connect(self.content_list_item_removed)
@@ -86,6 +91,18 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
         self._search.set_hidden(True)
         self._search.textChanged.connect(self.on_search_text_changed)
 
+        # Search is started once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.set_single_shot(True)
+        self._search_timer.set_interval(self.get_app_config("workflow.search_delay", Scope.User, 150))
+        self._search_timer.timeout.connect(self._apply_search_text)
+
+        self._last_opened_directory_config = self.get_app_config_handle(
+            "workflow.last_opened_directory",
+            Scope.User,
+            os.path.expanduser("~")
+        )
+
         self._spinner = create_wait_spinner(
             self._content_list_widget,
             size=64,
@@ -128,6 +145,10 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
     def content_list_widget(self) -> ContentListWidget:
         return self._content_list_widget
 
+    @property
+    def content_list_model(self) -> ContentListModel:
+        return self._content_list_widget.content_list_model
+
     def connect_snapshot_signals(self) -> None:
         self.sig_snapshot_created.connect(SnapshotRegistry.sig_snapshot_created)
         self.sig_snapshot_deleted.connect(SnapshotRegistry.sig_snapshot_deleted)
@@ -143,15 +164,16 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
     @Slot(str)
     def on_search_text_changed(self, text: str) -> None:
         """
-        Filter `content_list` by text
+        Filter `content_list` by text. Cleared text is applied at once
         """
-        for row in range(self._content_list_widget.count()):
-            item = self._content_list_widget.item(row)
-            item_widget = self._content_list_widget.item_widget(item)
-            if text:
-                item.set_hidden(not (text.lower() in item_widget.media_file.info.filename.lower()))
-            else:
-                item.set_hidden(False)
+        if text:
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self._apply_search_text()
+
+    def _apply_search_text(self) -> None:
+        self._content_list_widget.set_filter_text(self._search.text())
 
     # Placeholder methods
 
@@ -175,12 +197,7 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
     # File system methods
 
     def open_files(self) -> None:
-        last_opened_directory = self.get_app_config(
-            "workflow.last_opened_directory",
-            Scope.User,
-            os.path.expanduser("~")
-        )
-        last_opened_directory = str(last_opened_directory)
+        last_opened_directory = str(self._last_opened_directory_config.get())
         selected_files = QFileDialog.get_open_file_names(
             caption=translate("Open files"),
             dir=last_opened_directory,
@@ -211,8 +228,7 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
         """
         Clear content list, remove it from the `list_grid_layout` and disable clear button
         """
-        self._converter_item_widgets = []
-        self._content_list_widget.clear()
+        self.content_list_model.clear()
         self._set_placeholder()
         self.get_tool_button(self.name, ToolBarItem.Clear).set_enabled(False)
 
@@ -251,10 +267,8 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
         pass
 
     def on_file_deleted(self, index) -> None:
-        self._content_list_widget.take_item(index)
-        del self._converter_item_widgets[index]
-        if len(self._converter_item_widgets) < 1:
-            self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(True)
+        # The row is removed on `sig_snapshot_deleted`
+        self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(self._content_list_widget.count() > 0)
 
     # Plugin to Widget methods - SnapshotRegistry signals handlers
 
@@ -262,59 +276,72 @@ class ConverterWidget(PiePluginWidget, CoreAccessorsMixin, WidgetsAccessorMixins
         self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(True)
 
     def on_snapshot_deleted(self, index: int, media_file: MediaFile):
-        self._content_list_widget.take_item(index)
-        del self._converter_item_widgets[index]
-        if len(self._converter_item_widgets) < 1:
-            self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(True)
+        self.content_list_model.remove_media_file(media_file.name)
+        self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(self._content_list_widget.count() > 0)
 
     def on_snapshot_modified(self, state: bool, media_file: MediaFile):
+        self.content_list_model.update_media_file(media_file.name)
         self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(state)
 
+    def on_snapshots_batch_updated(self, created: list, modified: list, deleted: list):
+        if deleted:
+            self.content_list_model.remove_media_files([i.name for i in deleted])
+        if modified:
+            self.content_list_model.update_media_files([i.name for i in modified])
+
+        self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(SnapshotRegistry.count() > 0)
+
     def on_snapshots_restored(self):
         self.clear_content_list()
         self.get_tool_button(self.name, ToolBarItem.Convert).set_enabled(False)
 
     # QuickAction methods
 
+    def get_quick_actions(self) -> list[QuickAction]:
+        """
+        Get registered and default QuickActions. They're shared between the rows
+        """
+        if self._delete_quick_action is None:
+            self._delete_quick_action = DeleteQuickAction(self.plugin, enabled=True)
+
+        return [*QuickActionRegistry.values(), self._delete_quick_action]
+
     def render_quick_actions(self, media_files: list):
         if not media_files:
             return
 
+        if self._batch_depth:
+            self._batch_media_files.extend(media_files)
+            return
+
         self._clear_placeholder()
         self._main_grid_layout.add_widget(self._search, 0, 0)
         self._main_grid_layout.add_widget(self._content_list_widget, 1, 0)
 
-        for media_file in media_files:
-            # TODO: Добавить встроенный элемент с краткой информацией по файлу
-            # TODO: Добавить меню со второстепенными/неважными элементами, чтобы не переполнять меню
-            quick_action_list = QuickActionList(self._content_list_widget, media_file.name)
-            quick_action_list.set_title(media_file.info.filename)
-            quick_action_list.set_description(media_file.info.bit_rate_string)
-            quick_action_list.sig_snapshot_modified.connect(self.sig_snapshot_modified)
-
-            # Render registered QuickActions
-            for quick_action in QuickActionRegistry.values():
-                quick_action.set_snapshot_name(media_file.name)
-                quick_action_list.add_quick_action(quick_action)
-
-            # Render default QuickActions
-            delete_quick_action = DeleteQuickAction(self.plugin, enabled=True)
-            delete_quick_action.set_snapshot_name(media_file.name)
-            quick_action_list.add_quick_action(delete_quick_action)
+        self.content_list_model.add_media_files(media_files)
+        self.sig_table_items_added.emit(media_files)
+        self.get_tool_button(self.name, ToolBarItem.Clear).set_enabled(True)
 
-            widget_layout = QHBoxLayout()
-            widget_layout.add_stretch()
-            widget_layout.add_widget(quick_action_list)
+    # Batch methods
 
-            item = QListWidgetItem()
-            item.set_size_hint(quick_action_list.size_hint())
+    def begin_batch(self) -> None:
+        """
+        Collect rendered files and add them with a single insert on `end_batch`
+        """
+        self._batch_depth += 1
 
-            # A really nasty hack to get item `row` inside `QWidgetItem`
-            quick_action_list.set_list_widget(item)
+    def end_batch(self) -> None:
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth:
+            return
 
-            self._content_list_widget.add_item(item)
-            self._content_list_widget.set_item_widget(item, quick_action_list)
-            self._converter_item_widgets.append(quick_action_list)
-            self.sig_table_item_added.emit(media_file)
+        media_files, self._batch_media_files = self._batch_media_files, []
+        self.render_quick_actions(media_files)
 
-        self.get_tool_button(self.name, ToolBarItem.Clear).set_enabled(True)
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
@@ -16,5 +16,5 @@ class DeleteQuickAction(QuickAction, ThemeAccessorMixin):
     def get_icon(self) -> QIcon:
         return self.get_svg_icon(IconName.Delete, prop=ThemeProperties.ErrorColor)
 
-    def on_click(self) -> None:
-        SnapshotRegistry.remove(self.get_media_file_name())
+    def on_click(self, media_file_name: str) -> None:
+        SnapshotRegistry.remove(media_file_name)
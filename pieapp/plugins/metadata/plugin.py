@@ -1,27 +1,34 @@
 from __feature__ import snake_case
 
-import copy
+from pathlib import Path
 
 from PySide6.QtCore import Slot
+from PySide6.QtCore import QThreadPool
 
+from pieapp.api.globals import Global
 from pieapp.api.plugins import PiePlugin
+from pieapp.api.plugins.mixins import CoreAccessorsMixin
 from pieapp.api.plugins.helpers import get_plugin
 from pieapp.api.plugins.decorators import on_plugin_available
 from pieapp.api.registries.locales.helpers import translate
 from pieapp.api.registries.snapshots.registry import SnapshotRegistry
 
+from pieapp.api.models.scopes import Scope
 from pieapp.api.models.indexes import Index
 from pieapp.api.models.plugins import SysPlugin
-from pieapp.api.converter.models import update_media_file, MediaFile
+from pieapp.api.converter.models import update_media_file, replace_field, MediaFile
+from pieapp.api.converter.cache import AlbumCoverCache
+from pieapp.api.converter.workers import AlbumCoverWorker
 
 from metadata.widgets.quickaction import EditQuickAction
 from metadata.widgets.mainwidget import MetadataEditorWidget
 
 
-class MetadataEditorPlugin(PiePlugin):
+class MetadataEditorPlugin(PiePlugin, CoreAccessorsMixin):
     name = SysPlugin.MetadataEditor
     widget_class = MetadataEditorWidget
     requires = [SysPlugin.Converter, SysPlugin.MainToolBar]
+    lazy = True
 
     def get_title(self) -> str:
         return translate("Metadata editor")
@@ -36,12 +43,34 @@ class MetadataEditorPlugin(PiePlugin):
         widget.sig_table_item_changed.connect(self._on_table_item_changed)
         widget.sig_album_cover_changed.connect(self._on_album_cover_changed)
 
+        self._ffmpeg_command = Path(self.get_app_config("ffmpeg.ffmpeg", Scope.User, "ffmpeg"))
+        self._album_cover_cache = AlbumCoverCache(
+            cache_folder=Global.USER_ROOT / Global.CACHE_DIR_NAME / Global.ALBUM_COVERS_DIR_NAME,
+            max_size=self.get_app_config("ffmpeg.album_covers_cache_size", Scope.User, 64 * 1024 * 1024)
+        )
+
     def call(self, media_file_name: str) -> None:
         media_file = SnapshotRegistry.get(media_file_name)
         SnapshotRegistry.add_local_snapshot(media_file_name, media_file)
         self.get_widget().fill_metadata_table(media_file)
+        self.prepare_album_cover(media_file)
         self.get_widget().call()
 
+    def prepare_album_cover(self, media_file: MediaFile) -> None:
+        """
+        Extract the album cover thumbnail in background when the editor needs it
+        """
+        album_cover = media_file.metadata.album_cover
+        if album_cover is None or album_cover.stream_index is None:
+            return
+
+        if album_cover.image_small_path and Path(album_cover.image_small_path).exists():
+            return
+
+        album_cover_worker = AlbumCoverWorker(media_file, self._ffmpeg_command, self._album_cover_cache)
+        album_cover_worker.signals.completed.connect(self._on_album_cover_extracted)
+        QThreadPool.global_instance().start(album_cover_worker)
+
     @on_plugin_available(plugin=SysPlugin.Converter)
     def on_converter_available(self) -> None:
         converter = get_plugin(SysPlugin.Converter)
@@ -60,24 +89,45 @@ class MetadataEditorPlugin(PiePlugin):
         media_file, is_array_end = SnapshotRegistry.update_local_snapshot_index(media_file_name, +1)
         self.get_widget().on_redo(media_file, is_array_end)
 
+    @Slot(str, str)
+    def _on_album_cover_extracted(self, media_file_name: str, thumbnail_path: str) -> None:
+        # Thumbnail isn't an edit, so the current versions are replaced instead of adding new ones
+        media_file = SnapshotRegistry.get(media_file_name)
+        if media_file:
+            SnapshotRegistry.replace(media_file_name, self._set_album_cover_thumbnail(media_file, thumbnail_path))
+
+        local_snapshot = SnapshotRegistry.get_local_snapshot(media_file_name, Index.End)
+        if local_snapshot:
+            SnapshotRegistry.replace_local_snapshot(
+                media_file_name,
+                Index.End,
+                self._set_album_cover_thumbnail(local_snapshot, thumbnail_path)
+            )
+
+        self.get_widget().set_album_cover_preview(media_file_name, thumbnail_path)
+
+    @staticmethod
+    def _set_album_cover_thumbnail(media_file: MediaFile, thumbnail_path: str) -> MediaFile:
+        media_file = replace_field(media_file, "metadata.album_cover.image_small_path", Path(thumbnail_path))
+        return replace_field(media_file, "metadata.album_cover.image_small_file_format", AlbumCoverCache.file_format)
+
     @Slot(str, str, int)
     def _on_album_cover_changed(self, media_file_name: str, image_path: str, index: int) -> None:
-        media_file_copy = copy.deepcopy(SnapshotRegistry.get_local_snapshot(media_file_name, index))
         # TODO: Save different image sizes
-        media_file_copy = update_media_file(
-            media_file_copy,
+        media_file = update_media_file(
+            SnapshotRegistry.get_local_snapshot(media_file_name, index),
             "metadata.album_cover.image_path",
             image_path
         )
-        self.get_widget().change_tool_buttons_state(media_file_copy)
+        SnapshotRegistry.add_local_snapshot(media_file.name, media_file)
+        self.get_widget().change_tool_buttons_state()
 
     @Slot(str, str, str)
     def _on_table_item_changed(self, media_file_name: str, field: str, value: str) -> None:
-        media_file_name = media_file_name
-        media_file_copy = copy.deepcopy(SnapshotRegistry.get_local_snapshot(media_file_name, Index.End))
-        media_file_copy = update_media_file(media_file_copy, field, value)
-        if not SnapshotRegistry.contains_local(media_file_copy.name, media_file_copy):
-            SnapshotRegistry.add_local_snapshot(media_file_copy.name, media_file_copy)
+        # Only the changed models are copied, the rest are shared with the previous version
+        media_file = update_media_file(SnapshotRegistry.get_local_snapshot(media_file_name, Index.End), field, value)
+        if not SnapshotRegistry.contains_local(media_file.name, media_file):
+            SnapshotRegistry.add_local_snapshot(media_file.name, media_file)
             self.get_widget().change_tool_buttons_state()
 
     @Slot(str)
@@ -34,6 +34,7 @@ class AlbumCoverPicker(QLineEdit):
         parent: "QObject" = None,
         media_file_name: str = None,
         image_path: str = None,
+        preview_path: str = None,
         picker_icon: QIcon = None,
         placeholder_text: str = "No image selected",
         select_album_cover_text: str = "Select album cover image"
@@ -44,7 +45,7 @@ class AlbumCoverPicker(QLineEdit):
         self._image_path = image_path
         self._placeholder_text = f"<{placeholder_text}>"
         self._select_album_cover_text = select_album_cover_text
-        self._image_preview = ImagePreview(self, self._image_path)
+        self._image_preview = ImagePreview(self, self._image_path or preview_path)
 
         self._add_image_button = QLineEdit()
         self._add_image_action = QAction()
@@ -67,6 +68,17 @@ class AlbumCoverPicker(QLineEdit):
         """
         self._image_preview.hide_text()
 
+    @property
+    def media_file_name(self) -> str:
+        return self._media_file_name
+
+    def set_preview_image(self, preview_path: str) -> None:
+        """
+        Set the album cover thumbnail. Image selected by user always has a priority
+        """
+        if not self._image_path:
+            self._image_preview = ImagePreview(self, preview_path)
+
     def set_picker_icon(self, icon: QIcon) -> None:
         self._add_image_action.set_icon(icon)
 
@@ -45,6 +45,7 @@ class MetadataEditorWidget(PiePluginWidget, ThemeAccessorMixin, DialogWidgetMixi
         self.set_object_name("MetadataEditor")
         self.set_window_icon(self.get_svg_icon(IconName.App, self.name))
         self.resize(*Global.DEFAULT_WINDOW_SIZE)
+        self._album_cover_widget: AlbumCoverPicker = None
 
     def init_toolbar(self):
         main_grid_layout = QGridLayout()
@@ -137,7 +138,12 @@ class MetadataEditorWidget(PiePluginWidget, ThemeAccessorMixin, DialogWidgetMixi
         contributors_list_widget.add_items(media_file.metadata.additional_contributors)
 
         album_cover = media_file.metadata.album_cover
-        image_path = Path(album_cover.image_path).as_posix() if Path(album_cover.image_path).exists() else None
+        image_path = None
+        preview_path = None
+        if album_cover and album_cover.image_path and Path(album_cover.image_path).exists():
+            image_path = Path(album_cover.image_path).as_posix()
+        if album_cover and album_cover.image_small_path and Path(album_cover.image_small_path).exists():
+            preview_path = Path(album_cover.image_small_path).as_posix()
         picker_icon = self.get_svg_icon(
             key=IconName.FolderOpen,
             prop=ThemeProperties.AppIconColor
@@ -146,11 +152,13 @@ class MetadataEditorWidget(PiePluginWidget, ThemeAccessorMixin, DialogWidgetMixi
             parent=self,
             media_file_name=media_file.name,
             image_path=image_path,
+            preview_path=preview_path,
             picker_icon=picker_icon,
             placeholder_text=translate("No image selected"),
             select_album_cover_text=translate("Select album cover image")
         )
         album_cover_widget.sig_album_cover_changed.connect(self.album_cover_changed)
+        self._album_cover_widget = album_cover_widget
 
         self._table_widget.set_item(
             0, 1,
@@ -278,6 +286,13 @@ class MetadataEditorWidget(PiePluginWidget, ThemeAccessorMixin, DialogWidgetMixi
     def contributors_list_widget_changed(self, index: int) -> None:
         pass
 
+    def set_album_cover_preview(self, media_file_name: str, preview_path: str) -> None:
+        """
+        Show the album cover thumbnail once it's extracted
+        """
+        if self._album_cover_widget and self._album_cover_widget.media_file_name == media_file_name:
+            self._album_cover_widget.set_preview_image(preview_path)
+
     @Slot(str, str)
     def album_cover_changed(self, media_file_name: str, image_path: str) -> None:
         self.sig_album_cover_changed.emit(media_file_name, image_path, Index.End)
@@ -17,13 +17,13 @@ class EditQuickAction(QuickAction, ThemeAccessorMixin):
     def get_icon(self) -> QIcon:
         return self.get_svg_icon(IconName.App, self._plugin_name)
 
-    def on_click(self) -> None:
-        self.plugin_call_method(self.get_media_file_name())
+    def on_click(self, media_file_name: str) -> None:
+        self.plugin_call_method(media_file_name)
 
-    def get_enabled(self) -> tuple[bool, str]:
-        media_file = SnapshotRegistry.get(self._media_file_name)
+    def get_enabled(self, media_file_name: str) -> tuple[bool, str]:
+        media_file = SnapshotRegistry.get(media_file_name)
         if media_file is None:
-            return False, f"{translate('Cant find this snapshot')}: {self._media_file_name}"
+            return False, f"{translate('Cant find this snapshot')}: {media_file_name}"
 
         in_list = media_file.info.file_format.lower() in Global.METADATA_EDITOR_ALLOWED_FILE_FORMATS
         if in_list is False:
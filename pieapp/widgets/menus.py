@@ -54,17 +54,35 @@ class PieMenu(QMenu):
         icon: QIcon = None,
         before: str = None,
         after: str = None,
-        index: Union[int] = None
+        index: Union[int] = None,
+        plugin: str = None,
+        method: str = None,
+        deferred: bool = False
     ) -> QAction:
-        if name in self._items:
+        previous_item = self._items.get(name)
+        if previous_item is not None and not previous_item["deferred"]:
             raise PieError(f"Menu item {name} already registered")
 
         item = QAction(parent=self, text=text, icon=icon)
         if triggered:
             item.triggered.connect(triggered)
 
-        self._items[name] = {"item": item, "after": after, "before": before, "index": index}
-        self._keys.append(name)
+        self._items[name] = {
+            "item": item,
+            "text": text,
+            "after": after,
+            "before": before,
+            "index": index,
+            "plugin": plugin,
+            "method": method,
+            "deferred": deferred,
+        }
+        if previous_item is None:
+            self._keys.append(name)
+        elif previous_item["item"] in self.actions():
+            # The loaded plugin takes the place of its deferred item
+            self.insert_action(previous_item["item"], item)
+            self.remove_action(previous_item["item"])
 
         return item
 
@@ -100,6 +118,9 @@ class PieMenu(QMenu):
     def get_item(self, name: str) -> QAction:
         return self._items[name]["item"]
 
+    def get_items(self) -> dict[str, dict]:
+        return self._items
+
     @property
     def name(self) -> str:
         return self._name
@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pieapp.api.registries.configs.writer import ConfigWriter, get_write_deadline, write_file_atomic
+
+
+def test_config_writer_coalesces_writes(tmp_path: Path) -> None:
+    config_file = tmp_path / "configs" / "config.json"
+    writer = ConfigWriter(delay=60)
+    with mock.patch("pieapp.api.registries.configs.writer.write_file_atomic", wraps=write_file_atomic) as write:
+        data = {"theme": "dark theme", "count": 0}
+        for count in range(100):
+            data["count"] = count
+            writer.write(config_file, data)
+
+        # The data is serialized on the `write` call
+        data["count"] = -1
+        assert not config_file.exists()
+        assert writer.pending_files == [config_file]
+
+        writer.flush()
+        assert writer.pending_files == []
+        writer.close()
+
+    assert write.call_count == 1
+    assert json.loads(config_file.read_text()) == {"theme": "dark theme", "count": 99}
+    assert list(config_file.parent.iterdir()) == [config_file]
+
+
+def test_config_writer_debounce() -> None:
+    # Every write pushes the deadline back
+    assert get_write_deadline(100.0, 100.0, 0.5, 2.0) == 100.5
+    assert get_write_deadline(100.4, 100.0, 0.5, 2.0) == pytest.approx(100.9)
+
+    # Continuous writes are written after the maximum delay
+    assert get_write_deadline(101.9, 100.0, 0.5, 2.0) == 102.0
+    assert get_write_deadline(105.0, 100.0, 0.5, 2.0) == 102.0
+
+
+def test_config_writer_flush(tmp_path: Path) -> None:
+    errors = []
+    writer = ConfigWriter(delay=60, on_error=lambda file, e: errors.append(file))
+    writer.write(tmp_path / "config.json", {"locale": "en_US"})
+    writer.write(tmp_path / "config.json" / "workflow.json", {})
+    writer.flush()
+
+    assert json.loads((tmp_path / "config.json").read_text()) == {"locale": "en_US"}
+    assert errors == [tmp_path / "config.json" / "workflow.json"]
+
+    # Closed writer writes right away
+    writer.close()
+    writer.write(tmp_path / "ffmpeg.json", {"ffmpeg": "ffmpeg"})
+    assert json.loads((tmp_path / "ffmpeg.json").read_text()) == {"ffmpeg": "ffmpeg"}
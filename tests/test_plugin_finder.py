@@ -0,0 +1,42 @@
+import sys
+import importlib
+from pathlib import Path
+
+from pieapp.api.utils.modules import PluginFinder
+
+
+def create_plugin(folder: Path, name: str, value: str) -> None:
+    (folder / name / "widgets").mkdir(parents=True)
+    (folder / name / "__init__.py").write_text('version = "1.0.4"\n')
+    (folder / name / "widgets" / "__init__.py").write_text("")
+    (folder / name / "widgets" / "mainwidget.py").write_text(f"VALUE = {value!r}\nEXECUTED = []\n")
+    (folder / name / "plugin.py").write_text(
+        f"from {name}.widgets import mainwidget\n"
+        "mainwidget.EXECUTED.append(__name__)\n"
+    )
+
+
+def test_plugin_finder(tmp_path: Path) -> None:
+    create_plugin(tmp_path / "app", "finder_test_plugin", "app")
+    create_plugin(tmp_path / "user", "finder_test_plugin", "user")
+    (tmp_path / "app" / "no_sources").mkdir()
+
+    finder = PluginFinder()
+    finder.install()
+    try:
+        assert finder.add_folder(tmp_path / "app") == ["finder_test_plugin"]
+        assert finder.add_folder(tmp_path / "user") == ["finder_test_plugin"]
+
+        plugin_module = importlib.import_module("finder_test_plugin.plugin")
+        assert importlib.import_module("finder_test_plugin.plugin") is plugin_module
+        assert plugin_module.__name__ == "finder_test_plugin.plugin"
+        assert plugin_module.__cached__ is not None
+
+        # The user folder overrides the app one and the module is executed once
+        mainwidget = sys.modules["finder_test_plugin.widgets.mainwidget"]
+        assert mainwidget.VALUE == "user"
+        assert mainwidget.EXECUTED == ["finder_test_plugin.plugin"]
+    finally:
+        finder.uninstall()
+        for name in [i for i in sys.modules if i.startswith("finder_test_plugin")]:
+            del sys.modules[name]
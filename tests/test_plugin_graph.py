@@ -0,0 +1,41 @@
+import pytest
+
+from pieapp.api.utils.graph import DependencyCycleError, find_cycle, get_topological_waves
+
+
+def test_topological_waves() -> None:
+    requires = {
+        "metadata": ["converter", "main-toolbar-layout"],
+        "converter": ["status-bar", "layout"],
+        "main-toolbar-layout": ["maintoolbar-manager", "layout"],
+        "maintoolbar-manager": ["maintoolbar-manager"],
+        "status-bar": [],
+        "layout": ["unknown"],
+    }
+    assert get_topological_waves(requires) == [
+        ["maintoolbar-manager", "status-bar", "layout"],
+        ["converter", "main-toolbar-layout"],
+        ["metadata"],
+    ]
+
+
+def test_topological_waves_optional() -> None:
+    requires = {"preferences": ["main-menu-layout"], "main-menu-layout": [], "converter": []}
+    optional = {"converter": ["main-menu-layout"], "main-menu-layout": ["preferences"]}
+
+    # The optional dependency that closes the cycle is dropped
+    assert get_topological_waves(requires, optional) == [["main-menu-layout"], ["preferences", "converter"]]
+    assert get_topological_waves(requires, {"converter": ["preferences"]}) == [
+        ["main-menu-layout"],
+        ["preferences"],
+        ["converter"],
+    ]
+
+
+def test_topological_waves_cycle() -> None:
+    requires = {"a": ["b"], "b": ["c"], "c": ["a"], "d": []}
+    assert find_cycle({k: set(v) for (k, v) in requires.items()}) == ["a", "b", "c", "a"]
+    with pytest.raises(DependencyCycleError) as error:
+        get_topological_waves(requires)
+
+    assert error.value.cycle == ["a", "b", "c", "a"]
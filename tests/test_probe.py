@@ -0,0 +1,165 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+from pieapp.api.converter.probe import ProbeError, get_probe_builder
+
+
+def create_wave(
+    data_size: int,
+    sample_rate: int = 44100,
+    channels: int = 2,
+    bits_per_sample: int = 16,
+    info: dict[bytes, bytes] = None
+) -> bytes:
+    block_align = channels * bits_per_sample // 8
+    fmt_chunk = struct.pack(
+        "<HHIIHH", 1, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample
+    )
+    chunks = b"fmt " + struct.pack("<I", len(fmt_chunk)) + fmt_chunk
+    if info:
+        list_data = b"INFO" + b"".join(
+            k + struct.pack("<I", len(v) + 1) + v + b"\x00" + b"\x00" * ((len(v) + 1) & 1)
+            for (k, v) in info.items()
+        )
+        chunks += b"LIST" + struct.pack("<I", len(list_data)) + list_data
+
+    chunks += b"data" + struct.pack("<I", data_size) + b"\x00" * data_size
+    return b"RIFF" + struct.pack("<I", len(chunks) + 4) + b"WAVE" + chunks
+
+
+def create_vorbis_comment(comments: list[bytes]) -> bytes:
+    vendor = b"test"
+    data = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(comments))
+    return data + b"".join(struct.pack("<I", len(i)) + i for i in comments)
+
+
+def create_flac(samples_count: int, sample_rate: int = 48000, comments: list[bytes] = None) -> bytes:
+    packed = (sample_rate << 44) | ((2 - 1) << 41) | ((24 - 1) << 36) | samples_count
+    stream_info = b"\x00" * 10 + packed.to_bytes(8, "big")
+    vorbis_comment = create_vorbis_comment(comments or [])
+    return (
+        b"fLaC"
+        + bytes([0]) + len(stream_info).to_bytes(3, "big") + stream_info
+        + bytes([0x80 | 4]) + len(vorbis_comment).to_bytes(3, "big") + vorbis_comment
+        + b"\x00" * 100
+    )
+
+
+def create_mp3(frames_count: int, tags: dict[str, str] = None) -> bytes:
+    # MPEG 1 layer 3, 128 kbit/s, 44100 Hz, stereo: 417 bytes per frame
+    frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+    id3_frames = b"".join(
+        k.encode() + struct.pack(">I", len(v) + 1) + b"\x00\x00" + b"\x03" + v.encode()
+        for (k, v) in (tags or {}).items()
+    )
+    id3_size = bytes((len(id3_frames) >> (7 * i)) & 0x7F for i in (3, 2, 1, 0))
+    return b"ID3\x03\x00\x00" + id3_size + id3_frames + frame * frames_count
+
+
+def create_ogg_page(serial_number: int, sequence: int, granule_position: int, packets: list[bytes]) -> bytes:
+    segments = bytearray()
+    for packet in packets:
+        segments += b"\xff" * (len(packet) // 255) + bytes([len(packet) % 255])
+
+    header = struct.pack(
+        "<4sBBqIIIB", b"OggS", 0, 0, granule_position, serial_number, sequence, 0, len(segments)
+    )
+    return header + bytes(segments) + b"".join(packets)
+
+
+def create_vorbis(samples_count: int, sample_rate: int = 44100) -> bytes:
+    identification = b"\x01vorbis" + struct.pack("<IBIiiiBB", 0, 2, sample_rate, 0, 160000, 0, 0xB8, 1)
+    comment = b"\x03vorbis" + create_vorbis_comment([b"TITLE=Song", b"ALBUMARTIST=Band"]) + b"\x01"
+    return (
+        create_ogg_page(1, 0, 0, [identification])
+        + create_ogg_page(1, 1, 0, [comment])
+        + create_ogg_page(1, 2, samples_count, [b"\x00" * 300])
+    )
+
+
+def probe(tmp_path: Path, name: str, data: bytes) -> dict:
+    file = tmp_path / name
+    file.write_bytes(data)
+    return get_probe_builder(file).probe()
+
+
+def test_probe_wave(tmp_path: Path) -> None:
+    result = probe(tmp_path, "song.wav", create_wave(44100 * 4, info={b"INAM": b"Song", b"IART": b"Artist"}))
+    stream = result["streams"][0]
+    assert stream["codec_name"] == "pcm_s16le"
+    assert stream["channel_layout"] == "stereo"
+    assert stream["duration"] == "1.000000"
+    assert stream["duration_ts"] == 44100
+    assert stream["bit_rate"] == str(44100 * 32)
+    assert result["format"]["tags"] == {"title": "Song", "artist": "Artist"}
+
+
+def test_probe_empty_wave(tmp_path: Path) -> None:
+    result = probe(tmp_path, "empty.wav", create_wave(0))
+    assert result["format"]["duration"] == "0.000000"
+    assert result["format"]["bit_rate"] == "0"
+    assert result["streams"][0]["duration_ts"] == 0
+
+
+def test_probe_flac(tmp_path: Path) -> None:
+    result = probe(tmp_path, "song.flac", create_flac(96000, comments=[b"TITLE=Song", b"TRACKNUMBER=3"]))
+    stream = result["streams"][0]
+    assert stream["codec_name"] == "flac"
+    assert stream["sample_rate"] == "48000"
+    assert stream["bits_per_sample"] == 24
+    assert stream["duration"] == "2.000000"
+    assert result["format"]["tags"] == {"title": "Song", "track": "3"}
+
+    result = probe(tmp_path, "empty.flac", create_flac(0))
+    assert result["format"]["duration"] == "0.000000"
+    assert result["format"]["bit_rate"] == "0"
+
+
+def test_probe_mp3(tmp_path: Path) -> None:
+    result = probe(tmp_path, "song.mp3", create_mp3(10, {"TIT2": "Song", "TPE1": "Artist"}))
+    stream = result["streams"][0]
+    assert stream["codec_name"] == "mp3"
+    assert stream["sample_rate"] == "44100"
+    assert stream["bit_rate"] == "128000"
+    assert float(stream["duration"]) == pytest.approx(10 * 417 * 8 / 128000)
+    assert result["format"]["tags"] == {"title": "Song", "artist": "Artist"}
+
+    # The last frame of the truncated file is cut off, the duration is estimated by the file size
+    result = probe(tmp_path, "truncated.mp3", create_mp3(2)[:-200])
+    assert float(result["format"]["duration"]) == pytest.approx((2 * 417 - 200) * 8 / 128000)
+
+
+def test_probe_vorbis(tmp_path: Path) -> None:
+    result = probe(tmp_path, "song.ogg", create_vorbis(44100 * 3))
+    stream = result["streams"][0]
+    assert stream["codec_name"] == "vorbis"
+    assert stream["duration"] == "3.000000"
+    assert stream["bit_rate"] == "160000"
+    assert result["format"]["tags"] == {"title": "Song", "album_artist": "Band"}
+
+
+@pytest.mark.parametrize("name, data", [
+    ("song.wav", create_wave(1000)[:30]),
+    ("song.flac", create_flac(1000)[:20]),
+    ("song.mp3", create_mp3(3)[:12]),
+    ("song.ogg", create_vorbis(1000)[:40]),
+])
+def test_probe_truncated(tmp_path: Path, name: str, data: bytes) -> None:
+    with pytest.raises(ProbeError):
+        probe(tmp_path, name, data)
+
+
+@pytest.mark.parametrize("name", ["song.wav", "song.flac", "song.mp3", "song.ogg"])
+def test_probe_empty_file(tmp_path: Path, name: str) -> None:
+    with pytest.raises(ProbeError):
+        probe(tmp_path, name, b"")
+
+
+def test_probe_unsupported(tmp_path: Path) -> None:
+    assert get_probe_builder(tmp_path / "song.m4a") is None
+    with pytest.raises(ProbeError):
+        probe(tmp_path, "song.ogg", create_ogg_page(1, 0, 0, [b"OpusHead" + b"\x00" * 11]) * 2)
+    with pytest.raises(ProbeError):
+        probe(tmp_path, "song.wav", b"RIFF" + struct.pack("<I", 4) + b"AVI ")
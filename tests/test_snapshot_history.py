@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import pytest
+
+from pieapp.api.converter.models import MediaFile, Metadata, update_media_file
+from pieapp.api.registries.snapshots.history import SnapshotHistory, get_delta, get_size
+
+
+def create_versions(count: int, name: str = "song.wav") -> list[MediaFile]:
+    media_file = MediaFile("uuid", name, Path(name), Path("output"), metadata=Metadata(title="0"))
+    versions = [media_file]
+    for i in range(1, count):
+        versions.append(update_media_file(versions[-1], "metadata.title", str(i)))
+
+    return versions
+
+
+def test_snapshot_history_reconstruction() -> None:
+    versions = create_versions(10)
+    history = SnapshotHistory(keyframe_interval=4)
+    for version in versions:
+        assert history.append(version) == 0
+
+    # Every 4th version is a keyframe, the rest are deltas against the previous version
+    assert [i.is_keyframe for i in history._entries] == [True, False, False, False] * 2 + [True, False]
+    assert history._entries[1].value == {"metadata.title": "1", "generation": 1}
+    assert list(history) == versions
+    assert [history[i] for i in range(10)] == versions
+    assert history[-1] is versions[-1]
+    assert history[2:5] == versions[2:5]
+    with pytest.raises(IndexError):
+        history[10]
+
+    # Another media file always starts with a keyframe
+    other_version = create_versions(1, "other.wav")[0]
+    history.append(other_version)
+    assert history._entries[-1].is_keyframe
+    assert history[-1] is other_version
+
+
+def test_snapshot_history_is_last() -> None:
+    versions = create_versions(3)
+    history = SnapshotHistory()
+    assert not history.is_last(versions[0])
+
+    for version in versions:
+        history.append(version)
+
+    # Generation is bumped on every update, unchanged fields are compared only
+    assert history.is_last(update_media_file(versions[-1], "metadata.title", "2"))
+    assert not history.is_last(update_media_file(versions[-1], "metadata.title", "0"))
+
+
+def test_snapshot_history_evict_by_count() -> None:
+    versions = create_versions(10)
+    history = SnapshotHistory(max_count=4, keyframe_interval=8)
+    evicted = [history.append(i) for i in versions]
+
+    assert evicted == [0] * 4 + [1] * 6
+    assert len(history) == 4
+    assert list(history) == versions[-4:]
+    # The oldest remaining version becomes a keyframe
+    assert history._entries[0].is_keyframe
+    assert history.size == sum(i.size for i in history._entries)
+
+
+def test_snapshot_history_evict_by_size() -> None:
+    versions = create_versions(10)
+    first_size = get_size(versions[0])
+    delta_size = get_size(get_delta(versions[0], versions[1]))
+    history = SnapshotHistory(max_size=first_size + delta_size * 2, keyframe_interval=16)
+    for version in versions[:3]:
+        assert history.append(version) == 0
+
+    assert history.append(versions[3]) > 0
+    assert history.size <= first_size + delta_size * 2
+    assert list(history) == versions[4 - len(history):4]
+
+    # The last version is kept even if it's bigger than the limit
+    history = SnapshotHistory(max_size=1)
+    for version in versions:
+        history.append(version)
+
+    assert list(history) == versions[-1:]
+
+
+def test_snapshot_history_set_and_delete() -> None:
+    versions = create_versions(6)
+    history = SnapshotHistory(keyframe_interval=3)
+    for version in versions:
+        history.append(version)
+
+    replaced = update_media_file(versions[2], "metadata.genre", "jazz")
+    history[2] = replaced
+    assert list(history) == [*versions[:2], replaced, *versions[3:]]
+    assert history.size == sum(i.size for i in history._entries)
+    with pytest.raises(IndexError):
+        history[6] = replaced
+
+    del history[0]
+    assert list(history) == [versions[1], replaced, *versions[3:]]
+    assert history._entries[0].is_keyframe
+
+    del history[1:3]
+    assert list(history) == [versions[1], *versions[4:]]
+    assert history[-1] == versions[-1]
+
+    history.clear()
+    assert not history
+    assert history.size == 0
+
+
+def test_snapshot_history_replace_in_place() -> None:
+    versions = create_versions(8)
+    history = SnapshotHistory(keyframe_interval=4)
+    for version in versions:
+        history.append(version)
+
+    # Only the replaced delta and the delta after it are re-encoded
+    entries = list(history._entries)
+    replaced = update_media_file(versions[5], "metadata.genre", "jazz")
+    history[5] = replaced
+    assert [i is j for (i, j) in zip(history._entries, entries)] == [True] * 5 + [False, False, True]
+    assert list(history) == [*versions[:5], replaced, *versions[6:]]
+    assert history.size == sum(i.size for i in history._entries)
+
+    # Another media file is stored as a keyframe, so is the version after it
+    other_version = create_versions(1, "other.wav")[0]
+    history[2] = other_version
+    assert [i.is_keyframe for i in history._entries] == [True, False, True, True, True, False, False, False]
+    assert list(history) == [*versions[:2], other_version, *versions[3:5], replaced, *versions[6:]]
+
+    # The deleted entries are dropped, the version after them is re-encoded against the previous one
+    entries = list(history._entries)
+    del history[5:7]
+    assert [i is j for (i, j) in zip(history._entries, entries[:5])] == [True] * 5
+    assert list(history) == [*versions[:2], other_version, *versions[3:5], versions[7]]
+    assert not history._entries[-1].is_keyframe
+    assert history.size == sum(i.size for i in history._entries)
+
+    del history[::2]
+    assert list(history) == [versions[1], versions[3], versions[7]]
+    assert history._entries[0].is_keyframe
+    assert history.size == sum(i.size for i in history._entries)
+
+    # The tail is deleted, the new last version is appended against the remaining one
+    del history[-1]
+    history.append(versions[4])
+    assert list(history) == [versions[1], versions[3], versions[4]]
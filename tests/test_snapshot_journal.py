@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+
+from pieapp.api.converter.models import MediaFile, Metadata, update_media_file
+from pieapp.api.registries.snapshots.journal import JournalOperation, SnapshotJournal
+from pieapp.api.registries.snapshots.registry import SnapshotLimits, SnapshotRegistryClass
+
+
+def create_media_file(name: str) -> MediaFile:
+    return MediaFile(name, name, Path("folder") / name, Path("output"), metadata=Metadata(title=name))
+
+
+def create_registry(limits: SnapshotLimits = None) -> SnapshotRegistryClass:
+    # Limits are passed explicitly, so the registry doesn't read the config
+    registry = SnapshotRegistryClass()
+    registry.init(limits or SnapshotLimits())
+    return registry
+
+
+def get_state(registry: SnapshotRegistryClass) -> tuple:
+    return (
+        {name: list(snapshots) for (name, snapshots) in registry._inner_snapshots.items()},
+        registry._inner_snapshot_indexes,
+        list(registry._global_snapshots),
+        registry.get_global_snapshot_index(),
+    )
+
+
+def test_snapshot_journal_read_torn_record(tmp_path: Path) -> None:
+    journal = SnapshotJournal(tmp_path / "session.jsonl")
+    journal.open()
+    journal.write(JournalOperation.Add, media_file=create_media_file("a.wav"))
+    journal.write(JournalOperation.GlobalShift, shift=-1)
+    journal.close()
+
+    # The last record was partially written before the crash
+    with open(journal.journal_file, "a", encoding="utf-8") as file:
+        file.write('{"op":"remove","name":"a.w')
+
+    records = list(journal.read())
+    assert records == [
+        {"op": JournalOperation.Add, "media_file": create_media_file("a.wav")},
+        {"op": JournalOperation.GlobalShift, "shift": -1},
+    ]
+
+    journal.open()
+    assert journal.records_count == 3
+    journal.compact(records)
+    assert journal.records_count == 2
+    assert list(journal.read()) == records
+    assert [i.name for i in tmp_path.iterdir()] == ["session.jsonl"]
+    journal.close()
+
+
+def test_snapshot_journal_replay(tmp_path: Path) -> None:
+    journal_file = tmp_path / "session.jsonl"
+    registry = create_registry()
+    assert registry.open_journal(journal_file) == []
+
+    a, b, c = create_media_file("a.wav"), create_media_file("b.wav"), create_media_file("c.wav")
+    for media_file in (a, b, c):
+        registry.add(media_file)
+
+    a2 = update_media_file(a, "metadata.title", "a2")
+    registry.update(a.name, a2)
+    registry.remove(b.name)
+
+    # Global history: the edits are synced from the local snapshots, then the index is shifted back
+    a3 = update_media_file(a2, "metadata.genre", "jazz")
+    registry.add_global_snapshot(a2)
+    registry.add_local_snapshot(a.name, a3)
+    registry.sync_local_to_global(a.name)
+    registry.update_global_snapshot_index(1)
+    registry.update_global_snapshot_index(-1)
+    registry.sync_global_to_inner()
+    state = get_state(registry)
+
+    # The journal isn't closed, as if the application crashed
+    replayed_registry = create_registry()
+    media_files = replayed_registry.open_journal(journal_file)
+    assert [i.name for i in media_files] == ["a.wav", "c.wav"]
+    assert get_state(replayed_registry) == state
+    assert replayed_registry.inner_snapshots_keys == ["a.wav", "c.wav"]
+    assert replayed_registry.search("c.w") == {"c.wav"}
+
+    # The replayed journal is compacted into checkpoints
+    records = [json.loads(i) for i in journal_file.read_text(encoding="utf-8").splitlines()]
+    assert [i["op"] for i in records] == [
+        JournalOperation.Checkpoint, JournalOperation.Checkpoint, JournalOperation.GlobalCheckpoint
+    ]
+    replayed_registry.close_journal()
+    reopened_registry = create_registry()
+    reopened_registry.open_journal(journal_file)
+    assert get_state(reopened_registry) == state
+
+
+def test_snapshot_journal_replay_torn_record(tmp_path: Path) -> None:
+    journal_file = tmp_path / "session.jsonl"
+    registry = create_registry()
+    registry.open_journal(journal_file)
+    registry.add(create_media_file("a.wav"))
+    registry.update("a.wav", update_media_file(create_media_file("a.wav"), "metadata.title", "a2"))
+    state = get_state(registry)
+    registry.close_journal()
+
+    with open(journal_file, "a", encoding="utf-8") as file:
+        file.write('{"op":"add","media_file":{"$model":"MediaFile","fie')
+
+    replayed_registry = create_registry()
+    replayed_registry.open_journal(journal_file)
+    assert get_state(replayed_registry) == state
+
+    # The torn record is dropped by the compaction, so new records follow the valid ones
+    replayed_registry.add(create_media_file("b.wav"))
+    replayed_registry.close_journal()
+    assert all(json.loads(i) for i in journal_file.read_text(encoding="utf-8").splitlines())
+    assert create_registry().open_journal(journal_file) == replayed_registry.values()
+
+
+def test_snapshot_journal_compaction(tmp_path: Path) -> None:
+    journal_file = tmp_path / "session.jsonl"
+    limits = SnapshotLimits(journal_compact_size=8)
+    registry = create_registry(limits)
+    registry.open_journal(journal_file)
+    registry.add(create_media_file("a.wav"))
+    registry.add(create_media_file("b.wav"))
+
+    media_file = registry.get("a.wav")
+    for i in range(50):
+        media_file = update_media_file(media_file, "metadata.title", str(i))
+        registry.update("a.wav", media_file)
+
+        # Compacted journal has a checkpoint per file, the global checkpoint and the new records
+        assert registry._journal.records_count <= 8 + 1
+
+    state = get_state(registry)
+    records = [json.loads(i) for i in journal_file.read_text(encoding="utf-8").splitlines()]
+    assert [i["op"] for i in records[:3]] == [
+        JournalOperation.Checkpoint, JournalOperation.Checkpoint, JournalOperation.GlobalCheckpoint
+    ]
+
+    replayed_registry = create_registry(limits)
+    replayed_registry.open_journal(journal_file)
+    assert get_state(replayed_registry) == state
+    assert replayed_registry.values()[0].metadata.title == "49"
@@ -0,0 +1,47 @@
+import random
+import string
+
+from pieapp.api.registries.snapshots.search import SearchIndex
+
+
+def build_index(size: int) -> SearchIndex:
+    random.seed(0)
+    words = ["".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9))) for _ in range(2000)]
+    index = SearchIndex()
+    for i in range(size):
+        title = " ".join(random.choices(words, k=2))
+        index.update(f"folder/{i}.wav", f"{' '.join(random.choices(words, k=3))}.wav\n{title}".casefold())
+
+    return index
+
+
+def brute_force(index: SearchIndex, query: str) -> set[str]:
+    return {name for (name, text) in index._texts.items() if query in text}
+
+
+def test_snapshot_search_matches_brute_force() -> None:
+    index = build_index(2000)
+    for query in ["a", "ab", "wav", "folder", "zzzzzz", *random.sample(list(index._texts.values()), 20)]:
+        query = query.split("\n")[0][:6].strip()
+        assert index.search(query) == brute_force(index, query)
+
+    # Removed and updated names are reindexed
+    index.remove("folder/1.wav")
+    index.update("folder/2.wav", "new title")
+    assert "folder/1.wav" not in index.search("wav")
+    assert index.search("new tit") == {"folder/2.wav"}
+    assert "folder/2.wav" not in index.search("wav")
+
+
+def test_snapshot_search_narrowing() -> None:
+    index = build_index(2000)
+    query = next(iter(index._texts.values()))[:6]
+    previous_matches = None
+    # Every longer query narrows the previous matches down
+    for size in range(1, len(query) + 1):
+        matches = index.search(query[:size], previous_matches)
+        assert matches == brute_force(index, query[:size].strip())
+        assert previous_matches is None or matches <= previous_matches
+        previous_matches = matches
+
+    assert previous_matches
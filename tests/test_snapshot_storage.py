@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from pieapp.api.registries.snapshots.storage import SnapshotStorage
+
+
+def build_storage(size: int) -> SnapshotStorage:
+    storage = SnapshotStorage()
+    for i in range(size):
+        storage.add(f"folder/{i}.wav", [i])
+
+    return storage
+
+
+def test_snapshot_storage_order() -> None:
+    storage = build_storage(10)
+    storage.remove("folder/3.wav")
+    storage.remove("folder/0.wav")
+    storage.add("folder/new.wav", ["new"])
+
+    expected_keys = ["folder/1.wav", "folder/2.wav", "folder/4.wav", "folder/5.wav", "folder/6.wav",
+                     "folder/7.wav", "folder/8.wav", "folder/9.wav", "folder/new.wav"]
+    assert storage.keys() == expected_keys
+    assert [storage.index(i) for i in expected_keys] == list(range(len(expected_keys)))
+    assert [storage.key_at(i) for i in range(len(expected_keys))] == expected_keys
+    assert storage.key_at(-1) == "folder/new.wav"
+    assert "folder/3.wav" not in storage
+    assert storage["folder/new.wav"] == ["new"]
+
+    with pytest.raises(KeyError):
+        storage.add("folder/1.wav", [])
+    with pytest.raises(KeyError):
+        storage.index("folder/3.wav")
+    with pytest.raises(IndexError):
+        storage.key_at(len(expected_keys))
+
+
+def test_snapshot_storage_matches_list() -> None:
+    random.seed(0)
+    storage = SnapshotStorage()
+    keys: list[str] = []
+    for i in range(5000):
+        if keys and random.random() < 0.4:
+            key = keys.pop(random.randrange(len(keys)))
+            storage.remove(key)
+        else:
+            key = f"folder/{i}.wav"
+            keys.append(key)
+            storage.add(key, i)
+
+    assert storage.keys() == keys
+    for key in random.sample(keys, 200):
+        assert storage.index(key) == keys.index(key)
+        assert storage.key_at(keys.index(key)) == key
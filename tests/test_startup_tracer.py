@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+from pieapp.api.utils.tracer import TracerClass, get_trace_file
+
+
+def test_get_trace_file() -> None:
+    assert get_trace_file(["pie-audio.py"], {}) is None
+    assert get_trace_file(["pie-audio.py"], {"PIE_TRACE_STARTUP": "0"}) is None
+    assert get_trace_file(["pie-audio.py"], {"PIE_TRACE_STARTUP": "1"}) == ""
+    assert get_trace_file(["pie-audio.py"], {"PIE_TRACE_STARTUP": "trace.json"}) == "trace.json"
+    assert get_trace_file(["pie-audio.py", "--trace-startup"], {}) == ""
+    assert get_trace_file(["pie-audio.py", "--trace-startup=trace.json"], {}) == "trace.json"
+
+
+def test_tracer(tmp_path: Path) -> None:
+    tracer = TracerClass()
+    with tracer.span("Disabled"):
+        pass
+    assert tracer.get_events() == []
+
+    tracer.enable()
+    with tracer.span("Initialize plugins", "phase"):
+        with tracer.span("converter: prepare", "plugin"):
+            sum(range(10_000))
+        with tracer.span("metadata: prepare", "plugin"):
+            pass
+
+    events = tracer.get_events()
+    assert [i["name"] for i in events] == ["Initialize plugins", "converter: prepare", "metadata: prepare"]
+    assert [i["args"]["depth"] for i in events] == [0, 1, 1]
+    assert events[0]["dur"] >= events[1]["dur"] + events[2]["dur"]
+    assert "    converter: prepare" in tracer.get_summary()
+
+    tracer.write(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert {i["ph"] for i in trace["traceEvents"]} == {"X"}
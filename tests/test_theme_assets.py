@@ -0,0 +1,64 @@
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+from pieapp.api.registries.themes.assets import AssetManifest
+
+
+def backdate(folder: Path, seconds: float = 3600) -> None:
+    """
+    Move the modification times of the directories out of the racy interval
+    """
+    mtime = time.time() - seconds
+    for directory in [folder, *(i for i in folder.rglob("*") if i.is_dir())]:
+        os.utime(directory, (mtime, mtime))
+
+
+def test_asset_manifest(tmp_path: Path) -> None:
+    folder = tmp_path / "assets"
+    (folder / "icons" / "nested").mkdir(parents=True)
+    (folder / "icons" / "app.svg").touch()
+    (folder / "icons" / "nested" / "logo.png").touch()
+    (folder / "icons" / "readme.txt").touch()
+    (folder / "icons" / "folder.svg").mkdir()
+    backdate(folder)
+
+    cache_file = tmp_path / "cache" / "assets.json"
+    manifest = AssetManifest(cache_file, [".svg", ".png"])
+    assert manifest.get_files(folder) == [folder / "icons/app.svg", folder / "icons/nested/logo.png"]
+
+    # The cached manifest is used until a directory changes
+    manifest = AssetManifest(cache_file, [".svg", ".png"])
+    (folder / "icons" / "nested" / "logo.png").write_text("updated")
+    with mock.patch.object(AssetManifest, "scan", wraps=manifest.scan) as scan:
+        assert manifest.get_files(folder) == [folder / "icons/app.svg", folder / "icons/nested/logo.png"]
+        assert scan.call_count == 0
+
+        (folder / "icons" / "nested" / "logo.png").unlink()
+        (folder / "icons" / "nested" / "close.svg").touch()
+        assert manifest.get_files(folder) == [folder / "icons/app.svg", folder / "icons/nested/close.svg"]
+        assert scan.call_count == 1
+
+    assert manifest.get_files(tmp_path / "missing") == []
+    (tmp_path / "missing").mkdir()
+    (tmp_path / "missing" / "app.svg").touch()
+    assert manifest.get_files(tmp_path / "missing") == [tmp_path / "missing" / "app.svg"]
+
+
+def test_asset_manifest_racy_mtime(tmp_path: Path) -> None:
+    folder = tmp_path / "assets"
+    folder.mkdir()
+    (folder / "app.svg").touch()
+
+    manifest = AssetManifest(tmp_path / "assets.json", [".svg"])
+    with mock.patch.object(AssetManifest, "scan", wraps=manifest.scan) as scan:
+        # The folder was just modified, so another change in the same mtime tick could be missed
+        assert manifest.get_files(folder) == [folder / "app.svg"]
+        assert manifest.get_files(folder) == [folder / "app.svg"]
+        assert scan.call_count == 2
+
+        backdate(folder)
+        assert manifest.get_files(folder) == [folder / "app.svg"]
+        assert manifest.get_files(folder) == [folder / "app.svg"]
+        assert scan.call_count == 3
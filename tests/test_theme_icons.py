@@ -0,0 +1,33 @@
+from pieapp.api.registries.themes.iconcache import IconCache
+
+
+def test_icon_cache_eviction_order() -> None:
+    cache = IconCache(max_size=3)
+    for key in ("app", "delete", "edit"):
+        cache.put(key, f"{key}.svg")
+
+    # Recently used icons are kept, the least recently used one is evicted
+    assert cache.get("app") == "app.svg"
+    cache.put("close", "close.svg")
+    assert len(cache) == 3
+    assert cache.get("delete") is None
+    assert [cache.get(i) for i in ("app", "edit", "close")] == ["app.svg", "edit.svg", "close.svg"]
+
+    # Updating an icon marks it as recently used too
+    cache.put("app", "app-dark.svg")
+    cache.put("open", "open.svg")
+    assert cache.get("edit") is None
+    assert cache.get("app") == "app-dark.svg"
+    assert cache.get("missing", "default.svg") == "default.svg"
+
+
+def test_icon_cache_clear() -> None:
+    cache = IconCache(max_size=0)
+    cache.put(("dark theme", "app", "close", "#fff", 14, None), "close.svg")
+    cache.put(("dark theme", "app", "close", "#fff", 14, "fallback.svg"), "fallback.svg")
+    # The cache keeps one icon at least
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(("dark theme", "app", "close", "#fff", 14, "fallback.svg")) is None
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from pieapp.api.registries.themes.stylesheet import StyleSheetCompiler, compile_style_sheet
+
+
+def test_compile_style_sheet() -> None:
+    props = {"mainFontColor": "#ccc", "mainFontColorFocused": "#fff", "THEME_ROOT": "/themes/dark", "size": 35}
+    templates = [
+        "QLabel { color: @mainFontColor; }",
+        "QLabel:focus { color: @mainFontColorFocused; image: url(@THEME_ROOT/icons/app.svg); }",
+        "QPushButton { min-height: @size; border: @unknownProp; }",
+    ]
+    assert compile_style_sheet(templates, props) == "\n".join([
+        "QLabel { color: #ccc; }",
+        "QLabel:focus { color: #fff; image: url(/themes/dark/icons/app.svg); }",
+        "QPushButton { min-height: 35; border: @unknownProp; }",
+    ])
+
+
+def test_style_sheet_compiler_cache(tmp_path: Path) -> None:
+    template_file = tmp_path / "theme.qss"
+    template_file.write_text("QLabel { color: @color; }")
+    compiler = StyleSheetCompiler(tmp_path / "cache" / "theme.json")
+
+    assert compiler.compile([template_file], {"color": "red"}) == "QLabel { color: red; }"
+    key = compiler.get_key([template_file], {"color": "red"})
+    assert compiler.load(key) == "QLabel { color: red; }"
+
+    # Changed properties and templates invalidate the cache
+    assert compiler.compile([template_file], {"color": "blue"}) == "QLabel { color: blue; }"
+    template_file.write_text("QLabel { background: @color; }")
+    assert compiler.load(compiler.get_key([template_file], {"color": "blue"})) is None
+    assert compiler.compile([template_file], {"color": "blue"}) == "QLabel { background: blue; }"